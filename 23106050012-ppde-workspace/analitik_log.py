@@ -0,0 +1,208 @@
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+
+from log_biodata import LOG_FILE
+
+STATE_FILE = "analitik_log.json"
+
+# Baris log format teks: "2025-09-15 08:11:51 - INFO - pesan"
+POLA_BARIS = re.compile(r"^(\d{4}-\d\d-\d\d \d\d):\d\d:\d\d - (\w+) - (.*)$")
+
+# Event yang dicatat aplikasi biodata: (metrik, pola pesan dengan grup username)
+POLA_EVENT = [
+    ("login", re.compile(r"^Login attempt for username: (.*)$")),
+    ("login_gagal", re.compile(r"^Failed login attempt for username: (.*)$")),
+    ("login_tidak_valid", re.compile(r"^(?:Empty credentials attempt for username|Username too short): (.*)$")),
+    ("login_berhasil", re.compile(r"^Successful login for user: (.*)$")),
+    ("submit", re.compile(r"^Data submitted by user: (.*) - NIM: .*$")),
+    ("error_submit", re.compile(r"^Error in submit_data by (.*?): .*$")),
+]
+
+# Panjang kunci bucket waktu untuk tiap granularitas ("YYYY-MM-DD HH")
+PANJANG_BUCKET = {"jam": 13, "hari": 10, "bulan": 7}
+
+
+def _tanda_file(baris_pertama):
+    """Tanda pengenal segmen log dari baris pertamanya (tetap sama setelah rotasi)"""
+    return hashlib.sha1(baris_pertama).hexdigest() if baris_pertama else None
+
+
+def _buka(path):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _baris_pertama(path):
+    with _buka(path) as file:
+        baris = file.readline()
+    return baris if baris.endswith(b"\n") else None
+
+
+class AnalitikLog:
+    """Agregat event log aplikasi yang diperbarui secara inkremental (hanya baris baru)"""
+
+    def __init__(self, log_file=LOG_FILE, state_file=STATE_FILE):
+        self.log_file = log_file
+        self.state_file = state_file
+
+        # agregat[bucket jam][metrik][username] = jumlah
+        self.agregat = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+        self.segmen_selesai = set()
+        self.aktif = {"tanda": None, "offset": 0}
+        self._muat_state()
+
+    def _muat_state(self):
+        if not os.path.exists(self.state_file):
+            return
+        with open(self.state_file, "r", encoding="utf-8") as file:
+            state = json.load(file)
+        self.segmen_selesai = set(state["segmen_selesai"])
+        self.aktif = state["aktif"]
+        for bucket, metrik in state["agregat"].items():
+            for nama_metrik, per_user in metrik.items():
+                self.agregat[bucket][nama_metrik].update(per_user)
+
+    def simpan_state(self):
+        """Simpan offset dan agregat (ditulis ke file sementara lalu diganti)"""
+        state = {
+            "segmen_selesai": sorted(self.segmen_selesai),
+            "aktif": self.aktif,
+            "agregat": self.agregat,
+        }
+        path_sementara = self.state_file + ".tmp"
+        with open(path_sementara, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(path_sementara, self.state_file)
+
+    def _proses_baris(self, baris):
+        """Parse satu baris log (teks atau JSON lines) dan perbarui agregat"""
+        baris = baris.decode("utf-8", errors="replace").rstrip("\r\n")
+        if baris.startswith("{"):
+            try:
+                data = json.loads(baris)
+                bucket, pesan = data["waktu"][:13], data["pesan"]
+            except (ValueError, KeyError, TypeError):
+                return
+        else:
+            cocok = POLA_BARIS.match(baris)
+            if not cocok:
+                return
+            bucket, _, pesan = cocok.groups()
+
+        for metrik, pola in POLA_EVENT:
+            cocok = pola.match(pesan)
+            if cocok:
+                self.agregat[bucket][metrik][cocok.group(1)] += 1
+                return
+
+    def _proses_file(self, path, offset=0):
+        """Proses baris lengkap mulai dari offset, mengembalikan offset baru"""
+        with _buka(path) as file:
+            file.seek(offset)
+            for baris in file:
+                # Baris terakhir yang belum lengkap diproses di run berikutnya
+                if not baris.endswith(b"\n"):
+                    break
+                self._proses_baris(baris)
+                offset += len(baris)
+        return offset
+
+    def perbarui(self):
+        """Proses segmen rotasi yang belum pernah dibaca lalu baris baru di log aktif"""
+        jumlah_file = 0
+
+        # Segmen hasil rotasi (.1.gz, .2.gz, ...) tidak berubah lagi setelah dibuat
+        for path in sorted(glob.glob(glob.escape(self.log_file) + ".*.gz"), reverse=True):
+            tanda = _tanda_file(_baris_pertama(path))
+            if tanda is None or tanda in self.segmen_selesai:
+                continue
+            # Segmen ini dulunya log aktif yang sudah dibaca sebagian
+            offset = self.aktif["offset"] if tanda == self.aktif["tanda"] else 0
+            self._proses_file(path, offset)
+            self.segmen_selesai.add(tanda)
+            if tanda == self.aktif["tanda"]:
+                self.aktif = {"tanda": None, "offset": 0}
+            jumlah_file += 1
+
+        if os.path.exists(self.log_file):
+            tanda = _tanda_file(_baris_pertama(self.log_file))
+            if tanda is not None:
+                if tanda == self.aktif["tanda"]:
+                    offset = self.aktif["offset"]
+                elif tanda in self.segmen_selesai:
+                    offset = None
+                else:
+                    offset = 0
+                if offset is not None and os.path.getsize(self.log_file) > offset:
+                    self.aktif = {"tanda": tanda, "offset": self._proses_file(self.log_file, offset)}
+                    jumlah_file += 1
+
+        self.simpan_state()
+        return jumlah_file
+
+    def query(self, granularitas="jam", dari=None, sampai=None):
+        """Total per metrik untuk tiap bucket waktu (jam/hari/bulan)"""
+        panjang = PANJANG_BUCKET[granularitas]
+        hasil = defaultdict(lambda: defaultdict(int))
+        for bucket, metrik in self.agregat.items():
+            if (dari and bucket < dari) or (sampai and bucket[:len(sampai)] > sampai):
+                continue
+            for nama_metrik, per_user in metrik.items():
+                hasil[bucket[:panjang]][nama_metrik] += sum(per_user.values())
+        return dict(sorted(hasil.items()))
+
+    def per_user(self, metrik, dari=None, sampai=None):
+        """Total satu metrik per username, terurut dari yang terbanyak"""
+        hasil = defaultdict(int)
+        for bucket, data in self.agregat.items():
+            if (dari and bucket < dari) or (sampai and bucket[:len(sampai)] > sampai):
+                continue
+            for user, jumlah in data.get(metrik, {}).items():
+                hasil[user] += jumlah
+        return sorted(hasil.items(), key=lambda item: -item[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analitik inkremental untuk log aplikasi biodata")
+    parser.add_argument("--log", default=LOG_FILE)
+    parser.add_argument("--state", default=STATE_FILE)
+    parser.add_argument("--bucket", choices=list(PANJANG_BUCKET), default="hari")
+    parser.add_argument("--dari", help="Awal rentang, misal 2025-09-01")
+    parser.add_argument("--sampai", help="Akhir rentang (inklusif), misal 2025-09-30")
+    parser.add_argument("--json", action="store_true", help="Cetak hasil dalam format JSON")
+    args = parser.parse_args(argv)
+
+    analitik = AnalitikLog(args.log, args.state)
+    analitik.perbarui()
+
+    hasil = {
+        "per_bucket": analitik.query(args.bucket, args.dari, args.sampai),
+        "login_gagal_per_user": analitik.per_user("login_gagal", args.dari, args.sampai),
+        "submit_per_user": analitik.per_user("submit", args.dari, args.sampai),
+    }
+    if args.json:
+        print(json.dumps(hasil, indent=2))
+        return 0
+
+    metrik = [nama for nama, _ in POLA_EVENT]
+    print(f"{'Bucket':<14}" + "".join(f"{nama:>18}" for nama in metrik))
+    for bucket, data in hasil["per_bucket"].items():
+        print(f"{bucket:<14}" + "".join(f"{data.get(nama, 0):>18}" for nama in metrik))
+
+    print("\nLogin gagal per username:")
+    for user, jumlah in hasil["login_gagal_per_user"]:
+        print(f"  {user}: {jumlah}")
+    print("\nSubmit per user:")
+    for user, jumlah in hasil["submit_per_user"]:
+        print(f"  {user}: {jumlah}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import logging
+import queue
+import threading
+import time
+
+from penyimpanan_biodata import PenyimpananBiodata, NIMSudahAda, DB_FILE
+
+# Penanda untuk menghentikan thread penulis
+_BERHENTI = object()
+
+# Paling lama menunggu antrian tersimpan saat logout/keluar (detik)
+BATAS_TUNGGU = 30.0
+
+
+class _Batch:
+    """Beberapa record yang harus tersimpan dalam transaksi yang sama"""
+
+    __slots__ = ("items", "callback")
+
+    def __init__(self, items, callback):
+        self.items = items
+        self.callback = callback
+
+
+class AntrianPenulis:
+    """Thread penulis latar belakang dengan antrian terbatas dan group commit"""
+
+    def __init__(self, path=DB_FILE, ukuran_antrian=1000, ukuran_batch=200):
+        self.path = path
+        self.ukuran_batch = ukuran_batch
+
+        # Antrian record yang menunggu ditulis dan antrian hasil untuk thread UI
+        self.antrian = queue.Queue(maxsize=ukuran_antrian)
+        self.hasil = queue.Queue()
+        # Kesalahan saat membuka database; semua record lalu digagalkan dengan kesalahan ini
+        self.error = None
+
+        self.thread = threading.Thread(target=self._loop_penulis, daemon=True)
+        self.thread.start()
+
+    def kirim(self, record, diinput_oleh=None, callback=None):
+        """Masukkan record ke antrian tanpa menunggu (raise queue.Full jika antrian penuh)
+
+        callback(id_record, error) dipanggil dari thread UI lewat proses_hasil()
+        setelah record benar-benar tersimpan (atau gagal disimpan; NIMSudahAda jika
+        NIM-nya ternyata sudah tersimpan, misalnya oleh proses lain).
+        """
+        self.antrian.put_nowait((record, diinput_oleh, callback))
+
+    def kirim_batch(self, items, callback=None):
+        """Masukkan daftar (record, diinput_oleh) yang disimpan dalam satu transaksi
+
+        callback(daftar_id, error) dipanggil dari thread UI lewat proses_hasil(); jika
+        gagal (termasuk NIMSudahAda), tidak ada satu pun record dari batch ini yang tersimpan.
+        """
+        self.antrian.put_nowait(_Batch(list(items), callback))
+
+    @staticmethod
+    def _callback(item):
+        return item.callback if isinstance(item, _Batch) else item[2]
+
+    def _loop_gagal(self):
+        """Database tidak bisa dibuka: laporkan kegagalan setiap record lewat callback-nya"""
+        while True:
+            item = self.antrian.get()
+            if item is not _BERHENTI:
+                self.hasil.put((self._callback(item), None, self.error))
+            self.antrian.task_done()
+            if item is _BERHENTI:
+                break
+
+    def _loop_penulis(self):
+        """Loop thread penulis: ambil record yang menunggu lalu commit sekaligus"""
+        try:
+            # Koneksi SQLite harus dibuat di thread yang memakainya
+            penyimpanan = PenyimpananBiodata(self.path)
+        except Exception as e:
+            logging.error(f"Writer thread could not open database {self.path}: {e}")
+            self.error = e
+            self._loop_gagal()
+            return
+        try:
+            while True:
+                item = self.antrian.get()
+                if item is _BERHENTI:
+                    self.antrian.task_done()
+                    break
+
+                # Kumpulkan record lain yang sudah menunggu agar ditulis dalam satu commit
+                batch = [item]
+                berhenti = False
+                while len(batch) < self.ukuran_batch:
+                    try:
+                        item = self.antrian.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _BERHENTI:
+                        berhenti = True
+                        break
+                    batch.append(item)
+
+                # Satu kelompok per kirim()/kirim_batch(): NIM yang sudah ada (dicek di dalam
+                # transaksi, juga terhadap proses lain) hanya menggagalkan kelompoknya sendiri
+                kelompok = [item.items if isinstance(item, _Batch) else [item[:2]] for item in batch]
+                try:
+                    for item, hasil in zip(batch, penyimpanan.simpan_kelompok(kelompok)):
+                        tunggal = not isinstance(item, _Batch)
+                        callback = item[2] if tunggal else item.callback
+                        if isinstance(hasil, NIMSudahAda):
+                            self.hasil.put((callback, None, hasil))
+                        else:
+                            self.hasil.put((callback, hasil[0] if tunggal else hasil, None))
+                except Exception as e:
+                    for item in batch:
+                        self.hasil.put((self._callback(item), None, e))
+
+                for _ in range(len(batch) + berhenti):
+                    self.antrian.task_done()
+                if berhenti:
+                    break
+        finally:
+            penyimpanan.tutup()
+
+    def proses_hasil(self):
+        """Jalankan callback untuk record yang sudah selesai ditulis (panggil dari thread UI)"""
+        while True:
+            try:
+                callback, id_record, error = self.hasil.get_nowait()
+            except queue.Empty:
+                break
+            if callback is not None:
+                callback(id_record, error)
+
+    def _tunggu_antrian(self, timeout):
+        """Seperti antrian.join() tetapi paling lama timeout detik; True jika antrian habis"""
+        akhir = time.monotonic() + timeout
+        with self.antrian.all_tasks_done:
+            while self.antrian.unfinished_tasks:
+                sisa = akhir - time.monotonic()
+                if sisa <= 0 or not self.thread.is_alive():
+                    return False
+                self.antrian.all_tasks_done.wait(min(sisa, 0.5))
+        return True
+
+    def kosongkan(self, timeout=BATAS_TUNGGU):
+        """Tunggu sampai semua record di antrian tersimpan, lalu jalankan callback-nya
+
+        Mengembalikan False jika masih ada record yang belum tersimpan setelah timeout detik.
+        """
+        selesai = self._tunggu_antrian(timeout)
+        self.proses_hasil()
+        return selesai
+
+    def hentikan(self, timeout=BATAS_TUNGGU):
+        """Kosongkan antrian lalu hentikan thread penulis (False jika tidak selesai dalam timeout detik)"""
+        akhir = time.monotonic() + timeout
+        if self.thread.is_alive():
+            try:
+                self.antrian.put(_BERHENTI, timeout=timeout)
+            except queue.Full:
+                pass
+            self.thread.join(max(0, akhir - time.monotonic()))
+        self.proses_hasil()
+        return not self.thread.is_alive()
@@ -1,28 +1,46 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import datetime
 import logging
-import csv
 import os
-import re
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from antrian_penulis import AntrianPenulis
+from browser_biodata import BrowserBiodata
+from duplikat_biodata import PemeriksaDuplikat
+from foto_biodata import path_thumbnail, proses_foto
+from grid_biodata import GridBiodata
+from indeks_nim import IndeksNIM
+from kredensial import PenyimpananKredensial, PembatasLogin
+from log_biodata import INTERVAL_ROTASI, setup_logging
+from migrasi_csv import impor_csv
+from panel_statistik import PanelStatistik
+from pemantau_biodata import PemantauBiodata
+from pelengkap_otomatis import KamusIsian, PelengkapOtomatis
+from penyimpanan_biodata import PenyimpananBiodata, NIMSudahAda, CSV_FILE, DB_FILE
+import validasi_biodata
+from validasi_biodata import validasi_record
 
 # File untuk menyimpan username terakhir
 USER_FILE = "last_user.txt"
 
-# Setup logging
-logging.basicConfig(
-    filename='aplikasi_biodata.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+# Setup logging: ditulis thread listener lewat antrian, file dirotasi (per ukuran dan harian)
+# dan dikompres (set BIODATA_LOG_JSON=1 untuk format JSON lines)
+setup_logging(interval_detik=INTERVAL_ROTASI, format_json=os.environ.get("BIODATA_LOG_JSON") == "1")
 
 # Membuat kelas utama aplikasi yang mewarisi dari tk.Tk
 class AplikasiBiodata(tk.Tk):
     # Metode __init__ adalah constructor yang akan dijalankan saat objek dibuat
     def __init__(self):
+        # Catat waktu mulai untuk laporan waktu startup
+        self._waktu_mulai = time.perf_counter()
+        self.waktu_startup = {}
+
         # Memanggil constructor dari kelas induk (tk.Tk)
         super().__init__()
+        self._catat_waktu("tk")
 
         # Mengkonfigurasi window utama
         self.title("Aplikasi Biodata Mahasiswa")
@@ -30,29 +48,110 @@ class AplikasiBiodata(tk.Tk):
         self.resizable(True, True)
         self.configure(bg="floralwhite")
 
-        # Database user sederhana (dalam aplikasi nyata, ini akan di database)
-        self.users_db = {
-            "admin": "admin123",
-            "arbath": "23106050012",
-        }
+        # Kredensial user ter-hash; verifikasi (PBKDF2, lambat) berjalan di thread worker
+        self.kredensial = PenyimpananKredensial()
+        self._verifikator = ThreadPoolExecutor(max_workers=1)
+
+        # Worker untuk decode dan memperkecil foto
+        self._pekerja_foto = ThreadPoolExecutor(max_workers=1)
+        self._login_berjalan = None
+
+        # Backoff login per username, dihitung dari event login gagal di log
+        self.pembatas_login = PembatasLogin()
+        logging.getLogger().addHandler(self.pembatas_login)
+
+        # Penyimpanan, indeks dan thread latar belakang disiapkan setelah halaman login tampil
+        # (lihat _siapkan_penyimpanan), jadi tidak menunda munculnya window
+        self.penyimpanan = None
+        # Daftar record (form: satu, grid: semua baris) yang sedang diperiksa, None jika tidak ada
+        # (atau dibatalkan saat logout/keluar)
+        self._duplikat_berjalan = None
 
         # Status login
         self.current_user = None
 
-        # Atribut untuk manajemen frame
+        # Atribut untuk manajemen frame: frame dibuat saat pertama kali dibuka
         self.frame_aktif = None
-
-        # Buat tampilan
-        self._buat_tampilan_login()
-        self._buat_tampilan_biodata()
+        self.nama_frame_aktif = None
+        self.frames = {}
+        self._pembuat_frame = {
+            "login": self._buat_tampilan_login,
+            "biodata": self._buat_tampilan_biodata,
+            "browser": self._buat_tampilan_browser,
+            "statistik": self._buat_tampilan_statistik,
+            "grid": self._buat_tampilan_grid,
+        }
 
         # Tampilkan frame login di awal
-        self._pindah_ke(self.frame_login)
+        self._pindah_ke("login")
+        self._catat_waktu("frame_login")
+        self.frame_login.bind("<Map>", self._laporan_startup)
 
         # Log aplikasi start
         logging.info("Aplikasi dimulai")
         self.bind("<Escape>", lambda e: self._buat_menu())
 
+        # Pastikan antrian penulis dikosongkan saat window ditutup
+        self.protocol("WM_DELETE_WINDOW", self._keluar_aplikasi)
+
+    def _catat_waktu(self, tahap):
+        """Catat waktu (ms sejak __init__ dimulai) untuk satu tahap startup"""
+        self.waktu_startup[tahap] = (time.perf_counter() - self._waktu_mulai) * 1000
+
+    def _laporan_startup(self, event=None):
+        """Laporkan waktu sampai halaman login tampil (sekali saja), lalu siapkan penyimpanan"""
+        self.frame_login.unbind("<Map>")
+        self._catat_waktu("login_tampil")
+        rincian = ", ".join(f"{tahap}: {ms:.0f} ms" for tahap, ms in self.waktu_startup.items())
+        logging.info(f"Startup time to login screen: {self.waktu_startup['login_tampil']:.0f} ms ({rincian})")
+        # Jalan setelah login tampil dan event yang menunggu diproses; pengguna mengetik kredensial
+        # sementara database dibuka
+        self.after_idle(self._siapkan_penyimpanan)
+
+    def _siapkan_penyimpanan(self):
+        """Buka database, impor CSV lama dan mulai indeks/thread latar belakang (sekali saja)
+
+        Dipanggil setelah halaman login tampil, atau lebih awal jika tampilan lain
+        dibuka sebelum itu. Waktu tiap tahap dicatat di waktu_startup.
+        """
+        if self.penyimpanan is not None:
+            return
+        tahap_awal = len(self.waktu_startup)
+
+        # Penyimpanan biodata (SQLite dengan indeks NIM, jurusan dan email)
+        self.penyimpanan = PenyimpananBiodata()
+        self._catat_waktu("penyimpanan")
+        if self.penyimpanan.baru and os.path.exists(CSV_FILE):
+            # Pindahkan isi CSV lama (skema lama dimigrasi otomatis)
+            jumlah = impor_csv(self.penyimpanan, CSV_FILE)
+            logging.info(f"Imported {jumlah} rows from legacy CSV: {CSV_FILE}")
+            self._catat_waktu("impor_csv")
+
+        # Indeks NIM untuk menolak NIM duplikat tanpa membaca ulang seluruh data
+        self.indeks_nim = IndeksNIM(self.penyimpanan)
+
+        # Trie jurusan dan domain email yang sudah tersimpan, untuk saran isian
+        self.kamus_isian = KamusIsian(self.penyimpanan)
+        self._catat_waktu("indeks")
+
+        # Thread penulis latar belakang agar submit tidak menunggu disk
+        self.penulis = AntrianPenulis()
+
+        # Cek orang yang sama dengan nama sedikit berbeda (trigram nama, tanggal lahir, telepon)
+        self.pemeriksa_duplikat = PemeriksaDuplikat(self.penyimpanan.path)
+
+        # Mulai memeriksa hasil penulisan dari thread penulis
+        self._cek_penulis()
+        self._catat_waktu("penulis")
+
+        # Record baru dari proses lain (atau dari penulis sendiri) diterapkan ke indeks dan tampilan
+        self._id_diterapkan = set()
+        self.pemantau = PemantauBiodata(self, self.penyimpanan, self._data_baru)
+        self._catat_waktu("pemantau")
+
+        rincian = ", ".join(f"{tahap}: {ms:.0f} ms" for tahap, ms in list(self.waktu_startup.items())[tahap_awal:])
+        logging.info(f"Storage ready after {self.waktu_startup['pemantau']:.0f} ms ({rincian})")
+
     # Fungsi untuk validasi form secara real-time
     def submit_data(self):
         """Submit data biodata dengan validasi lengkap"""
@@ -72,83 +171,319 @@ class AplikasiBiodata(tk.Tk):
             telp = self.entry_telp.get()
             birth = self.entry_birth.get()
 
-            # Cek field kosong
-            if not nama or not nim or not jurusan:
-                messagebox.showwarning("Input Kosong", "Semua field harus diisi!")
+            # Foto yang masih diproses belum punya hash
+            if self._foto_berjalan is not None:
+                messagebox.showwarning("Peringatan", "Foto masih diproses, tunggu sebentar.")
                 return
 
-            # Validasi format NIM (harus angka dan minimal 8 digit)
-            if not nim.isdigit() or len(nim) < 8:
-                messagebox.showwarning("Format NIM Salah", "NIM harus berupa angka minimal 8 digit!")
-                self.entry_nim.focus_set()
-                return
-
-            # Validasi nama (tidak boleh hanya angka)
-            if nama.isdigit():
-                messagebox.showwarning("Format Nama Salah", "Nama tidak boleh hanya berupa angka!")
-                self.entry_nama.focus_set()
-                return
-            
-            # Validasi format email
-            if not self.validate_email(email):
-                messagebox.showwarning("Error", "Format email tidak valid!")
-                self.entry_email.focus_set()
+            # Submit sebelumnya masih menunggu cek duplikat
+            if self._duplikat_berjalan is not None:
+                messagebox.showwarning("Peringatan", "Data sebelumnya masih diperiksa, tunggu sebentar.")
                 return
 
-            # Validasi format telepon
-            if not self.validate_telp(telp):
-                messagebox.showwarning("Error", "Format telepon tidak valid! Gunakan format Indonesia (misal: 08123456789 atau +628123456789).")
-                self.entry_telp.focus_set()
+            record = {
+                "nama": nama,
+                "nim": nim,
+                "jurusan": jurusan,
+                "alamat": alamat,
+                "jenis_kelamin": jenis_kelamin,
+                "email": email,
+                "telepon": telp,
+                "tanggal_lahir": birth,
+                "foto": self.foto_hash,
+            }
+
+            # Validasi dengan aturan yang sama seperti impor massal
+            kesalahan = validasi_record(record)
+            if kesalahan:
+                field, judul, pesan = kesalahan
+                messagebox.showwarning(judul, pesan)
+                if field is not None:
+                    self.entry_field[field].focus_set()
                 return
 
-            # Validasi format tanggal lahir
-            if not self.validate_birth(birth):
-                messagebox.showwarning("Error", "Format tanggal lahir tidak valid! Gunakan format DD/MM/YYYY.")
-                self.entry_birth.focus_set()
+            # Tolak NIM yang sudah tersimpan (atau sedang menunggu disimpan)
+            if self.indeks_nim.ada(nim):
+                messagebox.showwarning("NIM Sudah Terdaftar", f"Data dengan NIM {nim} sudah tersimpan!")
+                self.entry_nim.focus_set()
                 return
         
             # Tampilkan hasil
             hasil = f"Nama: {nama}\nNIM: {nim}\nJurusan: {jurusan}\nAlamat: {alamat}\nJenis Kelamin: {jenis_kelamin}\nEmail: {email}\nTelepon: {telp}\nTanggal Lahir: {birth}"
-            
-            # Simpan ke CSV
-            with open("biodata_tersimpan.csv", "a", newline="", encoding="utf-8") as file:
-                writer = csv.writer(file)
-                if file.tell() == 0:
-                    writer.writerow(["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin", "Email", "Telepon", "Tanggal Lahir"])
-                writer.writerow([nama, nim, jurusan, alamat, jenis_kelamin, email, telp, birth])
-            
-            messagebox.showinfo("Data Tersimpan", hasil)
-            messagebox.showinfo("arbath@teknohole.com", "Data berhasil disimpan ke file 'biodata_tersimpan.csv'.")
 
-            # Tampilkan hasil di label
-            hasil_lengkap = f"BIODATA TERSIMPAN:\nDiinput oleh: {self.current_user}\n\n{hasil}"
-            self.label_hasil.config(text=hasil_lengkap)
-
-            # Log successful data submission
-            logging.info(f"Data submitted by user: {self.current_user} - NIM: {nim}")
+            # Cari data yang kemungkinan orang yang sama di thread pemeriksa, lanjut di _duplikat_diperiksa.
+            # User dicatat sekarang: saat hasilnya datang bisa saja sudah logout
+            user = self.current_user
+            menunggu = [record]
+            self._duplikat_berjalan = menunggu
+            self.btn_submit.config(state=tk.DISABLED)
+            self.label_hasil.config(text="Memeriksa data serupa...")
+            self.pemeriksa_duplikat.periksa(
+                record, lambda mirip, error: self._duplikat_diperiksa(menunggu, hasil, user, mirip, error)
+            )
 
         except Exception as e:
             logging.error(f"Error in submit_data by {self.current_user}: {str(e)}")
             messagebox.showerror("Error", f"Terjadi kesalahan: {e}")
 
+    @staticmethod
+    def _daftar_mirip(mirip):
+        """Teks daftar data serupa untuk dialog konfirmasi"""
+        return "\n".join(
+            f"- {row['nama']} (NIM {row['nim']}, lahir {row['tanggal_lahir']}, telp {row['telepon']}) "
+            f"- kemiripan {skor:.0%}"
+            for skor, _, row in mirip
+        )
+
+    def _duplikat_diperiksa(self, menunggu, hasil, user, mirip, error):
+        """Callback pemeriksa duplikat: konfirmasi jika ada data serupa, lalu simpan"""
+        record = menunggu[0]
+        if menunggu is not self._duplikat_berjalan:
+            # Dibatalkan oleh logout, pengguna sudah diberi tahu saat itu
+            logging.info(f"Discarded duplicate check result for NIM: {record['nim']} by user: {user}")
+            return
+        try:
+            if error is not None:
+                # Cek duplikat hanya peringatan, kegagalannya tidak menghalangi penyimpanan
+                logging.warning(f"Duplicate check failed for NIM: {record['nim']}: {error}")
+            elif mirip:
+                logging.info(
+                    f"Possible duplicate flagged for NIM: {record['nim']} by user: {user} "
+                    f"({len(mirip)} similar records)"
+                )
+                if not messagebox.askyesno(
+                    "Kemungkinan Duplikat",
+                    f"Data ini mirip dengan data yang sudah tersimpan:\n\n{self._daftar_mirip(mirip)}\n\nTetap simpan?"
+                ):
+                    self.label_hasil.config(text="")
+                    return
+
+            # NIM bisa saja tersimpan/tertunda selama pemeriksaan berjalan
+            if self.indeks_nim.ada(record["nim"]):
+                self.label_hasil.config(text="")
+                messagebox.showwarning("NIM Sudah Terdaftar", f"Data dengan NIM {record['nim']} sudah tersimpan!")
+                return
+            self._kirim_record(record, hasil, user)
+        finally:
+            self._duplikat_berjalan = None
+            self.validate_form()
+
+    def _batalkan_cek_duplikat(self):
+        """Batalkan submit yang masih menunggu cek duplikat (hasilnya diabaikan saat datang)"""
+        records = self._duplikat_berjalan
+        if records is None:
+            return
+        nim = ", ".join(record["nim"] for record in records)
+        logging.warning(f"Submit for NIM: {nim} by user: {self.current_user} cancelled before saving")
+        self._duplikat_berjalan = None
+        if "biodata" in self.frames:
+            self.label_hasil.config(text="")
+        self.validate_form()
+        if "grid" in self.frames:
+            self.frame_grid.selesai(False)
+
+    def _pesan_cek_duplikat(self):
+        """Keterangan untuk dialog logout/keluar jika ada submit yang belum tersimpan"""
+        if self._duplikat_berjalan is None:
+            return ""
+        nim = ", ".join(record["nim"] for record in self._duplikat_berjalan)
+        return f"\n\nData NIM {nim} masih diperiksa dan belum tersimpan; data tersebut akan dibatalkan."
+
+    def _kirim_record(self, record, hasil, user):
+        """Masukkan record ke antrian penulis, hasilnya dilaporkan lewat _data_tersimpan"""
+        try:
+            self.penulis.kirim(
+                record, user,
+                lambda id_record, error: self._data_tersimpan(id_record, record, hasil, user, error)
+            )
+        except queue.Full:
+            self.label_hasil.config(text="")
+            messagebox.showwarning("Penyimpanan Sibuk", "Antrian penyimpanan penuh, silakan coba lagi.")
+            return
+        self.indeks_nim.tandai_tertunda(record["nim"])
+
+        self.label_hasil.config(text="Menyimpan data...")
+
+    def _data_tersimpan(self, id_record, record, hasil, user, error):
+        """Callback dari antrian penulis setelah data selesai (atau gagal) disimpan"""
+        nim = record["nim"]
+        if isinstance(error, NIMSudahAda):
+            # NIM keburu disimpan proses lain; penulis menolaknya di dalam transaksi
+            self.indeks_nim.tambah(nim)
+            logging.warning(f"Submit by {user} rejected: {error}")
+            self.label_hasil.config(text="")
+            messagebox.showwarning("NIM Sudah Terdaftar", f"Data dengan NIM {nim} sudah tersimpan!")
+            return
+        if error is not None:
+            self.indeks_nim.batalkan(nim)
+            logging.error(f"Error in submit_data by {user}: {str(error)}")
+            self.label_hasil.config(text="")
+            messagebox.showerror("Error", f"Terjadi kesalahan saat menyimpan data: {error}")
+            return
+
+        # Log successful data submission
+        logging.info(f"Data submitted by user: {user} - NIM: {nim}")
+        self._record_sendiri_tersimpan(id_record, record)
+
+        # Tampilkan hasil di label
+        hasil_lengkap = f"BIODATA TERSIMPAN:\nDiinput oleh: {user}\n\n{hasil}"
+        self.label_hasil.config(text=hasil_lengkap)
+
+        # Satu ringkasan saja (sebelumnya dua messagebox per record)
+        messagebox.showinfo("Data Tersimpan", f"{hasil}\n\nData berhasil disimpan ke database '{DB_FILE}'.")
+
+    def _simpan_grid(self, records):
+        """Periksa lalu simpan semua baris grid dalam satu transaksi, mengembalikan True jika batch diterima"""
+        if self._duplikat_berjalan is not None:
+            messagebox.showwarning("Peringatan", "Data sebelumnya masih diperiksa, tunggu sebentar.")
+            return False
+        if not self._nim_grid_bebas(records):
+            return False
+
+        # Cari data serupa untuk setiap baris seperti submit form, lanjut di _grid_diperiksa
+        user = self.current_user
+        self._duplikat_berjalan = records
+        self.validate_form()
+        hasil = {}
+        for nomor, record in enumerate(records):
+            self.pemeriksa_duplikat.periksa(
+                record,
+                lambda mirip, error, nomor=nomor: self._grid_diperiksa(records, user, hasil, nomor, mirip, error)
+            )
+        return True
+
+    def _nim_grid_bebas(self, records):
+        """Cek ulang NIM: bisa saja tersimpan/tertunda setelah grid memvalidasinya"""
+        for record in records:
+            if self.indeks_nim.ada(record["nim"]):
+                messagebox.showwarning("NIM Sudah Terdaftar", f"Data dengan NIM {record['nim']} sudah tersimpan!")
+                return False
+        return True
+
+    def _grid_diperiksa(self, records, user, hasil, nomor, mirip, error):
+        """Callback pemeriksa duplikat per baris grid; konfirmasi sekali setelah semua baris diperiksa"""
+        if records is not self._duplikat_berjalan:
+            return
+        hasil[nomor] = (mirip, error)
+        if len(hasil) < len(records):
+            return
+
+        berhasil = False
+        try:
+            ditandai = []
+            for nomor, (mirip, error) in sorted(hasil.items()):
+                if error is not None:
+                    logging.warning(f"Duplicate check failed for NIM: {records[nomor]['nim']}: {error}")
+                elif mirip:
+                    ditandai.append((nomor, mirip))
+            if ditandai:
+                logging.info(f"Possible duplicates flagged in batch by user: {user} ({len(ditandai)} rows)")
+                daftar = "\n\n".join(
+                    f"Baris {nomor + 1} ({records[nomor]['nama']}):\n{self._daftar_mirip(mirip)}"
+                    for nomor, mirip in ditandai
+                )
+                if not messagebox.askyesno(
+                    "Kemungkinan Duplikat",
+                    f"Beberapa baris mirip dengan data yang sudah tersimpan:\n\n{daftar}\n\nTetap simpan semua?"
+                ):
+                    return
+            if self._nim_grid_bebas(records):
+                berhasil = self._kirim_grid(records, user)
+        finally:
+            self._duplikat_berjalan = None
+            self.validate_form()
+            if not berhasil:
+                self.frame_grid.selesai(False)
+
+    def _kirim_grid(self, records, user):
+        """Masukkan batch grid ke antrian penulis, hasilnya dilaporkan lewat _grid_tersimpan"""
+        try:
+            self.penulis.kirim_batch(
+                [(record, user) for record in records],
+                lambda ids, error: self._grid_tersimpan(ids, records, user, error)
+            )
+        except queue.Full:
+            messagebox.showwarning("Penyimpanan Sibuk", "Antrian penyimpanan penuh, silakan coba lagi.")
+            return False
+        for record in records:
+            self.indeks_nim.tandai_tertunda(record["nim"])
+        return True
+
+    def _grid_tersimpan(self, ids, records, user, error):
+        """Callback dari antrian penulis setelah batch grid selesai (atau gagal) disimpan"""
+        if error is not None:
+            for record in records:
+                self.indeks_nim.batalkan(record["nim"])
+            self.frame_grid.selesai(False)
+            if isinstance(error, NIMSudahAda):
+                # Seluruh batch dibatalkan karena satu NIM keburu disimpan proses lain
+                self.indeks_nim.tambah(error.nim)
+                logging.warning(f"Batch submit by {user} rejected: {error}")
+                messagebox.showwarning("NIM Sudah Terdaftar", f"Data dengan NIM {error.nim} sudah tersimpan!")
+                return
+            logging.error(f"Error in batch submit by {user}: {str(error)}")
+            messagebox.showerror("Error", f"Terjadi kesalahan saat menyimpan data: {error}")
+            return
+
+        for id_record, record in zip(ids, records):
+            logging.info(f"Data submitted by user: {user} - NIM: {record['nim']}")
+            self._record_sendiri_tersimpan(id_record, record)
+        logging.info(f"Batch of {len(records)} records submitted by user: {user}")
+
+        self.frame_grid.selesai(True)
+        messagebox.showinfo("Data Tersimpan", f"{len(records)} data berhasil disimpan ke database '{DB_FILE}'.")
+
+    def _terapkan_record(self, record):
+        """Perbarui indeks di memori (NIM dan saran isian) untuk record yang tersimpan"""
+        self.indeks_nim.tambah(record["nim"])
+        self.kamus_isian.tambah(record)
+
+    def _record_sendiri_tersimpan(self, id_record, record):
+        """Record dari aplikasi ini tersimpan; pemantau juga akan melihatnya, jadi terapkan sekali saja"""
+        if id_record <= self.pemantau.id_terakhir:
+            # Pemantau sudah lebih dulu menerapkannya, cukup hapus dari daftar tertunda
+            self.indeks_nim.tertunda.discard(record["nim"])
+            return
+        self._id_diterapkan.add(id_record)
+        self._terapkan_record(record)
+
+    def _data_baru(self, rows):
+        """Callback pemantau: record baru (hanya yang bertambah) sejak pemeriksaan terakhir"""
+        for row in rows:
+            if row["id"] in self._id_diterapkan:
+                self._id_diterapkan.discard(row["id"])
+                continue
+            self._terapkan_record(dict(row))
+
+        # Perbarui daftar data / statistik jika sedang ditampilkan
+        if self.nama_frame_aktif == "browser":
+            self.frame_browser.data_bertambah(rows[0]["id"], rows[-1]["id"])
+        elif self.nama_frame_aktif == "statistik":
+            self.frame_statistik.refresh()
+
+    def _cek_penulis(self):
+        """Jalankan callback penulisan yang sudah selesai, diperiksa berkala lewat after()"""
+        self.penulis.proses_hasil()
+        self.pemeriksa_duplikat.proses_hasil()
+        self.after(50, self._cek_penulis)
+
     def validate_email(self, email):
         """Validasi format email"""
-        return re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", email)
+        return validasi_biodata.validate_email(email)
 
     def validate_telp(self, telp):
         """Validasi format telepon Indonesia"""
-        return re.match(r"^(?:\+62|62|0)8\d{8,11}$", telp)
+        return validasi_biodata.validate_telp(telp)
 
     def validate_birth(self, birth):
         """Validasi format tanggal lahir DD/MM/YYYY"""
-        try:
-            datetime.datetime.strptime(birth, "%d/%m/%Y")
-            return True
-        except ValueError:
-            return False
+        return validasi_biodata.validate_birth(birth)
 
     def validate_form(self, *args):
         """Validasi form secara real-time"""
+        # Dipanggil juga setelah cek duplikat grid, saat form belum tentu pernah dibuat
+        if "biodata" not in self.frames:
+            return
         nama_valid = self.var_nama.get().strip() != ""
         nim_valid = self.var_nim.get().strip() != ""
         jurusan_valid = self.var_jurusan.get().strip() != ""
@@ -157,7 +492,10 @@ class AplikasiBiodata(tk.Tk):
         telp_valid = self.var_telp.get().strip() != ""
         birth_valid = self.var_birth.get().strip() != ""
 
-        if nama_valid and nim_valid and jurusan_valid and setuju_valid and email_valid and telp_valid and birth_valid:
+        # Selama cek duplikat berjalan tombol tetap nonaktif
+        menunggu = self._duplikat_berjalan is not None
+
+        if nama_valid and nim_valid and jurusan_valid and setuju_valid and email_valid and telp_valid and birth_valid and not menunggu:
             self.btn_submit.config(state=tk.NORMAL)
         else:
             self.btn_submit.config(state=tk.DISABLED)
@@ -178,22 +516,73 @@ class AplikasiBiodata(tk.Tk):
             self.submit_data()
 
     # Method navigasi antar frame
-    def _pindah_ke(self, frame_tujuan):
+    def _frame(self, nama):
+        """Ambil frame berdasarkan nama, dibuat dulu jika belum pernah dibuka"""
+        if nama not in self.frames:
+            mulai = time.perf_counter()
+            self._pembuat_frame[nama]()
+            self.frames[nama] = getattr(self, f"frame_{nama}")
+            logging.info(f"Frame '{nama}' built in {(time.perf_counter() - mulai) * 1000:.0f} ms")
+        return self.frames[nama]
+
+    def _pindah_ke(self, nama_tujuan):
         """Method untuk berpindah antar tampilan"""
+        if nama_tujuan != "login":
+            # Tampilan selain login butuh penyimpanan (biasanya sudah disiapkan setelah login tampil)
+            self._siapkan_penyimpanan()
+        frame_tujuan = self._frame(nama_tujuan)
+
         if self.frame_aktif is not None:
             self.frame_aktif.pack_forget()
 
         self.frame_aktif = frame_tujuan
+        self.nama_frame_aktif = nama_tujuan
         self.frame_aktif.pack(fill=tk.BOTH, expand=True)
 
         # Auto-focus berdasarkan frame yang ditampilkan
-        if frame_tujuan == self.frame_login:
+        if nama_tujuan == "login":
             self.after(100, lambda: self.entry_username.focus_set())
-        elif frame_tujuan == self.frame_biodata:
+        elif nama_tujuan == "biodata":
             self.after(100, lambda: self.entry_nama.focus_set())
+        elif nama_tujuan == "browser":
+            self.frame_browser.refresh()
+            self.after(100, lambda: self.frame_browser.entry_filter.focus_set())
+        elif nama_tujuan == "statistik":
+            self.frame_statistik.refresh()
+
+    def _buka_browser(self):
+        """Pindah ke tampilan data tersimpan (hanya setelah login)"""
+        if not self.current_user:
+            messagebox.showwarning("Peringatan", "Silakan login terlebih dahulu.")
+            return
+        self._pindah_ke("browser")
+
+    def _buka_statistik(self):
+        """Pindah ke panel statistik (hanya setelah login)"""
+        if not self.current_user:
+            messagebox.showwarning("Peringatan", "Silakan login terlebih dahulu.")
+            return
+        self._pindah_ke("statistik")
+
+    def _buka_grid(self):
+        """Pindah ke input banyak (hanya setelah login)"""
+        if not self.current_user:
+            messagebox.showwarning("Peringatan", "Silakan login terlebih dahulu.")
+            return
+        self._pindah_ke("grid")
+
+    def _buka_form_biodata(self):
+        """Pindah ke form biodata (hanya setelah login)"""
+        if not self.current_user:
+            messagebox.showwarning("Peringatan", "Silakan login terlebih dahulu.")
+            return
+        self._pindah_ke("biodata")
 
     def _buat_menu(self):
-        """Membuat menu bar untuk aplikasi"""
+        """Membuat menu bar untuk aplikasi (hanya setelah login)"""
+        # Menu berisi ekspor seluruh data dan navigasi, jadi tidak tersedia di halaman login
+        if not self.current_user:
+            return
         menu_bar = tk.Menu(master=self)
         self.config(menu=menu_bar)
 
@@ -206,6 +595,8 @@ class AplikasiBiodata(tk.Tk):
         file_menu.add_command(label="Simpan", command=self.simpan_hasil)
         file_menu.add_separator()
         file_menu.add_command(label="Simpan Sebagai", command=self.simpan_hasil)
+        file_menu.add_separator()
+        file_menu.add_command(label="Ekspor CSV", command=self.ekspor_csv)
 
         edit_menu = tk.Menu(master=menu_bar, tearoff=0)
         edit_menu.add_command(label="Reset Form", command=self._reset_form_biodata)
@@ -214,9 +605,16 @@ class AplikasiBiodata(tk.Tk):
         edit_menu.add_separator()
         edit_menu.add_command(label="Tampilkan Menu <Esc>", command=self._buat_menu)
         
+        lihat_menu = tk.Menu(master=menu_bar, tearoff=0)
+        lihat_menu.add_command(label="Form Biodata", command=self._buka_form_biodata)
+        lihat_menu.add_command(label="Data Tersimpan", command=self._buka_browser)
+        lihat_menu.add_command(label="Statistik", command=self._buka_statistik)
+        lihat_menu.add_command(label="Input Banyak", command=self._buka_grid)
+
         menu_bar.add_cascade(label="Home", menu=home_menu)
         menu_bar.add_cascade(label="File", menu=file_menu)
         menu_bar.add_cascade(label="Edit", menu=edit_menu)
+        menu_bar.add_cascade(label="Lihat", menu=lihat_menu)
 
     def _hapus_menu(self):
         """Menghapus menu bar dari window"""
@@ -226,7 +624,7 @@ class AplikasiBiodata(tk.Tk):
     def simpan_hasil(self):
         """Simpan hasil biodata ke file dengan error handling"""
         try:
-            hasil_tersimpan = self.label_hasil.cget("text")
+            hasil_tersimpan = self.label_hasil.cget("text") if "biodata" in self.frames else ""
 
             if not hasil_tersimpan or "BIODATA TERSIMPAN" not in hasil_tersimpan:
                 messagebox.showwarning("Peringatan", "Tidak ada data untuk disimpan. Mohon submit terlebih dahulu.")
@@ -250,10 +648,49 @@ class AplikasiBiodata(tk.Tk):
         except Exception as e:
             messagebox.showerror("Error", f"Terjadi kesalahan saat menyimpan file:\n{str(e)}")
 
+    def ekspor_csv(self):
+        """Ekspor semua biodata tersimpan ke file CSV (hanya setelah login)"""
+        if not self.current_user:
+            messagebox.showwarning("Peringatan", "Silakan login terlebih dahulu.")
+            return
+        try:
+            filename = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                initialfile=CSV_FILE,
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            )
+            if not filename:
+                return
+
+            jumlah = self.penyimpanan.ekspor_csv(filename)
+            messagebox.showinfo("Info", f"{jumlah} data berhasil diekspor ke file '{filename}'.")
+            logging.info(f"Data exported to CSV: {filename} ({jumlah} rows) by user: {self.current_user}")
+
+        except PermissionError:
+            messagebox.showerror("Error", "Tidak memiliki izin untuk menyimpan file di lokasi ini.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Terjadi kesalahan saat mengekspor data:\n{str(e)}")
+
     def _keluar_aplikasi(self):
         """Keluar dari aplikasi dengan konfirmasi"""
-        if messagebox.askokcancel("Keluar", "Apakah Anda yakin ingin keluar dari aplikasi?"):
+        if messagebox.askokcancel("Keluar", "Apakah Anda yakin ingin keluar dari aplikasi?" + self._pesan_cek_duplikat()):
             logging.info(f"Application closed by user: {self.current_user}")
+            self._batalkan_cek_duplikat()
+            # Penyimpanan belum disiapkan jika window ditutup sebelum halaman login sempat tampil
+            if self.penyimpanan is not None:
+                # Tunggu semua data di antrian tersimpan sebelum keluar (dibatasi, agar tidak menggantung)
+                if not self.penulis.hentikan():
+                    logging.error("Writer did not finish before exit, queued records may be lost")
+                    messagebox.showwarning("Keluar", "Sebagian data belum selesai disimpan dan mungkin hilang.")
+                self.pemantau.hentikan()
+                self.pemeriksa_duplikat.hentikan()
+                self.penyimpanan.tutup()
+            self._verifikator.shutdown(wait=False, cancel_futures=True)
+            self._pekerja_foto.shutdown(wait=False, cancel_futures=True)
+            if "browser" in self.frames:
+                self.frame_browser.tutup()
+            if "grid" in self.frames:
+                self.frame_grid.tutup()
             self.destroy()
 
     def _coba_login(self):
@@ -278,14 +715,49 @@ class AplikasiBiodata(tk.Tk):
             self.entry_username.focus_set()
             return
         
-        # Cek kredensial di database
-        if username in self.users_db and self.users_db[username] == password:
+        # Tolak sementara jika username ini baru saja gagal login berulang kali
+        sisa = self.pembatas_login.sisa_tunda(username)
+        if sisa > 0:
+            logging.warning(f"Login throttled for username: {username} ({sisa:.1f}s remaining)")
+            messagebox.showwarning(
+                "Login Gagal",
+                f"Terlalu banyak percobaan gagal. Coba lagi dalam {sisa:.0f} detik."
+            )
+            return
+
+        # Satu verifikasi dalam satu waktu
+        if self._login_berjalan is not None:
+            return
+
+        # Verifikasi di thread worker, hasilnya diperiksa lewat after() agar UI tetap responsif
+        self.btn_login.config(state=tk.DISABLED, text="Memeriksa...")
+        future = self._verifikator.submit(self.kredensial.verifikasi, username, password)
+        self._login_berjalan = future
+        self._cek_login(future, username)
+
+    def _cek_login(self, future, username):
+        """Tunggu hasil verifikasi password tanpa memblokir loop Tk"""
+        if not future.done():
+            self.after(20, self._cek_login, future, username)
+            return
+
+        self._login_berjalan = None
+        self.btn_login.config(state=tk.NORMAL, text="Login")
+        try:
+            valid = future.result()
+        except Exception as e:
+            logging.error(f"Error verifying credentials for username: {username} - {str(e)}")
+            messagebox.showerror("Login Gagal", f"Gagal memeriksa kredensial:\n{str(e)}")
+            return
+
+        if valid:
             self.current_user = username
             logging.info(f"Successful login for user: {username}")
             messagebox.showinfo("Login Berhasil", f"Selamat Datang, {username}!")
             self._reset_form_biodata()
             self._update_title_with_user()
-            self._pindah_ke(self.frame_biodata)
+            self._pindah_ke("biodata")
+            self._buat_menu()
             # Bersihkan field login setelah berhasil
             self.entry_username.delete(0, tk.END)
             self.entry_password.delete(0, tk.END)
@@ -296,16 +768,67 @@ class AplikasiBiodata(tk.Tk):
             self.entry_password.delete(0, tk.END)
             self.entry_username.focus_set()
 
-        # Simpan username & password terakhir jika checkbox di-check
+        # Simpan username terakhir jika checkbox di-check (password tidak pernah disimpan)
         if self.remember_var.get():
             with open(USER_FILE, "w") as f:
-                f.write(f"{username}\n{password}")
+                f.write(f"{username}\n")
         else:
             if os.path.exists(USER_FILE):
                 os.remove(USER_FILE)
 
+    def pilih_foto(self):
+        """Pilih file foto lalu simpan (asli + thumbnail) di thread worker"""
+        path = filedialog.askopenfilename(
+            title="Pilih Foto",
+            filetypes=[("Foto", "*.jpg *.jpeg *.png"), ("Semua file", "*.*")]
+        )
+        if not path:
+            return
+
+        self.btn_foto.config(state=tk.DISABLED)
+        self.label_preview_foto.config(image="", text="Memproses foto...")
+        future = self._pekerja_foto.submit(proses_foto, path)
+        self._foto_berjalan = future
+        self._cek_foto(future, path)
+
+    def _cek_foto(self, future, path):
+        """Tunggu hasil pemrosesan foto tanpa memblokir loop Tk"""
+        if not future.done():
+            self.after(50, self._cek_foto, future, path)
+            return
+        if future is not self._foto_berjalan:
+            # Form sudah direset selama foto diproses
+            return
+
+        self._foto_berjalan = None
+        self.btn_foto.config(state=tk.NORMAL)
+        try:
+            hash_foto = future.result()
+            # Thumbnail sudah dibuat di worker, di sini hanya memuat PNG 48px
+            self._gambar_foto = tk.PhotoImage(file=path_thumbnail(hash_foto))
+        except Exception as e:
+            logging.error(f"Error processing photo {path}: {str(e)}")
+            self._hapus_foto()
+            messagebox.showerror("Foto Gagal", f"Foto tidak dapat diproses:\n{e}")
+            return
+
+        self.foto_hash = hash_foto
+        self.label_preview_foto.config(image=self._gambar_foto, text="")
+        logging.info(f"Photo attached: {hash_foto} ({os.path.basename(path)})")
+
+    def _hapus_foto(self):
+        """Kosongkan foto di form"""
+        self.foto_hash = None
+        self._foto_berjalan = None
+        self._gambar_foto = None
+        self.btn_foto.config(state=tk.NORMAL)
+        self.label_preview_foto.config(image="", text="Belum ada foto")
+
     def _reset_form_biodata(self):
         """Reset semua field di form biodata"""
+        # Form yang belum pernah dibuat sudah dalam keadaan kosong
+        if "biodata" not in self.frames:
+            return
         self.var_nama.set("")
         self.var_nim.set("")
         self.var_jurusan.set("")
@@ -316,6 +839,7 @@ class AplikasiBiodata(tk.Tk):
         self.var_birth.set("")
         self.var_setuju.set(0)
         self.label_hasil.config(text="")
+        self._hapus_foto()
 
     def _update_title_with_user(self):
         """Update judul window dengan nama user yang login"""
@@ -336,15 +860,19 @@ class AplikasiBiodata(tk.Tk):
         self.show_password = not self.show_password
 
     def load_username(self):
-        """Muat data username & password terakhir"""
+        """Muat username terakhir"""
         if os.path.exists(USER_FILE):
             try:
                 with open(USER_FILE, "r") as f:
                     lines = f.readlines()
-                    if len(lines) >= 2:
-                        self.entry_username.insert(0, lines[0].strip())
-                        self.entry_password.insert(0, lines[1].strip())
-                        self.remember_var.set(True)
+                if lines:
+                    self.entry_username.insert(0, lines[0].strip())
+                    self.remember_var.set(True)
+                if len(lines) >= 2:
+                    # Format lama menyimpan password di baris kedua: tulis ulang tanpa password
+                    with open(USER_FILE, "w") as f:
+                        f.write(lines[0].strip() + "\n")
+                    logging.info("Removed stored password from saved credentials file")
             except Exception as e:
                 logging.error(f"Error loading saved credentials: {str(e)}")
 
@@ -626,6 +1154,32 @@ class AplikasiBiodata(tk.Tk):
         )
         self.radio_wanita.pack(side=tk.LEFT)
 
+        # Foto (opsional), diproses di thread worker
+        self.foto_hash = None
+        self._foto_berjalan = None
+        self._gambar_foto = None
+        self.label_foto = tk.Label(
+            master=self.frame_input,
+            text="Foto (JPEG/PNG):",
+            font=("Arial", 12)
+        )
+        self.label_foto.grid(row=8, column=0, sticky="W", pady=2)
+
+        self.frame_foto = tk.Frame(master=self.frame_input)
+        self.frame_foto.grid(row=8, column=1, sticky="W")
+        self.btn_foto = tk.Button(
+            master=self.frame_foto,
+            text="Pilih Foto...",
+            command=self.pilih_foto
+        )
+        self.btn_foto.pack(side=tk.LEFT)
+        self.label_preview_foto = tk.Label(
+            master=self.frame_foto,
+            text="Belum ada foto",
+            font=("Arial", 10, "italic")
+        )
+        self.label_preview_foto.pack(side=tk.LEFT, padx=5)
+
         # Checkbox persetujuan
         self.check_setuju = tk.Checkbutton(
             master=self.frame_input,
@@ -634,7 +1188,7 @@ class AplikasiBiodata(tk.Tk):
             font=("Arial", 10),
             command=self.validate_form
         )
-        self.check_setuju.grid(row=8, column=0, columnspan=2, pady=10, sticky="W")
+        self.check_setuju.grid(row=9, column=0, columnspan=2, pady=10, sticky="W")
 
         self.frame_input.grid(row=1, column=0, columnspan=2, sticky="EW")
 
@@ -648,6 +1202,16 @@ class AplikasiBiodata(tk.Tk):
         )
         self.btn_submit.grid(row=2, column=0, columnspan=2, pady=20, sticky="EW")
 
+        # Entry per field record, untuk fokus ke field yang salah
+        self.entry_field = {
+            "nama": self.entry_nama,
+            "nim": self.entry_nim,
+            "jurusan": self.entry_jurusan,
+            "email": self.entry_email,
+            "telepon": self.entry_telp,
+            "tanggal_lahir": self.entry_birth,
+        }
+
         # Event bindings untuk hover dan keyboard shortcuts
         self.btn_submit.bind("<Enter>", self.on_enter)
         self.btn_submit.bind("<Leave>", self.on_leave)
@@ -661,6 +1225,10 @@ class AplikasiBiodata(tk.Tk):
         self.entry_birth.bind("<Return>", self.submit_shortcut)
         self.text_alamat.bind("<Return>", lambda e: self.entry_email.focus_set())
 
+        # Saran isian dari data yang sudah tersimpan
+        self.pelengkap_jurusan = PelengkapOtomatis(self.entry_jurusan, self.kamus_isian.saran_jurusan)
+        self.pelengkap_email = PelengkapOtomatis(self.entry_email, self.kamus_isian.saran_email)
+
         # Label hasil
         self.label_hasil = tk.Label(
             master=self.frame_biodata, 
@@ -671,24 +1239,87 @@ class AplikasiBiodata(tk.Tk):
         )
         self.label_hasil.grid(row=3, column=0, columnspan=2, sticky="W", padx=10)
 
+        # Tombol ke tampilan data tersimpan
+        self.btn_lihat_data = tk.Button(
+            master=self.frame_biodata,
+            text="Lihat Data Tersimpan",
+            font=("Arial", 10),
+            command=self._buka_browser
+        )
+        self.btn_lihat_data.grid(row=4, column=0, columnspan=2, pady=10, sticky="E")
+
+        # Tombol ke input banyak
+        self.btn_input_banyak = tk.Button(
+            master=self.frame_biodata,
+            text="Input Banyak",
+            font=("Arial", 10),
+            command=self._buka_grid
+        )
+        self.btn_input_banyak.grid(row=4, column=0, columnspan=2, pady=10, sticky="W")
+
         # Membuat menu
         self._buat_menu()
 
+    # Halaman data tersimpan
+    def _buat_tampilan_browser(self):
+        """Membuat tampilan daftar biodata tersimpan"""
+        self.frame_browser = BrowserBiodata(
+            self,
+            self.penyimpanan,
+            kembali=self._buka_form_biodata,
+            padx=20,
+            pady=20,
+            bg="lightblue"
+        )
+
+    # Halaman statistik
+    def _buat_tampilan_statistik(self):
+        """Membuat panel statistik biodata"""
+        self.frame_statistik = PanelStatistik(
+            self,
+            self.penyimpanan,
+            kembali=self._buka_form_biodata,
+            padx=20,
+            pady=20,
+            bg="lightblue"
+        )
+
+    # Halaman input banyak
+    def _buat_tampilan_grid(self):
+        """Membuat tampilan input banyak (grid)"""
+        self.frame_grid = GridBiodata(
+            self,
+            self.penyimpanan,
+            simpan=self._simpan_grid,
+            kembali=self._buka_form_biodata,
+            saran={"jurusan": self.kamus_isian.saran_jurusan, "email": self.kamus_isian.saran_email},
+            padx=20,
+            pady=20,
+            bg="lightblue"
+        )
+
     def _logout(self):
         """Method untuk logout dan kembali ke halaman login"""
-        if messagebox.askyesno("Logout", f"Apakah {self.current_user} yakin ingin logout?"):
+        if messagebox.askyesno("Logout", f"Apakah {self.current_user} yakin ingin logout?" + self._pesan_cek_duplikat()):
             logging.info(f"User logout: {self.current_user}")
+            # Submit yang masih diperiksa tidak boleh muncul/tersimpan setelah logout
+            self._batalkan_cek_duplikat()
+            # Pastikan semua data yang sudah disubmit tersimpan
+            if not self.penulis.kosongkan():
+                logging.warning("Writer queue not drained at logout, saving continues in background")
+                messagebox.showwarning("Logout", "Sebagian data masih disimpan di latar belakang.")
             # Reset status user
             self.current_user = None
-            # Update title
+            # Update title dan sembunyikan menu
             self._update_title_with_user()
+            self._hapus_menu()
             # Bersihkan field login
             self.entry_username.delete(0, tk.END)
             self.entry_password.delete(0, tk.END)
             # Reset form biodata
             self._reset_form_biodata()
             # Kembali ke halaman login
-            self._pindah_ke(self.frame_login)
+            self._pindah_ke("login")
             # Focus ke username field
             self.entry_username.focus_set()
 
@@ -0,0 +1,107 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from ekspor_kolom import ADA_PYARROW, ekspor_parquet
+from penyimpanan_biodata import PenyimpananBiodata
+
+if ADA_PYARROW:
+    import pyarrow.parquet as pq
+
+try:
+    import pandas as pd
+except ImportError:
+    # pandas opsional: jika ada, waktu muat ke DataFrame ikut diukur
+    pd = None
+
+JURUSAN = ["Informatika", "Sistem Informasi", "Teknik Sipil", "Teknik Elektro", "Matematika", "Fisika", "Biologi", "Kimia"]
+
+
+def isi_data(penyimpanan, jumlah_record):
+    """Isi database sementara dengan record sintetis"""
+    acak = random.Random(42)
+    penyimpanan.simpan_banyak(
+        (
+            {
+                "nama": f"Mahasiswa {i}",
+                "nim": f"{23000000 + i}",
+                "jurusan": acak.choice(JURUSAN),
+                "alamat": f"Jl. Contoh No. {acak.randint(1, 300)}, Yogyakarta",
+                "jenis_kelamin": acak.choice(["Laki-Laki", "Perempuan"]),
+                "email": f"mhs{i}@student.ac.id",
+                "telepon": f"08{acak.randint(10**9, 10**10 - 1)}",
+                "tanggal_lahir": f"{acak.randint(1, 28):02d}/{acak.randint(1, 12):02d}/{acak.randint(1998, 2006)}",
+            }
+            for i in range(jumlah_record)
+        ),
+        "admin"
+    )
+
+
+def ukur(fungsi):
+    """Jalankan fungsi dan kembalikan waktu terbaik dari tiga kali (detik)"""
+    terbaik = None
+    for _ in range(3):
+        mulai = time.perf_counter()
+        fungsi()
+        detik = time.perf_counter() - mulai
+        terbaik = detik if terbaik is None else min(terbaik, detik)
+    return terbaik
+
+
+def baca_csv(path):
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan ukuran dan waktu muat ekspor CSV vs Parquet")
+    parser.add_argument("--db", help="Database yang diekspor (default: database sintetis sementara)")
+    parser.add_argument("--record", type=int, default=200_000, help="Jumlah record sintetis")
+    args = parser.parse_args(argv)
+
+    if not ADA_PYARROW:
+        print("Benchmark membutuhkan pyarrow (pip install pyarrow).")
+        return 1
+
+    with tempfile.TemporaryDirectory() as folder:
+        if args.db:
+            penyimpanan = PenyimpananBiodata(args.db)
+        else:
+            penyimpanan = PenyimpananBiodata(os.path.join(folder, "bench.db"))
+            isi_data(penyimpanan, args.record)
+
+        path_csv = os.path.join(folder, "biodata_tersimpan.csv")
+        path_parquet = os.path.join(folder, "biodata.parquet")
+
+        mulai = time.perf_counter()
+        jumlah = penyimpanan.ekspor_csv(path_csv)
+        ekspor_csv = time.perf_counter() - mulai
+        mulai = time.perf_counter()
+        ekspor_parquet(penyimpanan, path_parquet)
+        ekspor_pq = time.perf_counter() - mulai
+        penyimpanan.tutup()
+
+        hasil = [
+            ("CSV", os.path.getsize(path_csv), ekspor_csv, ukur(lambda: baca_csv(path_csv)), "csv.reader"),
+            ("Parquet", os.path.getsize(path_parquet), ekspor_pq, ukur(lambda: pq.read_table(path_parquet)), "read_table"),
+        ]
+        if pd is not None:
+            hasil.append(("CSV", os.path.getsize(path_csv), ekspor_csv,
+                          ukur(lambda: pd.read_csv(path_csv, dtype=str)), "pandas"))
+            hasil.append(("Parquet", os.path.getsize(path_parquet), ekspor_pq,
+                          ukur(lambda: pd.read_parquet(path_parquet)), "pandas"))
+
+        print(f"{jumlah} record")
+        print(f"{'Format':<8} {'Ukuran':>10} {'Ekspor (s)':>11} {'Muat (s)':>9}  Pembaca")
+        for nama, ukuran, ekspor, muat, pembaca in hasil:
+            print(f"{nama:<8} {ukuran / 1024 / 1024:>8.1f}MB {ekspor:>11.2f} {muat:>9.3f}  {pembaca}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from penyimpanan_biodata import PenyimpananBiodata
+
+
+def _penulis(path, nomor_proses, jumlah_record, ukuran_batch, mulai_event):
+    """Satu proses penulis: simpan record dengan NIM unik per proses"""
+    penyimpanan = PenyimpananBiodata(path)
+    mulai_event.wait()
+    for awal in range(0, jumlah_record, ukuran_batch):
+        batch = [
+            (
+                {
+                    "nama": f"Mahasiswa {nomor_proses}-{i}",
+                    "nim": f"{nomor_proses:03d}{i:08d}",
+                    "jurusan": "Informatika",
+                    "email": f"m{nomor_proses}_{i}@contoh.ac.id",
+                },
+                f"proses{nomor_proses}",
+            )
+            for i in range(awal, min(awal + ukuran_batch, jumlah_record))
+        ]
+        penyimpanan.simpan_batch(batch)
+    penyimpanan.tutup()
+
+
+def jalankan(jumlah_proses, jumlah_record, ukuran_batch, folder):
+    """Jalankan N proses penulis ke satu database, mengembalikan (detik, jumlah tersimpan, NIM unik)"""
+    path = os.path.join(folder, f"bench_{jumlah_proses}_{ukuran_batch}.db")
+    PenyimpananBiodata(path).tutup()
+
+    mulai_event = multiprocessing.Event()
+    proses = [
+        multiprocessing.Process(target=_penulis, args=(path, n, jumlah_record, ukuran_batch, mulai_event))
+        for n in range(jumlah_proses)
+    ]
+    for p in proses:
+        p.start()
+
+    # Tunggu sebentar agar semua proses siap, lalu mulai bersamaan
+    time.sleep(0.5)
+    mulai = time.perf_counter()
+    mulai_event.set()
+    for p in proses:
+        p.join()
+    detik = time.perf_counter() - mulai
+
+    penyimpanan = PenyimpananBiodata(path)
+    tersimpan = penyimpanan.jumlah()
+    unik = penyimpanan.conn.execute("SELECT COUNT(DISTINCT nim) FROM biodata").fetchone()[0]
+    penyimpanan.tutup()
+    return detik, tersimpan, unik
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark throughput penyimpanan biodata dengan banyak proses penulis")
+    parser.add_argument("--proses", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--record", type=int, default=500, help="Jumlah record per proses")
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 50], help="Record per transaksi")
+    args = parser.parse_args(argv)
+
+    print(f"{'Proses':>6} {'Batch':>6} {'Record':>8} {'Detik':>8} {'Record/s':>10}  Cek")
+    with tempfile.TemporaryDirectory() as folder:
+        for ukuran_batch in args.batch:
+            for jumlah_proses in args.proses:
+                detik, tersimpan, unik = jalankan(jumlah_proses, args.record, ukuran_batch, folder)
+                diharapkan = jumlah_proses * args.record
+                cek = "OK" if tersimpan == unik == diharapkan else f"GAGAL ({tersimpan}/{unik}/{diharapkan})"
+                print(f"{jumlah_proses:>6} {ukuran_batch:>6} {tersimpan:>8} {detik:>8.2f} {tersimpan / detik:>10.0f}  {cek}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
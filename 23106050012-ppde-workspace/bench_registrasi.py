@@ -0,0 +1,137 @@
+import argparse
+import concurrent.futures
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from kredensial import hash_password
+from layanan_registrasi import KlienRegistrasi, ServerRegistrasi
+from penyimpanan_registrasi import PenyimpananRegistrasi
+
+# Interval "tick" thread utama, seperti after() di loop Tk
+INTERVAL_TICK = 0.01
+
+
+def jalankan(url, jumlah, bersamaan, putaran):
+    """Kirim `jumlah` registrasi dari thread utama, mengembalikan statistik latensi dan jeda loop"""
+    klien = KlienRegistrasi(url, maks_bersamaan=bersamaan)
+    latensi = []
+    try:
+        mulai = time.perf_counter()
+        futures = []
+        for i in range(jumlah):
+            waktu_kirim = time.perf_counter()
+            future = klien.kirim({
+                "nama": f"Pengguna {i}",
+                "email": f"bench{putaran}_{bersamaan}_{i}@contoh.com",
+                "phone": f"08{putaran:02d}{bersamaan:04d}{i:05d}",
+                "password": f"rahasia{i}",
+            })
+            future.add_done_callback(lambda f, t=waktu_kirim: latensi.append(time.perf_counter() - t))
+            futures.append(future)
+
+        # Thread utama tetap "berdetak" selama menunggu: jeda terbesar = seberapa tersendat UI
+        jeda_maks = 0.0
+        sebelumnya = time.perf_counter()
+        while not all(f.done() for f in futures):
+            time.sleep(INTERVAL_TICK)
+            sekarang = time.perf_counter()
+            jeda_maks = max(jeda_maks, sekarang - sebelumnya - INTERVAL_TICK)
+            sebelumnya = sekarang
+        detik = time.perf_counter() - mulai
+
+        gagal = sum(1 for f in futures if f.exception() is not None)
+    finally:
+        klien.tutup()
+
+    latensi.sort()
+    return {
+        "detik": detik,
+        "gagal": gagal,
+        "p50": statistics.median(latensi),
+        "p95": latensi[int(len(latensi) * 0.95) - 1],
+        "p99": latensi[int(len(latensi) * 0.99) - 1],
+        "jeda_maks": jeda_maks,
+    }
+
+
+def uji_pembatalan(url):
+    """Batalkan registrasi yang sedang menunggu server, mengembalikan waktu sampai future selesai"""
+    klien = KlienRegistrasi(url)
+    try:
+        future = klien.kirim({"nama": "Batal", "email": "batal@contoh.com"})
+        time.sleep(0.05)
+        mulai = time.perf_counter()
+        future.cancel()
+        try:
+            future.result(timeout=1)
+        except concurrent.futures.CancelledError:
+            pass
+        return time.perf_counter() - mulai
+    finally:
+        klien.tutup()
+
+
+def ukur_simpan(folder, jumlah):
+    """Bandingkan simpan() per record dengan simpan_banyak() satu transaksi, mengembalikan (detik, detik)"""
+    salt, hash_hex = hash_password("rahasia", iterasi=1)
+    records = [
+        {"nama": f"Pengguna {i}", "email": f"u{i}@contoh.com", "phone": f"08{i:010d}", "age": 20,
+         "gender": "Pria", "password_salt": salt, "password_hash": hash_hex, "iterasi": 1,
+         "registration_date": "2025-01-01 00:00:00"}
+        for i in range(jumlah)
+    ]
+    hasil = []
+    for nama, simpan in (("satu", lambda p: [p.simpan(r) for r in records]), ("banyak", lambda p: p.simpan_banyak(records))):
+        penyimpanan = PenyimpananRegistrasi(os.path.join(folder, f"simpan_{nama}.db"))
+        mulai = time.perf_counter()
+        simpan(penyimpanan)
+        hasil.append(time.perf_counter() - mulai)
+        penyimpanan.tutup()
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark latensi dan throughput klien registrasi asyncio")
+    parser.add_argument("--permintaan", type=int, default=500)
+    parser.add_argument("--bersamaan", type=int, nargs="+", default=[1, 8, 64, 256],
+                        help="Jumlah registrasi yang boleh berjalan bersamaan")
+    parser.add_argument("--latensi", type=float, default=0.05, help="Waktu proses server per permintaan (detik)")
+    parser.add_argument("--gagal", type=float, default=0.0, help="Peluang server membalas 503 (diulang klien)")
+    parser.add_argument("--iterasi", type=int, default=1000,
+                        help="Iterasi PBKDF2 di server (default kecil: yang diukur pipeline, bukan hashing)")
+    parser.add_argument("--simpan", type=int, default=5000, help="Jumlah record untuk uji simpan per record vs batch")
+    args = parser.parse_args(argv)
+
+    # Peringatan percobaan ulang tidak perlu ikut dicetak di tabel hasil
+    logging.basicConfig(level=logging.ERROR)
+
+    folder = tempfile.TemporaryDirectory()
+    server = ServerRegistrasi(latensi=args.latensi, peluang_gagal=args.gagal,
+                              path=os.path.join(folder.name, "registrasi.db"), iterasi=args.iterasi).mulai()
+    try:
+        print(f"{args.permintaan} registrasi, latensi server {args.latensi * 1000:.0f} ms, peluang 503 {args.gagal:.0%}")
+        print(f"{'Bersamaan':>9} {'Detik':>7} {'Reg/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'Jeda UI ms':>10} {'Gagal':>6}")
+        for putaran, bersamaan in enumerate(args.bersamaan):
+            hasil = jalankan(server.url, args.permintaan, bersamaan, putaran)
+            print(f"{bersamaan:>9} {hasil['detik']:>7.2f} {args.permintaan / hasil['detik']:>8.0f} "
+                  f"{hasil['p50'] * 1000:>8.0f} {hasil['p95'] * 1000:>8.0f} {hasil['p99'] * 1000:>8.0f} "
+                  f"{hasil['jeda_maks'] * 1000:>10.1f} {hasil['gagal']:>6}")
+
+        server.httpd.latensi = 2.0
+        print(f"Pembatalan saat menunggu server: selesai dalam {uji_pembatalan(server.url) * 1000:.1f} ms")
+
+        satu, banyak = ukur_simpan(folder.name, args.simpan)
+        print(f"Simpan {args.simpan} registrasi: per record {satu:.2f} s, satu transaksi {banyak:.3f} s")
+    finally:
+        server.hentikan()
+        folder.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+import argparse
+import logging
+import mmap
+import os
+import sys
+import time
+
+from penyimpanan_biodata import tulis_atomik
+
+# Daftar domain email sekali pakai/diblokir, satu aturan per baris:
+#   mailinator.com    domain itu dan semua subdomainnya
+#   *.example.net     hanya subdomain (example.net sendiri tidak diblokir)
+#   # komentar
+DOMAIN_DIBLOKIR = "domain_diblokir.txt"
+
+# Label penanda aturan khusus subdomain di file indeks
+WILDCARD = "*"
+
+
+def normalisasi_domain(domain):
+    """Huruf kecil tanpa titik di awal/akhir; domain non-ASCII dalam bentuk IDNA (xn--...)
+
+    Domain yang tidak valid menurut IDNA menjadi "" (tidak pernah cocok dengan aturan).
+    """
+    domain = domain.strip().strip(".").lower()
+    if domain.isascii():
+        return domain
+    try:
+        return domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return ""
+
+
+def balik_label(domain):
+    """mail.example.com -> com.example.mail (domain dengan akhiran sama jadi berdekatan saat diurutkan)"""
+    return ".".join(reversed(domain.split(".")))
+
+
+def bangun_indeks(path_sumber, path_indeks):
+    """Ubah daftar aturan menjadi file indeks: domain dengan label terbalik, terurut, satu per baris"""
+    entri = set()
+    with open(path_sumber, "r", encoding="utf-8", errors="ignore") as file:
+        for baris in file:
+            aturan = baris.split("#", 1)[0].strip().lower()
+            if not aturan:
+                continue
+            wildcard = aturan.startswith("*.")
+            domain = normalisasi_domain(aturan[2:] if wildcard else aturan)
+            if not domain:
+                logging.warning(f"Ignoring invalid blocklist rule: {aturan}")
+                continue
+            entri.add(balik_label(domain) + ("." + WILDCARD if wildcard else ""))
+    with tulis_atomik(path_indeks) as file:
+        for e in sorted(entri):
+            file.write(e + "\n")
+    return len(entri)
+
+
+class DaftarBlokirDomain:
+    """Pencarian domain email diblokir lewat file indeks terurut yang di-mmap
+
+    Indeks (label domain terbalik, terurut) dibangun dari path_sumber jika belum ada
+    atau lebih lama dari sumbernya, lalu di-mmap: tidak ada yang dimuat ke memori saat
+    startup dan halaman file dibaca sistem operasi sesuai kebutuhan. Indeks hanya cache
+    dari sumbernya; tanpa path_sumber tidak ada domain yang diblokir. Setiap akhiran
+    domain dicari dengan binary search (sekitar log2(jumlah aturan) perbandingan),
+    jadi satu pengecekan hanya butuh beberapa mikrodetik walau aturannya ratusan ribu.
+    """
+
+    def __init__(self, path_sumber=DOMAIN_DIBLOKIR, path_indeks=None):
+        self.path_sumber = path_sumber
+        self.path_indeks = path_indeks or os.path.splitext(path_sumber)[0] + ".idx"
+        self._file = None
+        self._mm = None
+
+        if not os.path.exists(path_sumber):
+            # Indeks sisa dari daftar yang sudah dihapus tidak boleh tetap dipakai
+            logging.warning(f"Blocklist {path_sumber} not found, email domains are not checked")
+            return
+        if not os.path.exists(self.path_indeks) or os.path.getmtime(self.path_indeks) < os.path.getmtime(path_sumber):
+            mulai = time.perf_counter()
+            jumlah = bangun_indeks(path_sumber, self.path_indeks)
+            logging.info(f"Built blocklist index {self.path_indeks} ({jumlah} rules) in {time.perf_counter() - mulai:.2f}s")
+
+        if os.path.exists(self.path_indeks) and os.path.getsize(self.path_indeks) > 0:
+            self._file = open(self.path_indeks, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _ada(self, kunci):
+        """Binary search baris yang sama persis dengan kunci (bytes) di file indeks"""
+        mm = self._mm
+        kiri, kanan = 0, len(mm)
+        while kiri < kanan:
+            tengah = (kiri + kanan) // 2
+            # Mundur ke awal baris yang memuat posisi tengah
+            awal = mm.rfind(b"\n", kiri, tengah) + 1 or kiri
+            akhir = mm.find(b"\n", awal)
+            if akhir < 0:
+                akhir = len(mm)
+            baris = mm[awal:akhir]
+            if baris == kunci:
+                return True
+            if baris < kunci:
+                kiri = akhir + 1
+            else:
+                kanan = awal
+        return False
+
+    def aturan_cocok(self, domain):
+        """Aturan (dalam bentuk daftar sumber) yang memblokir domain, atau None"""
+        if self._mm is None:
+            return None
+        domain = normalisasi_domain(domain)
+        if not domain:
+            return None
+        label = domain.split(".")
+        label.reverse()
+        # Cek setiap akhiran dari yang terpendek: com, com.example, com.example.mail, ...
+        for i in range(1, len(label) + 1):
+            akhiran = ".".join(label[:i])
+            if self._ada(akhiran.encode("ascii")):
+                return balik_label(akhiran)
+            if i < len(label) and self._ada(f"{akhiran}.{WILDCARD}".encode("ascii")):
+                return "*." + balik_label(akhiran)
+        return None
+
+    def diblokir(self, domain):
+        """True jika domain (atau salah satu domain induknya) ada di daftar blokir"""
+        return self.aturan_cocok(domain) is not None
+
+    def tutup(self):
+        """Tutup mmap dan file indeks"""
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+            self._mm = self._file = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cek domain email terhadap daftar blokir")
+    parser.add_argument("domain", nargs="*", help="Domain atau alamat email yang dicek")
+    parser.add_argument("--daftar", default=DOMAIN_DIBLOKIR)
+    parser.add_argument("--bangun", action="store_true", help="Bangun ulang file indeks walau tidak ada perubahan")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.bangun:
+        path_indeks = os.path.splitext(args.daftar)[0] + ".idx"
+        print(f"{bangun_indeks(args.daftar, path_indeks)} aturan ditulis ke {path_indeks}")
+    daftar = DaftarBlokirDomain(args.daftar)
+    try:
+        for domain in args.domain:
+            aturan = daftar.aturan_cocok(domain.rpartition("@")[2])
+            print(f"{domain}: {'diblokir (' + aturan + ')' if aturan else 'boleh'}")
+    finally:
+        daftar.tutup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
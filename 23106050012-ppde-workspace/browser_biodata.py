@@ -0,0 +1,487 @@
+import logging
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+
+from foto_biodata import CacheThumbnail, UKURAN_THUMBNAIL
+from penyimpanan_biodata import buka_koneksi
+
+# Kolom yang ditampilkan: (nama kolom database, judul, lebar)
+KOLOM_BROWSER = [
+    ("nim", "NIM", 110),
+    ("nama", "Nama", 170),
+    ("jurusan", "Jurusan", 120),
+    ("jenis_kelamin", "Jenis Kelamin", 100),
+    ("email", "Email", 170),
+]
+
+# Kolom yang bisa diurutkan (semuanya punya indeks di database)
+URUTAN_KOLOM = {
+    "id": "id",
+    "nim": "nim",
+    "nama": "nama COLLATE NOCASE",
+    "jurusan": "jurusan",
+    "email": "email",
+}
+
+# Kolom urut yang bisa berisi NULL; perbandingan kolom > ? tidak berlaku untuk NULL
+KOLOM_BISA_NULL = {"jurusan", "email"}
+
+# Perpindahan sejauh ini (baris) dilayani keyset dari halaman yang sedang tampil;
+# lompatan lebih jauh (drag scrollbar) memakai OFFSET
+BATAS_KEYSET = 1000
+
+# Baris setinggi thumbnail foto
+TINGGI_BARIS = UKURAN_THUMBNAIL + 4
+TINGGI_HEADING = 25
+
+
+class _PermintaanHalaman:
+    """Salinan status tampilan untuk mengambil satu halaman di thread pekerja
+
+    Semua query keyset/OFFSET ada di sini, jadi thread pekerja tidak membaca status
+    widget yang bisa berubah di thread Tk selama query berjalan.
+    """
+
+    __slots__ = (
+        "versi", "offset", "jumlah", "kondisi", "params", "kolom_urut", "urut_turun",
+        "offset_dimuat", "kunci_awal", "kunci_akhir", "jumlah_dimuat", "keyset_aman",
+    )
+
+    def __init__(self, browser, kondisi, params):
+        self.versi = browser._versi_tampilan
+        self.offset = browser.offset
+        self.jumlah = browser.baris_terlihat
+        self.kondisi = kondisi
+        self.params = params
+        self.kolom_urut = browser.kolom_urut
+        self.urut_turun = browser.urut_turun
+        self.offset_dimuat = browser._offset_dimuat
+        self.kunci_awal = browser._kunci_awal
+        self.kunci_akhir = browser._kunci_akhir
+        self.jumlah_dimuat = browser._jumlah_dimuat
+        self.keyset_aman = True
+
+    def _urutan(self, maju=True):
+        """(ekspresi kolom urut, arah SQL, operator "sesudah") untuk arah tampilan atau kebalikannya"""
+        naik = self.urut_turun != maju
+        return URUTAN_KOLOM[self.kolom_urut], ("ASC" if naik else "DESC"), (">" if naik else "<")
+
+    def _query(self, conn, kondisi, params, maju=True, limit=1, offset=0, kolom="*"):
+        ekspresi, arah, _ = self._urutan(maju)
+        where = f"WHERE {' AND '.join(kondisi)}" if kondisi else ""
+        return conn.execute(
+            f"SELECT {kolom} FROM biodata {where} ORDER BY {ekspresi} {arah}, id {arah} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ).fetchall()
+
+    def _query_sesudah(self, conn, kondisi, params, kunci, inklusif=False, maju=True, limit=1, offset=0, kolom="*"):
+        """Seperti _query, tetapi hanya baris sesudah kunci (nilai kolom urut, id) dalam arah itu
+
+        Row value (kolom, id) > (?, ?) tidak memakai rowid di indeks kolom (dan tidak memakai
+        indeks sama sekali dengan COLLATE NOCASE), jadi dipecah menjadi dua range scan
+        indeks: sisa baris dengan nilai yang sama (kolom = ? AND id > ?), lalu nilai sesudahnya.
+        """
+        ekspresi, arah, sesudah = self._urutan(maju)
+        nilai, id_kunci = kunci
+        banding_id = sesudah + ("=" if inklusif else "")
+        if self.kolom_urut == "id":
+            return self._query(conn, kondisi + [f"id {banding_id} ?"], params + [id_kunci], maju, limit, offset, kolom)
+
+        def where(tambahan):
+            return "WHERE " + " AND ".join(kondisi + [tambahan])
+
+        batas = limit + offset
+        return conn.execute(
+            f"SELECT * FROM ("
+            f"SELECT * FROM (SELECT {kolom} FROM biodata {where(f'{ekspresi} = ? AND id {banding_id} ?')} "
+            f"ORDER BY id {arah} LIMIT ?) "
+            f"UNION ALL "
+            f"SELECT * FROM (SELECT {kolom} FROM biodata {where(f'{ekspresi} {sesudah} ?')} "
+            f"ORDER BY {ekspresi} {arah}, id {arah} LIMIT ?)"
+            f") ORDER BY {ekspresi} {arah}, id {arah} LIMIT ? OFFSET ?",
+            params + [nilai, id_kunci, batas] + params + [nilai, batas, limit, offset]
+        ).fetchall()
+
+    def ambil(self, conn):
+        """Baris untuk offset: keyset dari halaman yang tampil jika dekat, selain itu OFFSET"""
+        # Kolom urut yang berisi NULL dipaging dengan OFFSET (dicek lewat indeks, cepat)
+        self.keyset_aman = self.kolom_urut not in KOLOM_BISA_NULL or conn.execute(
+            f"SELECT 1 FROM biodata WHERE {self.kolom_urut} IS NULL LIMIT 1"
+        ).fetchone() is None
+
+        kondisi, params = self.kondisi, self.params
+        kolom = "id, foto, " + ", ".join(kolom for kolom, _, _ in KOLOM_BROWSER)
+        n = self.jumlah
+
+        delta = None if self.offset_dimuat is None else self.offset - self.offset_dimuat
+        if self.offset == 0:
+            return self._query(conn, kondisi, params, limit=n, kolom=kolom)
+        if delta is None or not self.keyset_aman or abs(delta) > BATAS_KEYSET:
+            return self._query(conn, kondisi, params, limit=n, offset=self.offset, kolom=kolom)
+
+        if delta == 0:
+            # Muat ulang di tempat (data bertambah): mulai dari baris pertama yang sama
+            return self._query_sesudah(conn, kondisi, params, self.kunci_awal, inklusif=True, limit=n, kolom=kolom)
+        if delta > 0:
+            # Maju: lewati baris sesudah baris terakhir (atau pertama) halaman yang tampil
+            if delta >= self.jumlah_dimuat:
+                kunci, lewati = self.kunci_akhir, delta - self.jumlah_dimuat
+            else:
+                kunci, lewati = self.kunci_awal, delta - 1
+            return self._query_sesudah(conn, kondisi, params, kunci, limit=n, offset=lewati, kolom=kolom)
+
+        # Mundur: cari baris pertama halaman baru dari arah sebaliknya, lalu muat maju dari situ
+        awal = self._query_sesudah(
+            conn, kondisi, params, self.kunci_awal, maju=False, offset=-delta - 1, kolom=f"{self.kolom_urut}, id"
+        )
+        if not awal:
+            return self._query(conn, kondisi, params, limit=n, offset=self.offset, kolom=kolom)
+        return self._query_sesudah(conn, kondisi, params, tuple(awal[0]), inklusif=True, limit=n, kolom=kolom)
+
+
+class BrowserBiodata(tk.Frame):
+    """Tampilan daftar biodata tersimpan dengan paging lazy (hanya baris yang terlihat dimuat)
+
+    Scroll dan pindah halaman memakai keyset paging dari kunci (kolom urut, id) baris
+    pertama/terakhir yang tampil, jadi biayanya tidak bergantung pada posisi di tabel.
+    OFFSET hanya dipakai untuk lompatan jauh lewat scrollbar. Halaman dan jumlah baris
+    (COUNT) diambil di thread pekerja dengan koneksi sendiri, jadi filter teks yang
+    berat pada tabel besar tidak membekukan tampilan.
+    """
+
+    def __init__(self, master, penyimpanan, kembali=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.penyimpanan = penyimpanan
+
+        # Status tampilan: posisi baris teratas, jumlah baris terlihat, total baris hasil filter
+        self.offset = 0
+        self.baris_terlihat = 20
+        self.total = None
+        self.kolom_urut = "id"
+        self.urut_turun = False
+        self._job_filter = None
+        self._job_muat = None
+
+        # Halaman yang sedang tampil: offset-nya serta kunci baris pertama dan terakhir
+        self._offset_dimuat = None
+        self._kunci_awal = None
+        self._kunci_akhir = None
+        self._jumlah_dimuat = 0
+        # Naik setiap urutan/filter berubah; halaman dari versi lama tidak dipasang
+        self._versi_tampilan = 0
+        self._halaman_berjalan = None
+        self._muat_lagi = False
+
+        # Halaman dan COUNT(*) di satu thread pekerja; hitungan yang sudah basi (versi lama) diabaikan
+        self._pekerja = ThreadPoolExecutor(max_workers=1)
+        self._conn_pekerja = None
+        self._versi_hitung = 0
+
+        # Thumbnail foto dimuat di latar belakang dan disimpan di cache LRU
+        self.cache_foto = CacheThumbnail(self)
+
+        self.var_filter = tk.StringVar()
+        self.var_filter.trace_add("write", self._filter_berubah)
+
+        self._buat_interface(kembali)
+
+    def _buat_interface(self, kembali):
+        bg = self.cget("bg")
+
+        # Baris atas: judul, filter dan tombol kembali
+        frame_atas = tk.Frame(self, bg=bg)
+        frame_atas.pack(fill=tk.X, pady=(0, 10))
+
+        tk.Label(
+            frame_atas,
+            text="DATA TERSIMPAN",
+            font=("Arial", 16, "bold"),
+            bg=bg
+        ).pack(side=tk.LEFT)
+
+        if kembali is not None:
+            tk.Button(
+                frame_atas,
+                text="Kembali ke Form",
+                font=("Arial", 10),
+                command=kembali
+            ).pack(side=tk.RIGHT)
+
+        frame_filter = tk.Frame(self, bg=bg)
+        frame_filter.pack(fill=tk.X, pady=(0, 5))
+
+        tk.Label(
+            frame_filter,
+            text="Cari (NIM / nama / alamat):",
+            font=("Arial", 11),
+            bg=bg
+        ).pack(side=tk.LEFT)
+
+        self.entry_filter = tk.Entry(frame_filter, font=("Arial", 11), textvariable=self.var_filter)
+        self.entry_filter.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        # Treeview dengan scrollbar "virtual": posisi scrollbar dihitung dari offset/total
+        frame_tabel = tk.Frame(self, bg=bg)
+        frame_tabel.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Style(self).configure("Biodata.Treeview", rowheight=TINGGI_BARIS)
+        self.tree = ttk.Treeview(
+            frame_tabel,
+            columns=[kolom for kolom, _, _ in KOLOM_BROWSER],
+            show="tree headings",
+            selectmode="browse",
+            style="Biodata.Treeview"
+        )
+        # Kolom #0 untuk thumbnail foto
+        self.tree.heading("#0", text="Foto")
+        self.tree.column("#0", width=UKURAN_THUMBNAIL + 24, stretch=False)
+        for kolom, judul, lebar in KOLOM_BROWSER:
+            if kolom in URUTAN_KOLOM:
+                self.tree.heading(kolom, text=judul, command=lambda k=kolom: self.urutkan(k))
+            else:
+                self.tree.heading(kolom, text=judul)
+            self.tree.column(kolom, width=lebar, anchor="w")
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.scrollbar = tk.Scrollbar(frame_tabel, command=self._scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.label_status = tk.Label(self, text="", font=("Arial", 10, "italic"), bg=bg, anchor="w")
+        self.label_status.pack(fill=tk.X, pady=(5, 0))
+
+        # Event bindings untuk resize dan scroll mouse/keyboard
+        self.tree.bind("<Configure>", self._ukuran_berubah)
+        self.tree.bind("<MouseWheel>", lambda e: self._geser(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self._geser(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self._geser(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self._geser(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self._geser(1, "pages"))
+
+    def _kondisi_filter(self):
+        """Buat kondisi WHERE dari teks filter (semuanya memakai indeks), tanpa kata WHERE"""
+        teks = self.var_filter.get().strip()
+        if not teks:
+            return [], []
+        if teks.isdigit():
+            # Awalan NIM: range scan pada indeks NIM
+            return ["nim >= ? AND nim < ?"], [teks, teks + "\uffff"]
+        # Kata/awalan kata pada nama dan alamat: indeks teks lengkap (FTS5)
+        query = self.penyimpanan.query_teks(teks)
+        if query is None:
+            return [], []
+        return ["id IN (SELECT rowid FROM biodata_fts WHERE biodata_fts MATCH ?)"], [query]
+
+    def _lupakan_halaman(self):
+        """Halaman berikutnya dimuat dari awal/OFFSET, bukan dari kunci halaman lama"""
+        self._offset_dimuat = None
+        self._kunci_awal = self._kunci_akhir = None
+        self._jumlah_dimuat = 0
+        self._versi_tampilan += 1
+
+    def refresh(self):
+        """Hitung ulang jumlah baris dan muat ulang halaman yang sedang terlihat (di latar belakang)"""
+        self._hitung_ulang()
+        self._muat_halaman()
+
+    def data_bertambah(self, id_awal, id_akhir):
+        """Record baru dengan id id_awal..id_akhir: hitung hanya rentang itu lalu muat ulang halaman"""
+        if self.total is None:
+            # Jumlah total masih dihitung (mungkin sebelum record ini ada): hitung ulang semuanya
+            self._hitung_ulang()
+        else:
+            kondisi, params = self._kondisi_filter()
+            kondisi = kondisi + ["id BETWEEN ? AND ?"]
+            future = self._pekerja.submit(
+                self._hitung, f"SELECT COUNT(*) FROM biodata WHERE {' AND '.join(kondisi)}",
+                params + [id_awal, id_akhir]
+            )
+            self._cek_hitung(future, self._versi_hitung, tambahan=True)
+        self._jadwalkan_muat()
+
+    def _hitung_ulang(self):
+        """Mulai COUNT(*) hasil filter di thread pekerja"""
+        kondisi, params = self._kondisi_filter()
+        where = f"WHERE {' AND '.join(kondisi)}" if kondisi else ""
+        self._versi_hitung += 1
+        self.total = None
+        future = self._pekerja.submit(self._hitung, f"SELECT COUNT(*) FROM biodata {where}", params)
+        self._cek_hitung(future, self._versi_hitung)
+
+    def _koneksi(self):
+        # Dijalankan di thread pekerja; koneksinya hanya dipakai thread itu
+        if self._conn_pekerja is None:
+            self._conn_pekerja = buka_koneksi(self.penyimpanan.path)
+        return self._conn_pekerja
+
+    def _hitung(self, sql, params):
+        return self._koneksi().execute(sql, params).fetchone()[0]
+
+    def _cek_hitung(self, future, versi, tambahan=False):
+        """Pasang hasil COUNT: jumlah total, atau (tambahan=True) jumlah record baru yang ditambahkan"""
+        if not future.done():
+            self.after(20, self._cek_hitung, future, versi, tambahan)
+            return
+        if versi != self._versi_hitung or future.cancelled():
+            return
+        if future.exception() is not None:
+            logging.error(f"Counting browser rows failed: {future.exception()}")
+            if tambahan:
+                self._hitung_ulang()
+            return
+        if tambahan:
+            if self.total is None:
+                return
+            self.total += future.result()
+        else:
+            self.total = future.result()
+        if self.offset > max(0, self.total - self.baris_terlihat):
+            self._pindah_offset(self.offset)
+        else:
+            self._perbarui_status()
+
+    def _muat_halaman(self):
+        """Ambil baris yang terlihat di thread pekerja; dipasang ke Treeview oleh _cek_halaman"""
+        self._job_muat = None
+        if self._halaman_berjalan is not None:
+            # Satu pengambilan sekaligus: setelah yang berjalan selesai, ambil lagi dengan status terbaru
+            self._muat_lagi = True
+            return
+        kondisi, params = self._kondisi_filter()
+        permintaan = _PermintaanHalaman(self, kondisi, params)
+        self._halaman_berjalan = self._pekerja.submit(lambda: permintaan.ambil(self._koneksi()))
+        self._cek_halaman(self._halaman_berjalan, permintaan)
+
+    def _cek_halaman(self, future, permintaan):
+        if not future.done():
+            self.after(20, self._cek_halaman, future, permintaan)
+            return
+        self._halaman_berjalan = None
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logging.error(f"Loading browser page failed: {future.exception()}")
+        elif permintaan.versi == self._versi_tampilan:
+            # Halaman yang selesai tetap dipasang walau offset sudah berubah (sambil menggulir)
+            self._tampilkan_halaman(permintaan, future.result())
+        if self._muat_lagi:
+            self._muat_lagi = False
+            self._muat_halaman()
+
+    def _tampilkan_halaman(self, permintaan, rows):
+        """Pasang baris hasil permintaan ke dalam Treeview"""
+        if not rows and permintaan.offset > 0 and permintaan.offset_dimuat is not None:
+            # Melewati akhir data (jumlah baris belum/terlambat dihitung): tetap di halaman lama
+            if self.offset == permintaan.offset:
+                self.offset = permintaan.offset_dimuat
+            self._perbarui_status()
+            return
+
+        self._offset_dimuat = permintaan.offset
+        self._jumlah_dimuat = len(rows)
+        if rows:
+            self._kunci_awal = (rows[0][permintaan.kolom_urut], rows[0]["id"])
+            self._kunci_akhir = (rows[-1][permintaan.kolom_urut], rows[-1]["id"])
+        else:
+            self._kunci_awal = self._kunci_akhir = None
+            self._offset_dimuat = None
+
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            iid = str(row["id"])
+            gambar = None
+            if row["foto"]:
+                gambar = self.cache_foto.ambil(row["foto"], lambda g, iid=iid: self._foto_dimuat(iid, g))
+            self.tree.insert("", tk.END, iid=iid, values=list(row)[2:], image=gambar or "")
+        self._perbarui_status()
+
+    def _perbarui_status(self):
+        """Update posisi scrollbar dan teks status dari offset dan total"""
+        jumlah = self._jumlah_dimuat
+        if self.total:
+            awal = min(1.0, self.offset / self.total)
+            akhir = min(1.0, (self.offset + self.baris_terlihat) / self.total)
+        else:
+            awal, akhir = 0.0, 1.0
+        self.scrollbar.set(awal, akhir)
+        total = "..." if self.total is None else self.total
+        self.label_status.config(
+            text=f"Menampilkan {self.offset + 1 if jumlah else 0}-{self.offset + jumlah} dari {total} data"
+        )
+
+    def _foto_dimuat(self, iid, gambar):
+        """Pasang thumbnail yang baru selesai dimuat (jika barisnya masih terlihat)"""
+        if self.tree.exists(iid):
+            self.tree.item(iid, image=gambar)
+
+    def _jadwalkan_muat(self):
+        """Gabungkan beberapa event scroll menjadi satu query"""
+        if self._job_muat is None:
+            self._job_muat = self.after_idle(self._muat_halaman)
+
+    def _pindah_offset(self, offset):
+        # Selama jumlah baris dihitung ulang, batas bawah diketahui dari halaman yang kosong
+        if self.total is not None:
+            offset = min(offset, self.total - self.baris_terlihat)
+        offset = max(0, offset)
+        if offset != self.offset:
+            self.offset = offset
+            self._jadwalkan_muat()
+
+    def _geser(self, jumlah, satuan):
+        langkah = self.baris_terlihat if satuan == "pages" else 1
+        self._pindah_offset(self.offset + jumlah * langkah)
+        return "break"
+
+    def _scroll(self, *args):
+        """Command scrollbar: 'moveto fraksi' atau 'scroll n units/pages'"""
+        if args[0] == "moveto" and self.total is not None:
+            self._pindah_offset(int(float(args[1]) * self.total))
+        elif args[0] == "scroll":
+            self._geser(int(args[1]), args[2])
+
+    def _ukuran_berubah(self, event):
+        baris = max(1, (event.height - TINGGI_HEADING) // TINGGI_BARIS)
+        if baris != self.baris_terlihat:
+            self.baris_terlihat = baris
+            self._pindah_offset(self.offset)
+            self._jadwalkan_muat()
+
+    def urutkan(self, kolom):
+        """Urutkan berdasarkan kolom (klik kedua membalik arah)"""
+        if self.kolom_urut == kolom:
+            self.urut_turun = not self.urut_turun
+        else:
+            self.kolom_urut = kolom
+            self.urut_turun = False
+
+        for k, judul, _ in KOLOM_BROWSER:
+            tanda = (" ▼" if self.urut_turun else " ▲") if k == kolom else ""
+            self.tree.heading(k, text=judul + tanda)
+
+        self.offset = 0
+        self._lupakan_halaman()
+        self._muat_halaman()
+
+    def _filter_berubah(self, *args):
+        """Filter inkremental, ditunda sebentar agar tidak query di setiap ketukan"""
+        if self._job_filter is not None:
+            self.after_cancel(self._job_filter)
+        self._job_filter = self.after(150, self._terapkan_filter)
+
+    def _terapkan_filter(self):
+        self._job_filter = None
+        self.offset = 0
+        self.total = None
+        self._lupakan_halaman()
+        self.refresh()
+
+    def tutup(self):
+        """Hentikan thread pekerja dan cache thumbnail"""
+        def _tutup_koneksi():
+            if self._conn_pekerja is not None:
+                self._conn_pekerja.close()
+
+        self._pekerja.submit(_tutup_koneksi)
+        self._pekerja.shutdown(wait=False)
+        self.cache_foto.tutup()
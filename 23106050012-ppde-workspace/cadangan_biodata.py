@@ -0,0 +1,236 @@
+import argparse
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+from penyimpanan_biodata import PenyimpananBiodata, DB_FILE, tulis_atomik
+
+MANIFEST_FILE = "manifest.json"
+UKURAN_BLOK = 5000
+
+# Simpan hanya record terbaru per NIM (record lama dengan NIM yang sama sudah digantikan)
+SQL_PADATKAN = "DELETE FROM biodata WHERE id NOT IN (SELECT MAX(id) FROM biodata GROUP BY nim)"
+
+
+def snapshot(path_db, path_tujuan, padatkan=True):
+    """Salin database pada satu titik waktu yang konsisten, mengembalikan id terakhir di salinan
+
+    Salinan dibuat dengan backup API dari dalam satu transaksi baca. Dalam mode WAL,
+    pembaca tidak menghalangi penulis, jadi submit tetap berjalan selama snapshot dibuat.
+    Jika padatkan=True, record yang sudah digantikan dibuang dari salinan lalu di-VACUUM
+    (database asli tidak diubah).
+    """
+    folder = os.path.dirname(os.path.abspath(path_tujuan))
+    fd, path_sementara = tempfile.mkstemp(prefix=os.path.basename(path_tujuan) + ".", suffix=".tmp", dir=folder)
+    os.close(fd)
+    try:
+        sumber = sqlite3.connect(path_db, timeout=30, isolation_level=None)
+        tujuan = sqlite3.connect(path_sementara, isolation_level=None)
+        try:
+            # Transaksi baca: id terakhir dan isi salinan berasal dari snapshot yang sama
+            sumber.execute("BEGIN")
+            id_terakhir = sumber.execute("SELECT COALESCE(MAX(id), 0) FROM biodata").fetchone()[0]
+            sumber.backup(tujuan)
+            sumber.execute("COMMIT")
+
+            # Salinan tidak dipakai bersama, tidak perlu WAL
+            tujuan.execute("PRAGMA journal_mode=DELETE")
+            if padatkan:
+                tujuan.execute("BEGIN")
+                tujuan.execute(SQL_PADATKAN)
+                tujuan.execute("INSERT INTO biodata_fts(biodata_fts) VALUES ('optimize')")
+                tujuan.execute("INSERT INTO biodata_trigram(biodata_trigram) VALUES ('optimize')")
+                tujuan.execute("COMMIT")
+                tujuan.execute("VACUUM")
+            hasil_cek = tujuan.execute("PRAGMA quick_check").fetchone()[0]
+            if hasil_cek != "ok":
+                raise sqlite3.DatabaseError(f"Snapshot rusak: {hasil_cek}")
+        finally:
+            sumber.close()
+            tujuan.close()
+        os.replace(path_sementara, path_tujuan)
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+    return id_terakhir
+
+
+def _sha256(path):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        for blok in iter(lambda: file.read(1024 * 1024), b""):
+            hasher.update(blok)
+    return hasher.hexdigest()
+
+
+def baca_manifest(folder):
+    """Baca manifest cadangan di folder (None jika belum ada cadangan penuh)"""
+    path = os.path.join(folder, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _tulis_manifest(folder, manifest):
+    with tulis_atomik(os.path.join(folder, MANIFEST_FILE)) as file:
+        json.dump(manifest, file, indent=2)
+
+
+def cadangan_penuh(path_db, folder, padatkan=True):
+    """Buat snapshot baru sebagai dasar cadangan inkremental berikutnya"""
+    os.makedirs(folder, exist_ok=True)
+    nama = f"snapshot-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.db"
+    id_terakhir = snapshot(path_db, os.path.join(folder, nama), padatkan)
+
+    manifest_lama = baca_manifest(folder)
+    manifest = {
+        "snapshot": nama,
+        "sha256": _sha256(os.path.join(folder, nama)),
+        "id_terakhir": id_terakhir,
+        "segmen": [],
+    }
+    _tulis_manifest(folder, manifest)
+
+    # Snapshot dan segmen lama sudah tercakup oleh snapshot baru
+    if manifest_lama is not None:
+        for file in [manifest_lama["snapshot"]] + [s["file"] for s in manifest_lama["segmen"]]:
+            if file != nama and os.path.exists(os.path.join(folder, file)):
+                os.remove(os.path.join(folder, file))
+    return manifest
+
+
+def cadangan_inkremental(path_db, folder):
+    """Tulis record baru sejak cadangan terakhir ke satu segmen, mengembalikan jumlah record
+
+    Penyimpanan biodata hanya menambah record, jadi record dengan id lebih besar dari
+    id terakhir di manifest adalah semua perubahan sejak cadangan sebelumnya.
+    """
+    manifest = baca_manifest(folder)
+    if manifest is None:
+        raise FileNotFoundError(f"Belum ada cadangan penuh di '{folder}'.")
+
+    id_awal = manifest["id_terakhir"]
+    nama = f"segmen-{len(manifest['segmen']) + 1:05d}-{id_awal + 1}.jsonl.gz"
+    path = os.path.join(folder, nama)
+    path_sementara = path + ".tmp"
+
+    conn = sqlite3.connect(path_db, timeout=30)
+    conn.row_factory = sqlite3.Row
+    jumlah = 0
+    id_akhir = id_awal
+    try:
+        with gzip.open(path_sementara, "wt", encoding="utf-8") as file:
+            cursor = conn.execute("SELECT * FROM biodata WHERE id > ? ORDER BY id", (id_awal,))
+            while True:
+                rows = cursor.fetchmany(UKURAN_BLOK)
+                if not rows:
+                    break
+                for row in rows:
+                    file.write(json.dumps(dict(row), ensure_ascii=False) + "\n")
+                jumlah += len(rows)
+                id_akhir = rows[-1]["id"]
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+    finally:
+        conn.close()
+
+    if jumlah == 0:
+        os.remove(path_sementara)
+        return 0
+
+    os.replace(path_sementara, path)
+    manifest["segmen"].append({
+        "file": nama,
+        "id_awal": id_awal + 1,
+        "id_akhir": id_akhir,
+        "jumlah": jumlah,
+        "sha256": _sha256(path),
+    })
+    manifest["id_terakhir"] = id_akhir
+    _tulis_manifest(folder, manifest)
+    return jumlah
+
+
+def pulihkan(folder, path_tujuan):
+    """Pulihkan database dari snapshot ditambah semua segmen, mengembalikan jumlah record"""
+    manifest = baca_manifest(folder)
+    if manifest is None:
+        raise FileNotFoundError(f"Belum ada cadangan penuh di '{folder}'.")
+
+    path_snapshot = os.path.join(folder, manifest["snapshot"])
+    if _sha256(path_snapshot) != manifest["sha256"]:
+        raise ValueError(f"Checksum snapshot tidak cocok: {manifest['snapshot']}")
+    for segmen in manifest["segmen"]:
+        if _sha256(os.path.join(folder, segmen["file"])) != segmen["sha256"]:
+            raise ValueError(f"Checksum segmen tidak cocok: {segmen['file']}")
+
+    shutil.copyfile(path_snapshot, path_tujuan)
+    penyimpanan = PenyimpananBiodata(path_tujuan)
+    try:
+        kolom = [row["name"] for row in penyimpanan.conn.execute("PRAGMA table_info(biodata)")]
+        sql = f"INSERT INTO biodata ({', '.join(kolom)}) VALUES ({', '.join('?' * len(kolom))})"
+        for segmen in manifest["segmen"]:
+            with gzip.open(os.path.join(folder, segmen["file"]), "rt", encoding="utf-8") as file:
+                rows = (json.loads(baris) for baris in file)
+                with penyimpanan.conn:
+                    penyimpanan.conn.executemany(sql, ([row.get(k) for k in kolom] for row in rows))
+        return penyimpanan.jumlah()
+    finally:
+        penyimpanan.tutup()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot, pemadatan dan cadangan inkremental database biodata")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p_snapshot = sub.add_parser("snapshot", help="Salin database (konsisten, dipadatkan)")
+    p_snapshot.add_argument("tujuan")
+    p_snapshot.add_argument("--db", default=DB_FILE)
+    p_snapshot.add_argument("--tanpa-padat", action="store_true", help="Jangan buang record yang sudah digantikan")
+
+    p_penuh = sub.add_parser("penuh", help="Cadangan penuh (snapshot baru) ke folder")
+    p_penuh.add_argument("folder")
+    p_penuh.add_argument("--db", default=DB_FILE)
+    p_penuh.add_argument("--tanpa-padat", action="store_true")
+
+    p_inkremental = sub.add_parser("inkremental", help="Cadangkan record baru sejak cadangan terakhir")
+    p_inkremental.add_argument("folder")
+    p_inkremental.add_argument("--db", default=DB_FILE)
+
+    p_pulihkan = sub.add_parser("pulihkan", help="Pulihkan database dari folder cadangan")
+    p_pulihkan.add_argument("folder")
+    p_pulihkan.add_argument("tujuan")
+
+    args = parser.parse_args(argv)
+
+    if args.perintah == "snapshot":
+        id_terakhir = snapshot(args.db, args.tujuan, not args.tanpa_padat)
+        print(f"Snapshot sampai id {id_terakhir} ditulis ke '{args.tujuan}' "
+              f"({os.path.getsize(args.tujuan) / 1024:.0f} KB)")
+    elif args.perintah == "penuh":
+        manifest = cadangan_penuh(args.db, args.folder, not args.tanpa_padat)
+        print(f"Cadangan penuh '{manifest['snapshot']}' sampai id {manifest['id_terakhir']}")
+    elif args.perintah == "inkremental":
+        jumlah = cadangan_inkremental(args.db, args.folder)
+        print(f"{jumlah} record baru dicadangkan" if jumlah else "Tidak ada record baru")
+    elif args.perintah == "pulihkan":
+        if os.path.exists(args.tujuan):
+            print(f"'{args.tujuan}' sudah ada, pilih lokasi lain.")
+            return 1
+        jumlah = pulihkan(args.folder, args.tujuan)
+        print(f"{jumlah} record dipulihkan ke '{args.tujuan}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+import pytest
+
+from penyimpanan_biodata import KOLOM_DB, PenyimpananBiodata
+
+
+def _buat_record(nim, **isian):
+    record = {kolom: "x" for kolom in KOLOM_DB}
+    record.update(nama="Budi Santoso", nim=nim)
+    record.update(isian)
+    return record
+
+
+@pytest.fixture
+def buat_record():
+    """Record biodata minimal (tanpa validasi) dengan NIM tertentu"""
+    return _buat_record
+
+
+@pytest.fixture
+def penyimpanan(tmp_path):
+    """PenyimpananBiodata di database sementara"""
+    penyimpanan = PenyimpananBiodata(str(tmp_path / "biodata.db"))
+    yield penyimpanan
+    penyimpanan.tutup()
@@ -0,0 +1,342 @@
+import argparse
+import csv
+import itertools
+import logging
+import math
+import queue
+import re
+import sys
+import threading
+from collections import Counter
+
+from penyimpanan_biodata import PenyimpananBiodata, DB_FILE, tulis_atomik
+
+# Bobot skor duplikat: kemiripan nama (0..1) ditambah bonus tanggal lahir/telepon yang sama
+BOBOT_NAMA = 0.7
+BOBOT_TANGGAL = 0.3
+BOBOT_TELEPON = 0.4
+AMBANG = 0.65
+# Bonus tanggal lahir/telepon hanya dihitung jika nama minimal semirip ini, supaya
+# saudara kembar atau nomor keluarga yang sama tidak dianggap orang yang sama
+KEMIRIPAN_NAMA_MINIMAL = 0.4
+
+UKURAN_BLOK = 5000
+# Paling banyak kandidat per query indeks (trigram/tanggal lahir) di cari_mirip
+BATAS_KANDIDAT = 2000
+JUMLAH_MIRIP = 5
+
+# Penanda untuk menghentikan thread pemeriksa
+_BERHENTI = object()
+
+
+def normalisasi_nama(nama):
+    """Nama dalam huruf kecil dengan spasi dirapikan"""
+    return " ".join((nama or "").lower().split())
+
+
+def trigram(nama):
+    """Himpunan trigram (3 karakter berurutan) dari nama yang sudah dinormalisasi"""
+    return {nama[i:i + 3] for i in range(len(nama) - 2)}
+
+
+def normalisasi_telepon(telepon):
+    """Nomor telepon dalam bentuk 08..., apa pun penulisannya (+62, 62, spasi, tanda hubung)"""
+    angka = re.sub(r"\D", "", telepon or "")
+    if angka.startswith("62"):
+        angka = "0" + angka[2:]
+    return angka
+
+
+def varian_telepon(telepon):
+    """Penulisan nomor yang sama seperti yang mungkin tersimpan (08..., 628..., +628...)"""
+    angka = normalisasi_telepon(telepon)
+    if not angka:
+        return []
+    if not angka.startswith("0"):
+        return [angka]
+    return [angka, "62" + angka[1:], "+62" + angka[1:]]
+
+
+def kemiripan_nama(nama_a, nama_b, tri_a, tri_b):
+    """Koefisien Dice dari trigram kedua nama (0..1)"""
+    if not tri_a or not tri_b:
+        # Nama kurang dari 3 huruf: hanya dianggap mirip jika sama persis
+        return 1.0 if nama_a and nama_a == nama_b else 0.0
+    return 2 * len(tri_a & tri_b) / (len(tri_a) + len(tri_b))
+
+
+def ciri(record):
+    """Bagian record yang dibandingkan: (nama, trigram nama, tanggal lahir, telepon), sudah dinormalisasi"""
+    nama = normalisasi_nama(record["nama"])
+    return nama, trigram(nama), record["tanggal_lahir"] or "", normalisasi_telepon(record["telepon"])
+
+
+def skor_ciri(a, b):
+    """Skor dua ciri(...) record, mengembalikan (skor, kemiripan nama)"""
+    nama_a, tri_a, tanggal_a, telepon_a = a
+    nama_b, tri_b, tanggal_b, telepon_b = b
+    mirip = kemiripan_nama(nama_a, nama_b, tri_a, tri_b)
+    skor = BOBOT_NAMA * mirip
+    if mirip < KEMIRIPAN_NAMA_MINIMAL:
+        return skor, mirip
+    if tanggal_a and tanggal_a == tanggal_b:
+        skor += BOBOT_TANGGAL
+    if telepon_a and telepon_a == telepon_b:
+        skor += BOBOT_TELEPON
+    return min(skor, 1.0), mirip
+
+
+def skor_duplikat(a, b):
+    """Skor kemungkinan dua record (dict/Row) adalah orang yang sama, mengembalikan (skor, kemiripan nama)
+
+    Skor = kemiripan nama (Dice trigram) x BOBOT_NAMA, ditambah BOBOT_TANGGAL jika tanggal
+    lahir sama dan BOBOT_TELEPON jika nomor telepon sama (maksimum 1). Bonus hanya
+    dihitung jika kemiripan nama minimal KEMIRIPAN_NAMA_MINIMAL.
+    """
+    return skor_ciri(ciri(a), ciri(b))
+
+
+def batas_nama(bonus, ambang=AMBANG):
+    """Kemiripan nama minimum agar skor mencapai ambang jika bonus lain sudah didapat"""
+    if not bonus:
+        return ambang / BOBOT_NAMA
+    return max(KEMIRIPAN_NAMA_MINIMAL, (ambang - bonus) / BOBOT_NAMA)
+
+
+def irisan_minimum(jumlah, batas):
+    """Jumlah trigram bersama minimum agar Dice >= batas untuk nama dengan `jumlah` trigram
+
+    Dice = 2|irisan|/(a+b) dan b >= |irisan|, jadi |irisan| >= batas*a/(2-batas).
+    """
+    if batas <= 0:
+        return 0
+    return math.ceil(batas * jumlah / (2 - batas) - 1e-9)
+
+
+def panjang_awalan(jumlah, batas, k=1):
+    """Jumlah trigram terjarang yang pasti memuat minimal k trigram bersama (prefix filtering)
+
+    Jika dua nama berbagi minimal o trigram, k trigram bersama pertama (dalam urutan
+    global yang sama untuk semua nama) ada di a - o + k trigram pertama kedua nama.
+    """
+    return max(0, min(jumlah, jumlah - irisan_minimum(jumlah, batas) + k))
+
+
+def _kandidat_terbatas(rows, sumber):
+    if len(rows) >= BATAS_KANDIDAT:
+        logging.warning(f"Duplicate check: {sumber} candidates truncated at {BATAS_KANDIDAT}, matches may be missed")
+    return rows
+
+
+def cari_mirip(penyimpanan, record, batas=JUMLAH_MIRIP, ambang=AMBANG):
+    """Cari record tersimpan yang kemungkinan orang yang sama, mengembalikan [(skor, kemiripan, row)]
+
+    Kandidat diambil lewat indeks (trigram nama terjarang, tanggal lahir, telepon)
+    lalu diberi skor; record dengan NIM yang sama tidak ikut (sudah ditangani cek NIM).
+    Kandidat trigram diurutkan dari yang paling relevan, jadi jika lebih dari
+    BATAS_KANDIDAT yang terpotong adalah yang paling sedikit berbagi trigram (dicatat di log).
+    """
+    ciri_record = ciri({"nama": record.get("nama"), "tanggal_lahir": record.get("tanggal_lahir"),
+                        "telepon": record.get("telepon")})
+    nama, tri, _, _ = ciri_record
+    kandidat = {}
+
+    # Nama saja harus sangat mirip: cukup cari lewat trigram yang paling jarang
+    batas_sendiri = batas_nama(0, ambang)
+    if tri and batas_sendiri <= 1:
+        frekuensi = penyimpanan.frekuensi_trigram(tri)
+        urut = sorted(tri, key=lambda t: (frekuensi.get(t, 0), t))
+        awalan = urut[:panjang_awalan(len(urut), batas_sendiri)]
+        for row in _kandidat_terbatas(penyimpanan.cari_trigram(awalan, BATAS_KANDIDAT), "name"):
+            kandidat[row["id"]] = row
+    elif not tri and nama:
+        # Nama kurang dari 3 huruf tidak punya trigram: cari yang sama persis
+        for row in _kandidat_terbatas(penyimpanan.cari_nama(nama, BATAS_KANDIDAT), "name"):
+            kandidat[row["id"]] = row
+
+    if record.get("tanggal_lahir"):
+        rows = penyimpanan.cari_tanggal_lahir(record["tanggal_lahir"], BATAS_KANDIDAT)
+        for row in _kandidat_terbatas(rows, "birth date"):
+            kandidat[row["id"]] = row
+    varian = varian_telepon(record.get("telepon"))
+    if varian:
+        for row in penyimpanan.cari_telepon(varian):
+            kandidat[row["id"]] = row
+
+    hasil = []
+    for row in kandidat.values():
+        if row["nim"] == record.get("nim"):
+            continue
+        skor, mirip = skor_ciri(ciri_record, ciri(row))
+        if skor >= ambang:
+            hasil.append((skor, mirip, row))
+    hasil.sort(key=lambda h: (-h[0], -h[1], h[2]["id"]))
+    return hasil[:batas]
+
+
+class PemeriksaDuplikat:
+    """Thread latar belakang untuk cari_mirip saat submit (koneksi database sendiri)"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.antrian = queue.Queue()
+        self.hasil = queue.Queue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def periksa(self, record, callback):
+        """Periksa record; callback(daftar_mirip, error) dipanggil lewat proses_hasil()"""
+        self.antrian.put((record, callback))
+
+    def _loop(self):
+        # Koneksi SQLite harus dibuat di thread yang memakainya
+        penyimpanan = PenyimpananBiodata(self.path)
+        try:
+            while True:
+                item = self.antrian.get()
+                if item is _BERHENTI:
+                    break
+                record, callback = item
+                try:
+                    self.hasil.put((callback, cari_mirip(penyimpanan, record), None))
+                except Exception as e:
+                    self.hasil.put((callback, None, e))
+        finally:
+            penyimpanan.tutup()
+
+    def proses_hasil(self):
+        """Jalankan callback untuk pemeriksaan yang sudah selesai (panggil dari thread UI)"""
+        while True:
+            try:
+                callback, mirip, error = self.hasil.get_nowait()
+            except queue.Empty:
+                break
+            callback(mirip, error)
+
+    def hentikan(self):
+        """Hentikan thread pemeriksa"""
+        self.antrian.put(_BERHENTI)
+
+
+def laporan_duplikat(penyimpanan, ambang=AMBANG):
+    """Cari semua pasangan record yang kemungkinan orang yang sama di seluruh arsip
+
+    Mengembalikan [(skor, kemiripan, row_a, row_b)] terurut dari skor tertinggi.
+    Tidak membandingkan semua pasangan: setiap record hanya dibandingkan dengan record
+    yang berbagi kunci blok, yaitu trigram terjarang dari namanya (prefix filtering):
+    pasangan trigram untuk nama saja, satu trigram bersama tanggal lahir, telepon, atau
+    telepon+tanggal lahir yang sama, dan nama pendek (tanpa trigram) yang sama. Panjang awalan
+    dihitung dari kemiripan nama minimum untuk masing-masing kunci, jadi tidak ada
+    pasangan di atas ambang yang terlewat.
+    """
+    conn = penyimpanan.conn
+    kolom = "id, nim, nama, tanggal_lahir, telepon"
+
+    # Tahap 1: frekuensi setiap trigram di seluruh arsip, untuk urutan "terjarang dulu"
+    frekuensi = Counter()
+    cursor = conn.execute("SELECT nama FROM biodata")
+    while True:
+        rows = cursor.fetchmany(UKURAN_BLOK)
+        if not rows:
+            break
+        for (nama,) in rows:
+            frekuensi.update(trigram(normalisasi_nama(nama)))
+
+    batas_sendiri = batas_nama(0, ambang)
+    batas_tanggal = batas_nama(BOBOT_TANGGAL, ambang)
+    batas_telepon = batas_nama(BOBOT_TELEPON, ambang)
+    batas_keduanya = batas_nama(BOBOT_TANGGAL + BOBOT_TELEPON, ambang)
+
+    # Tahap 2: setiap record mencari kandidat di indeks kunci blok record sebelumnya, lalu ditambahkan
+    indeks = {}
+    records = []
+    hasil = []
+    cursor = conn.execute(f"SELECT {kolom} FROM biodata ORDER BY id")
+    while True:
+        rows = cursor.fetchmany(UKURAN_BLOK)
+        if not rows:
+            break
+        for row in rows:
+            data = dict(row)
+            ciri_row = ciri(data)
+            nama, tri, tanggal, telepon = ciri_row
+            urut = sorted(tri, key=lambda t: (frekuensi[t], t))
+
+            kunci = []
+            if not tri:
+                # Nama kurang dari 3 huruf hanya mirip dengan nama yang sama persis
+                if nama:
+                    kunci.append(("s", nama))
+            elif batas_sendiri <= 1:
+                if irisan_minimum(len(urut), batas_sendiri) >= 2:
+                    # Nama saja harus hampir sama: pasangan trigram jauh lebih jarang dari satu trigram
+                    awalan = urut[:panjang_awalan(len(urut), batas_sendiri, 2)]
+                    kunci += [("n", t1, t2) for t1, t2 in itertools.combinations(awalan, 2)]
+                else:
+                    kunci += [("n", t) for t in urut[:panjang_awalan(len(urut), batas_sendiri)]]
+            if tanggal:
+                kunci += [("t", tanggal, t) for t in urut[:panjang_awalan(len(urut), batas_tanggal)]]
+            if telepon:
+                kunci += [("p", telepon, t) for t in urut[:panjang_awalan(len(urut), batas_telepon)]]
+            if tanggal and telepon:
+                kunci += [("pt", telepon, tanggal, t) for t in urut[:panjang_awalan(len(urut), batas_keduanya)]]
+
+            nomor = len(records)
+            kandidat = set()
+            for k in kunci:
+                daftar = indeks.get(k)
+                if daftar is None:
+                    indeks[k] = [nomor]
+                else:
+                    kandidat.update(daftar)
+                    daftar.append(nomor)
+
+            for lain in kandidat:
+                data_lain, ciri_lain = records[lain]
+                if data_lain["nim"] == data["nim"]:
+                    continue
+                skor, mirip = skor_ciri(ciri_lain, ciri_row)
+                if skor >= ambang:
+                    hasil.append((skor, mirip, data_lain, data))
+            records.append((data, ciri_row))
+
+    hasil.sort(key=lambda h: (-h[0], -h[1], h[2]["id"], h[3]["id"]))
+    return hasil
+
+
+def tulis_laporan(hasil, path):
+    """Tulis laporan duplikat ke file CSV"""
+    with tulis_atomik(path) as file:
+        writer = csv.writer(file)
+        writer.writerow([
+            "Skor", "Kemiripan Nama",
+            "NIM 1", "Nama 1", "Tanggal Lahir 1", "Telepon 1",
+            "NIM 2", "Nama 2", "Tanggal Lahir 2", "Telepon 2",
+        ])
+        for skor, mirip, a, b in hasil:
+            writer.writerow([
+                f"{skor:.2f}", f"{mirip:.2f}",
+                a["nim"], a["nama"], a["tanggal_lahir"], a["telepon"],
+                b["nim"], b["nama"], b["tanggal_lahir"], b["telepon"],
+            ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Laporan kemungkinan data ganda (nama mirip, tanggal lahir, telepon)")
+    parser.add_argument("tujuan", help="File CSV laporan")
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--ambang", type=float, default=AMBANG, help=f"Skor minimum (default {AMBANG})")
+    args = parser.parse_args(argv)
+
+    penyimpanan = PenyimpananBiodata(args.db)
+    try:
+        hasil = laporan_duplikat(penyimpanan, args.ambang)
+    finally:
+        penyimpanan.tutup()
+    tulis_laporan(hasil, args.tujuan)
+    print(f"{len(hasil)} pasangan kemungkinan duplikat ditulis ke '{args.tujuan}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
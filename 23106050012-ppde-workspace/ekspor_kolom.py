@@ -0,0 +1,112 @@
+import argparse
+import os
+import sys
+import tempfile
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow opsional: hanya dibutuhkan untuk ekspor Parquet
+    pa = None
+
+from penyimpanan_biodata import PenyimpananBiodata, KOLOM_DB, DB_FILE
+
+ADA_PYARROW = pa is not None
+
+PARQUET_FILE = "biodata.parquet"
+UKURAN_ROW_GROUP = 50_000
+KOMPRESI = "zstd"
+
+# Kolom dengan sedikit nilai berbeda: disimpan sebagai dictionary (kategori)
+KOLOM_DICTIONARY = ["jurusan", "jenis_kelamin", "diinput_oleh"]
+KOLOM_EKSPOR = ["id"] + KOLOM_DB + ["foto", "diinput_oleh", "waktu_input"]
+
+
+def _skema():
+    kolom = []
+    for nama in KOLOM_EKSPOR:
+        if nama == "id":
+            tipe = pa.int64()
+        elif nama == "waktu_input":
+            tipe = pa.timestamp("s")
+        elif nama in KOLOM_DICTIONARY:
+            tipe = pa.dictionary(pa.int32(), pa.string())
+        else:
+            tipe = pa.string()
+        kolom.append(pa.field(nama, tipe))
+    return pa.schema(kolom)
+
+
+def _batch(rows, skema):
+    """Ubah satu blok baris SQLite menjadi RecordBatch Arrow"""
+    kolom = list(zip(*rows))
+    arrays = []
+    for i, field in enumerate(skema):
+        if field.name == "waktu_input":
+            teks = pa.array(kolom[i], pa.string())
+            arrays.append(pc.strptime(teks, format="%Y-%m-%d %H:%M:%S", unit="s", error_is_null=True))
+        elif pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(kolom[i], pa.string()).dictionary_encode().cast(field.type))
+        else:
+            arrays.append(pa.array(kolom[i], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=skema)
+
+
+def ekspor_parquet(penyimpanan, path=PARQUET_FILE, ukuran_row_group=UKURAN_ROW_GROUP, kompresi=KOMPRESI):
+    """Ekspor semua record ke file Parquet secara streaming, mengembalikan jumlah baris
+
+    Record dibaca per blok (satu row group per blok), jadi memori yang dipakai tidak
+    bergantung pada jumlah data.
+    """
+    if not ADA_PYARROW:
+        raise RuntimeError("Ekspor Parquet membutuhkan pyarrow (pip install pyarrow).")
+
+    skema = _skema()
+    jumlah = 0
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, path_sementara = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=folder)
+    os.close(fd)
+    try:
+        with pq.ParquetWriter(
+            path_sementara, skema, compression=kompresi, use_dictionary=KOLOM_DICTIONARY
+        ) as writer:
+            cursor = penyimpanan.conn.execute("SELECT " + ", ".join(KOLOM_EKSPOR) + " FROM biodata ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(ukuran_row_group)
+                if not rows:
+                    break
+                writer.write_batch(_batch(rows, skema))
+                jumlah += len(rows)
+        os.replace(path_sementara, path)
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+    return jumlah
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor biodata ke format kolom terkompresi (Parquet)")
+    parser.add_argument("keluar", nargs="?", default=PARQUET_FILE)
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--row-group", type=int, default=UKURAN_ROW_GROUP, help="Jumlah baris per row group")
+    parser.add_argument("--kompresi", default=KOMPRESI, help="zstd, snappy, gzip, atau none")
+    args = parser.parse_args(argv)
+
+    if not ADA_PYARROW:
+        print("Ekspor Parquet membutuhkan pyarrow (pip install pyarrow).")
+        return 1
+
+    penyimpanan = PenyimpananBiodata(args.db)
+    try:
+        jumlah = ekspor_parquet(penyimpanan, args.keluar, args.row_group, args.kompresi)
+    finally:
+        penyimpanan.tutup()
+    print(f"{jumlah} baris diekspor ke '{args.keluar}' ({os.path.getsize(args.keluar) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+import base64
+import collections
+import hashlib
+import operator
+import os
+import queue
+import struct
+import tempfile
+import tkinter as tk
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate, repeat
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    # Pillow opsional: tanpa Pillow hanya PNG 8-bit RGB/RGBA yang didukung (di-decode sendiri di worker)
+    Image = None
+
+ADA_PILLOW = Image is not None
+
+FOTO_DIR = "foto"
+UKURAN_THUMBNAIL = 48
+UKURAN_BLOK = 1024 * 1024
+
+# Tanda awal file (magic bytes) untuk format yang diterima
+TANDA_PNG = b"\x89PNG\r\n\x1a\n"
+FORMAT_FOTO = {
+    TANDA_PNG: "PNG",
+    b"\xff\xd8\xff": "JPEG",
+}
+
+# Jumlah kanal per color type PNG yang bisa di-decode tanpa Pillow (2 RGB, 6 RGBA)
+KANAL_PNG = {2: 3, 6: 4}
+
+
+def path_asli(hash_foto, folder=FOTO_DIR):
+    """Lokasi file foto asli (nama file = hash SHA-256 isinya)"""
+    return os.path.join(folder, hash_foto[:2], hash_foto)
+
+
+def path_thumbnail(hash_foto, folder=FOTO_DIR):
+    """Lokasi thumbnail PNG dari foto"""
+    return os.path.join(folder, "thumb", hash_foto[:2], hash_foto + ".png")
+
+
+def deteksi_format(path):
+    """Kenali format foto dari isi file, bukan dari ekstensinya"""
+    with open(path, "rb") as file:
+        awal = file.read(8)
+    for tanda, format_foto in FORMAT_FOTO.items():
+        if awal.startswith(tanda):
+            return format_foto
+    raise ValueError("File foto harus berformat JPEG atau PNG.")
+
+
+def _ganti_atomik(path_sementara, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(path_sementara, path)
+
+
+def _salin_dengan_hash(path, folder):
+    """Salin file ke folder foto sambil menghitung hash-nya (satu kali baca per blok)"""
+    os.makedirs(folder, exist_ok=True)
+    hasher = hashlib.sha256()
+    fd, path_sementara = tempfile.mkstemp(suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as tujuan, open(path, "rb") as sumber:
+            for blok in iter(lambda: sumber.read(UKURAN_BLOK), b""):
+                hasher.update(blok)
+                tujuan.write(blok)
+        hash_foto = hasher.hexdigest()
+        path_tujuan = path_asli(hash_foto, folder)
+        if os.path.exists(path_tujuan):
+            # Foto yang sama sudah pernah disimpan
+            os.remove(path_sementara)
+        else:
+            _ganti_atomik(path_sementara, path_tujuan)
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+    return hash_foto
+
+
+def _tulis_thumbnail_pillow(path, path_thumb):
+    with Image.open(path) as gambar:
+        # draft: decoder JPEG langsung memperkecil skala saat decode (jauh lebih cepat untuk foto besar)
+        gambar.draft("RGB", (UKURAN_THUMBNAIL * 2, UKURAN_THUMBNAIL * 2))
+        gambar = ImageOps.exif_transpose(gambar)
+        gambar.thumbnail((UKURAN_THUMBNAIL, UKURAN_THUMBNAIL))
+        if gambar.mode not in ("RGB", "RGBA"):
+            gambar = gambar.convert("RGBA")
+
+        folder = os.path.dirname(path_thumb)
+        os.makedirs(folder, exist_ok=True)
+        fd, path_sementara = tempfile.mkstemp(suffix=".tmp", dir=folder)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                gambar.save(file, "PNG")
+            os.replace(path_sementara, path_thumb)
+        except BaseException:
+            if os.path.exists(path_sementara):
+                os.remove(path_sementara)
+            raise
+
+
+def _tulis_thumbnail_tanpa_pillow(path, path_thumb):
+    lebar, tinggi, baris = decode_png_kecil(path)
+    data = b"".join(b"\x00" + b for b in baris)
+    png = TANDA_PNG + b"".join([
+        _chunk_png(b"IHDR", struct.pack(">IIBBBBB", lebar, tinggi, 8, 6, 0, 0, 0)),
+        _chunk_png(b"IDAT", zlib.compress(data)),
+        _chunk_png(b"IEND", b""),
+    ])
+
+    folder = os.path.dirname(path_thumb)
+    os.makedirs(folder, exist_ok=True)
+    fd, path_sementara = tempfile.mkstemp(suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(png)
+        os.replace(path_sementara, path_thumb)
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+
+
+def _chunk_png(jenis, isi):
+    return struct.pack(">I", len(isi)) + jenis + isi + struct.pack(">I", zlib.crc32(jenis + isi))
+
+
+def _baca_chunk_png(file):
+    """Iterasi (jenis, isi) chunk PNG satu per satu, tanpa membaca seluruh file"""
+    if file.read(8) != TANDA_PNG:
+        raise ValueError("File PNG tidak valid.")
+    while True:
+        kepala = file.read(8)
+        if len(kepala) < 8:
+            raise ValueError("File PNG terpotong.")
+        panjang, jenis = struct.unpack(">I4s", kepala)
+        isi = file.read(panjang)
+        file.read(4)  # CRC
+        if len(isi) < panjang:
+            raise ValueError("File PNG terpotong.")
+        yield jenis, isi
+        if jenis == b"IEND":
+            return
+
+
+def _baris_mentah(idat_pertama, chunk, panjang, jumlah):
+    """Baris (jenis filter, isi) dari data IDAT yang di-decompress bertahap
+
+    Hasil decompress dibatasi UKURAN_BLOK per langkah supaya PNG yang sangat mampat
+    tidak memenuhi memori.
+    """
+    def data_idat():
+        yield idat_pertama
+        for jenis, isi in chunk:
+            if jenis != b"IDAT":
+                return
+            yield isi
+
+    masukan = data_idat()
+    decompress = zlib.decompressobj()
+    sisa, posisi = b"", 0
+    for _ in range(jumlah):
+        while len(sisa) - posisi <= panjang:
+            data = decompress.unconsumed_tail or next(masukan, None)
+            if data is None:
+                raise ValueError("File PNG terpotong.")
+            sisa = sisa[posisi:] + decompress.decompress(data, UKURAN_BLOK)
+            posisi = 0
+        yield sisa[posisi], sisa[posisi + 1:posisi + panjang + 1]
+        posisi += panjang + 1
+
+
+def _unfilter(jenis_filter, baris, sebelum, bpp, mask_rendah):
+    """Kembalikan satu baris PNG yang di-filter ke nilai aslinya"""
+    if jenis_filter == 0:
+        return baris
+    if jenis_filter == 1:
+        # Sub: jumlah kumulatif per kanal, accumulate dan map berjalan di C
+        hasil = bytearray(len(baris))
+        for kanal in range(bpp):
+            hasil[kanal::bpp] = bytes(map(operator.and_, accumulate(baris[kanal::bpp]), repeat(255)))
+        return bytes(hasil)
+    if jenis_filter == 2:
+        # Up: jumlah per byte dengan satu penjumlahan bilangan besar; bit tertinggi tiap
+        # byte dipisah supaya carry tidak merambat ke byte sebelahnya
+        x, y = int.from_bytes(baris, "big"), int.from_bytes(sebelum, "big")
+        mask_tinggi = mask_rendah ^ ((1 << 8 * len(baris)) - 1)
+        hasil = ((x & mask_rendah) + (y & mask_rendah)) ^ ((x ^ y) & mask_tinggi)
+        return hasil.to_bytes(len(baris), "big")
+
+    if jenis_filter not in (3, 4):
+        raise ValueError("File PNG rusak (jenis filter tidak dikenal).")
+
+    # Average dan Paeth berurutan per byte, jadi tetap loop Python (bagian paling berat).
+    # Piksel pertama tidak punya tetangga kiri: keduanya jadi tambah nilai di atasnya.
+    hasil = bytearray(baris)
+    for i in range(bpp):
+        hasil[i] = (hasil[i] + (sebelum[i] >> 1 if jenis_filter == 3 else sebelum[i])) & 255
+    if jenis_filter == 3:
+        for i, atas in zip(range(bpp, len(hasil)), sebelum[bpp:]):
+            hasil[i] = (hasil[i] + ((hasil[i - bpp] + atas) >> 1)) & 255
+    else:
+        for i, atas, kiri_atas in zip(range(bpp, len(hasil)), sebelum[bpp:], sebelum):
+            kiri = hasil[i - bpp]
+            # |p - kiri|, |p - atas|, |p - kiri_atas| dengan p = kiri + atas - kiri_atas
+            pa = atas - kiri_atas if atas > kiri_atas else kiri_atas - atas
+            pb = kiri - kiri_atas if kiri > kiri_atas else kiri_atas - kiri
+            pc = kiri + atas - 2 * kiri_atas
+            if pc < 0:
+                pc = -pc
+            if pa <= pb and pa <= pc:
+                hasil[i] = (hasil[i] + kiri) & 255
+            elif pb <= pc:
+                hasil[i] = (hasil[i] + atas) & 255
+            else:
+                hasil[i] = (hasil[i] + kiri_atas) & 255
+    return bytes(hasil)
+
+
+def decode_png_kecil(path, ukuran=UKURAN_THUMBNAIL):
+    """Decode PNG sekaligus memperkecilnya ke paling besar ukuran x ukuran (berat, jalankan di thread worker)
+
+    Hanya PNG 8-bit RGB/RGBA tanpa interlace (format PNG yang paling umum untuk foto);
+    format lain butuh Pillow. Seperti subsample Tk, diambil setiap n piksel. Data
+    di-decompress bertahap, jadi memori tetap kecil walau fotonya besar.
+    Mengembalikan (lebar, tinggi, daftar baris RGBA).
+    """
+    with open(path, "rb") as file:
+        chunk = _baca_chunk_png(file)
+        jenis, isi = next(chunk)
+        if jenis != b"IHDR" or len(isi) != 13:
+            raise ValueError("File PNG tidak valid.")
+        lebar, tinggi, kedalaman, warna, _, _, interlace = struct.unpack(">IIBBBBB", isi)
+        if kedalaman != 8 or warna not in KANAL_PNG or interlace or not lebar or not tinggi:
+            raise ValueError("Tanpa Pillow hanya PNG 8-bit RGB/RGBA tanpa interlace yang didukung.")
+        bpp = KANAL_PNG[warna]
+
+        for jenis, isi in chunk:
+            if jenis == b"IDAT":
+                break
+        else:
+            raise ValueError("File PNG tidak berisi data gambar.")
+
+        faktor = max(1, -(-max(lebar, tinggi) // ukuran))
+        panjang = lebar * bpp
+        mask_rendah = int.from_bytes(b"\x7f" * panjang, "big")
+        sebelum = bytes(panjang)
+        hasil = []
+        for y, (jenis_filter, baris) in enumerate(_baris_mentah(isi, chunk, panjang, tinggi)):
+            baris = _unfilter(jenis_filter, baris, sebelum, bpp, mask_rendah)
+            sebelum = baris
+            if y % faktor:
+                continue
+            # Ambil setiap piksel ke-faktor; RGB diberi alpha penuh
+            piksel = [baris[x:x + bpp] for x in range(0, panjang, bpp * faktor)]
+            hasil.append(b"".join(piksel) if bpp == 4 else b"\xff".join(piksel) + b"\xff")
+
+    return len(hasil[0]) // 4, len(hasil), hasil
+
+
+def proses_foto(path, folder=FOTO_DIR):
+    """Simpan foto asli dan thumbnail-nya, mengembalikan hash foto (berat, jalankan di thread worker)"""
+    format_foto = deteksi_format(path)
+    if not ADA_PILLOW and format_foto != "PNG":
+        raise ValueError("Foto JPEG membutuhkan Pillow (pip install Pillow). Gunakan foto PNG.")
+
+    hash_foto = _salin_dengan_hash(path, folder)
+    path_thumb = path_thumbnail(hash_foto, folder)
+    if not os.path.exists(path_thumb):
+        # Tanpa Pillow PNG di-decode sendiri, tetap di thread worker: thread Tk hanya memuat thumbnail
+        tulis_thumbnail = _tulis_thumbnail_pillow if ADA_PILLOW else _tulis_thumbnail_tanpa_pillow
+        tulis_thumbnail(path_asli(hash_foto, folder), path_thumb)
+    return hash_foto
+
+
+class CacheThumbnail:
+    """Cache LRU untuk PhotoImage thumbnail; file thumbnail dibaca di thread worker
+
+    `ambil` tidak pernah menunggu disk: jika belum ada di cache, thumbnail dibaca di
+    latar belakang dan callback dipanggil di thread Tk setelah gambarnya siap.
+    """
+
+    def __init__(self, widget, folder=FOTO_DIR, kapasitas=300):
+        self.widget = widget
+        self.folder = folder
+        self.kapasitas = kapasitas
+        self.cache = collections.OrderedDict()
+        self.menunggu = {}
+        self.hasil = queue.Queue()
+        self._pekerja = ThreadPoolExecutor(max_workers=2)
+        self._job = None
+
+    def ambil(self, hash_foto, callback):
+        """Thumbnail dari cache, atau None lalu callback(gambar) setelah selesai dimuat"""
+        gambar = self.cache.get(hash_foto)
+        if gambar is not None:
+            self.cache.move_to_end(hash_foto)
+            return gambar
+
+        if hash_foto in self.menunggu:
+            self.menunggu[hash_foto].append(callback)
+            return None
+        self.menunggu[hash_foto] = [callback]
+        self._pekerja.submit(self._baca, hash_foto)
+        if self._job is None:
+            self._job = self.widget.after(20, self._proses_hasil)
+        return None
+
+    def _baca(self, hash_foto):
+        try:
+            with open(path_thumbnail(hash_foto, self.folder), "rb") as file:
+                data = base64.b64encode(file.read()).decode("ascii")
+        except OSError:
+            data = None
+        self.hasil.put((hash_foto, data))
+
+    def _proses_hasil(self):
+        """Ubah data thumbnail yang sudah dibaca menjadi PhotoImage (di thread Tk)"""
+        self._job = None
+        while True:
+            try:
+                hash_foto, data = self.hasil.get_nowait()
+            except queue.Empty:
+                break
+            callbacks = self.menunggu.pop(hash_foto, [])
+            if data is None:
+                continue
+
+            gambar = tk.PhotoImage(master=self.widget, data=data)
+            self.cache[hash_foto] = gambar
+            while len(self.cache) > self.kapasitas:
+                self.cache.popitem(last=False)
+            for callback in callbacks:
+                callback(gambar)
+
+        if self.menunggu:
+            self._job = self.widget.after(20, self._proses_hasil)
+
+    def tutup(self):
+        """Hentikan thread worker"""
+        self._pekerja.shutdown(wait=False, cancel_futures=True)
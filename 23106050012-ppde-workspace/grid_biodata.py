@@ -0,0 +1,381 @@
+import logging
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from pelengkap_otomatis import PelengkapOtomatis
+from penyimpanan_biodata import PenyimpananBiodata
+from validasi_biodata import kesalahan_field
+
+# Kolom grid: (field record, judul, lebar dalam karakter)
+KOLOM_GRID = [
+    ("nama", "Nama", 20),
+    ("nim", "NIM", 12),
+    ("jurusan", "Jurusan", 16),
+    ("alamat", "Alamat", 20),
+    ("jenis_kelamin", "Jenis Kelamin", 10),
+    ("email", "Email", 22),
+    ("telepon", "Telepon", 14),
+    ("tanggal_lahir", "Tgl Lahir", 11),
+]
+PILIHAN_JK = ("Laki-Laki", "Perempuan")
+
+BARIS_AWAL = 10
+BARIS_TAMBAHAN = 10
+WARNA_NORMAL = "white"
+WARNA_SALAH = "mistyrose"
+
+# Paling lama menunggu validasi sel sebelum Simpan Semua dibatalkan (detik)
+BATAS_TUNGGU_VALIDASI = 10.0
+
+# Penanda untuk menghentikan thread pemeriksa
+_BERHENTI = object()
+
+
+class PemeriksaBaris:
+    """Thread validasi latar belakang: aturan per field dan cek NIM di database"""
+
+    def __init__(self, path):
+        self.path = path
+        self.antrian = queue.Queue()
+        self.hasil = queue.Queue()
+        # Kesalahan yang menghentikan thread (misalnya database tidak bisa dibuka)
+        self.error = None
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def periksa(self, nomor, versi, record):
+        """Minta baris diperiksa; hasilnya (nomor, versi, kesalahan) masuk ke self.hasil"""
+        self.antrian.put((nomor, versi, record))
+
+    def _loop(self):
+        try:
+            # Koneksi SQLite harus dibuat di thread yang memakainya
+            penyimpanan = PenyimpananBiodata(self.path)
+        except Exception as e:
+            logging.error(f"Grid validation thread failed to start: {e}")
+            self.error = e
+            return
+        try:
+            while True:
+                item = self.antrian.get()
+                if item is _BERHENTI:
+                    break
+                nomor, versi, record = item
+                kesalahan = kesalahan_field(record)
+                if "nim" not in kesalahan:
+                    try:
+                        if penyimpanan.cari_nim(record["nim"]) is not None:
+                            kesalahan["nim"] = "NIM sudah tersimpan!"
+                    except Exception as e:
+                        # Baris tetap ditandai salah agar tidak tersimpan tanpa cek NIM
+                        logging.error(f"Grid NIM check failed for row {nomor + 1}: {e}")
+                        kesalahan["nim"] = f"NIM gagal diperiksa: {e}"
+                self.hasil.put((nomor, versi, kesalahan))
+        finally:
+            penyimpanan.tutup()
+
+    def berjalan(self):
+        """Thread pemeriksa masih hidup"""
+        return self.thread.is_alive()
+
+    def hentikan(self):
+        """Hentikan thread pemeriksa"""
+        self.antrian.put(_BERHENTI)
+
+
+class GridBiodata(tk.Frame):
+    """Input banyak biodata sekaligus seperti spreadsheet, divalidasi per sel di latar belakang
+
+    simpan(records) dipanggil sekali untuk semua baris yang valid dan mengembalikan True
+    jika batch diterima; setelah batch selesai ditulis, pemanggil memanggil selesai().
+    """
+
+    def __init__(self, master, penyimpanan, simpan, kembali=None, saran=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.simpan = simpan
+        self.saran = saran or {}
+        self.baris = []
+        self._job_baris = {}
+        self._job_hasil = None
+        # Simpan Semua yang sedang menunggu validasi selesai: (job after, batas waktu)
+        self._simpan_tertunda = None
+        self.pemeriksa = PemeriksaBaris(penyimpanan.path)
+        self._buat_interface(kembali)
+        self.tambah_baris(BARIS_AWAL)
+
+    def _buat_interface(self, kembali):
+        bg = self.cget("bg")
+
+        frame_atas = tk.Frame(self, bg=bg)
+        frame_atas.pack(fill=tk.X, pady=(0, 10))
+
+        tk.Label(
+            frame_atas,
+            text="INPUT BANYAK",
+            font=("Arial", 16, "bold"),
+            bg=bg
+        ).pack(side=tk.LEFT)
+
+        if kembali is not None:
+            tk.Button(frame_atas, text="Kembali ke Form", font=("Arial", 10), command=kembali).pack(side=tk.RIGHT)
+        tk.Button(
+            frame_atas,
+            text=f"Tambah {BARIS_TAMBAHAN} Baris",
+            font=("Arial", 10),
+            command=lambda: self.tambah_baris(BARIS_TAMBAHAN)
+        ).pack(side=tk.RIGHT, padx=5)
+
+        # Area grid yang bisa di-scroll
+        frame_tabel = tk.Frame(self, bg=bg)
+        frame_tabel.pack(fill=tk.BOTH, expand=True)
+
+        self.canvas = tk.Canvas(frame_tabel, highlightthickness=0)
+        scroll_y = tk.Scrollbar(frame_tabel, orient=tk.VERTICAL, command=self.canvas.yview)
+        scroll_x = tk.Scrollbar(frame_tabel, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=scroll_y.set, xscrollcommand=scroll_x.set)
+        scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.frame_sel = tk.Frame(self.canvas)
+        self.canvas.create_window((0, 0), window=self.frame_sel, anchor="nw")
+        self.frame_sel.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+        self.canvas.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+        tk.Label(self.frame_sel, text="No", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=2)
+        for kolom, (_, judul, _) in enumerate(KOLOM_GRID, start=1):
+            tk.Label(self.frame_sel, text=judul, font=("Arial", 10, "bold")).grid(row=0, column=kolom, sticky="W")
+
+        # Status: kesalahan sel yang sedang difokus / ringkasan
+        self.label_status = tk.Label(self, text="", font=("Arial", 10, "italic"), bg=bg, anchor="w", justify=tk.LEFT)
+        self.label_status.pack(fill=tk.X, pady=(5, 0))
+
+        self.btn_simpan = tk.Button(
+            self,
+            text="Simpan Semua",
+            font=("Arial", 12, "bold"),
+            command=self.simpan_semua
+        )
+        self.btn_simpan.pack(fill=tk.X, pady=(10, 0))
+
+    def tambah_baris(self, jumlah):
+        """Tambah baris kosong di bawah grid"""
+        for _ in range(jumlah):
+            nomor = len(self.baris)
+            baris = {"var": {}, "widget": {}, "versi": 0, "versi_diperiksa": 0, "kesalahan": {}}
+            tk.Label(self.frame_sel, text=str(nomor + 1), font=("Arial", 10)).grid(row=nomor + 1, column=0)
+
+            for kolom, (field, _, lebar) in enumerate(KOLOM_GRID, start=1):
+                if field == "jenis_kelamin":
+                    var = tk.StringVar(value=PILIHAN_JK[0])
+                    widget = ttk.Combobox(
+                        self.frame_sel, textvariable=var, values=PILIHAN_JK, width=lebar, state="readonly"
+                    )
+                else:
+                    var = tk.StringVar()
+                    widget = tk.Entry(self.frame_sel, textvariable=var, width=lebar, bg=WARNA_NORMAL)
+                    widget.bind("<Return>", lambda e, n=nomor, f=field: self._pindah_sel(n + 1, f))
+                    widget.bind("<Down>", lambda e, n=nomor, f=field: self._pindah_sel(n + 1, f))
+                    widget.bind("<Up>", lambda e, n=nomor, f=field: self._pindah_sel(n - 1, f))
+                    if field in self.saran:
+                        PelengkapOtomatis(widget, self.saran[field])
+                widget.grid(row=nomor + 1, column=kolom, sticky="EW", padx=1, pady=1)
+                widget.bind("<FocusIn>", lambda e, n=nomor, f=field: self._tampilkan_kesalahan(n, f))
+                var.trace_add("write", lambda *args, n=nomor: self._baris_berubah(n))
+                baris["var"][field] = var
+                baris["widget"][field] = widget
+
+            self.baris.append(baris)
+
+    def _pindah_sel(self, nomor, field):
+        """Pindah ke sel di baris lain pada kolom yang sama (menambah baris jika perlu)"""
+        if nomor < 0:
+            return "break"
+        if nomor >= len(self.baris):
+            self.tambah_baris(BARIS_TAMBAHAN)
+        widget = self.baris[nomor]["widget"][field]
+        widget.focus_set()
+        # Pastikan sel terlihat
+        self.update_idletasks()
+        tinggi = self.frame_sel.winfo_height()
+        if tinggi:
+            self.canvas.yview_moveto(max(0.0, (widget.winfo_y() - 40) / tinggi))
+        return "break"
+
+    def _record(self, nomor):
+        return {field: var.get().strip() for field, var in self.baris[nomor]["var"].items()}
+
+    @staticmethod
+    def _kosong(record):
+        return not any(nilai for field, nilai in record.items() if field != "jenis_kelamin")
+
+    def _baris_berubah(self, nomor):
+        """Sel diubah: periksa ulang barisnya sebentar lagi (digabung per ketukan)"""
+        self.baris[nomor]["versi"] += 1
+        job = self._job_baris.pop(nomor, None)
+        if job is not None:
+            self.after_cancel(job)
+        self._job_baris[nomor] = self.after(200, self._periksa_baris, nomor)
+
+    def _periksa_baris(self, nomor):
+        self._job_baris.pop(nomor, None)
+        baris = self.baris[nomor]
+        record = self._record(nomor)
+        if self._kosong(record):
+            # Baris kosong tidak divalidasi dan tidak ikut disimpan
+            baris["kesalahan"] = {}
+            baris["versi_diperiksa"] = baris["versi"]
+            self._perbarui_warna()
+            return
+        self.pemeriksa.periksa(nomor, baris["versi"], record)
+        if self._job_hasil is None:
+            self._job_hasil = self.after(50, self._proses_hasil)
+
+    def _proses_hasil(self):
+        """Ambil hasil validasi dari thread pemeriksa (hasil versi lama diabaikan)"""
+        self._job_hasil = None
+        ada_hasil = False
+        while True:
+            try:
+                nomor, versi, kesalahan = self.pemeriksa.hasil.get_nowait()
+            except queue.Empty:
+                break
+            baris = self.baris[nomor]
+            if versi == baris["versi"]:
+                baris["kesalahan"] = kesalahan
+                baris["versi_diperiksa"] = versi
+                ada_hasil = True
+
+        if ada_hasil:
+            self._perbarui_warna()
+        if self._menunggu() and self.pemeriksa.berjalan():
+            self._job_hasil = self.after(50, self._proses_hasil)
+
+    def _menunggu(self):
+        """Ada baris yang belum selesai diperiksa"""
+        return bool(self._job_baris) or any(b["versi"] != b["versi_diperiksa"] for b in self.baris)
+
+    def _kesalahan_grid(self):
+        """Kesalahan per baris, termasuk NIM yang sama di beberapa baris grid"""
+        kesalahan = {}
+        nim_dipakai = {}
+        for nomor, baris in enumerate(self.baris):
+            if baris["kesalahan"]:
+                kesalahan[nomor] = dict(baris["kesalahan"])
+            nim = baris["var"]["nim"].get().strip()
+            if nim:
+                nim_dipakai.setdefault(nim, []).append(nomor)
+
+        for nim, daftar in nim_dipakai.items():
+            if len(daftar) > 1:
+                for nomor in daftar:
+                    kesalahan.setdefault(nomor, {}).setdefault(
+                        "nim", f"NIM ganda di grid (baris {', '.join(str(n + 1) for n in daftar)})"
+                    )
+        return kesalahan
+
+    def _perbarui_warna(self):
+        kesalahan = self._kesalahan_grid()
+        for nomor, baris in enumerate(self.baris):
+            salah = kesalahan.get(nomor, {})
+            for field, widget in baris["widget"].items():
+                if isinstance(widget, tk.Entry):
+                    widget.config(bg=WARNA_SALAH if field in salah else WARNA_NORMAL)
+
+        fokus = self.focus_get()
+        for nomor, baris in enumerate(self.baris):
+            for field, widget in baris["widget"].items():
+                if widget is fokus:
+                    self._tampilkan_kesalahan(nomor, field)
+                    return
+
+    def _tampilkan_kesalahan(self, nomor, field):
+        pesan = self._kesalahan_grid().get(nomor, {}).get(field, "")
+        self.label_status.config(text=f"Baris {nomor + 1}: {pesan}" if pesan else "")
+
+    def simpan_semua(self):
+        """Simpan semua baris yang terisi dalam satu batch (hanya jika semuanya valid)"""
+        # Klik berikutnya selama menunggu/menyimpan diabaikan (tombol juga nonaktif)
+        if self._simpan_tertunda is not None or self.btn_simpan["state"] == tk.DISABLED:
+            return
+        if self._menunggu():
+            self.btn_simpan.config(state=tk.DISABLED, text="Menunggu validasi...")
+            self.label_status.config(text="Menunggu validasi selesai...")
+            self._simpan_tertunda = (
+                self.after(100, self._cek_simpan_tertunda),
+                time.monotonic() + BATAS_TUNGGU_VALIDASI,
+            )
+            return
+        self._simpan_sekarang()
+
+    def _cek_simpan_tertunda(self):
+        """Lanjutkan Simpan Semua setelah semua baris selesai divalidasi"""
+        _, batas = self._simpan_tertunda
+        if self._menunggu():
+            if not self.pemeriksa.berjalan() or time.monotonic() > batas:
+                self._simpan_tertunda = None
+                self.btn_simpan.config(state=tk.NORMAL, text="Simpan Semua")
+                self.label_status.config(text="")
+                penyebab = self.pemeriksa.error or "waktu tunggu habis"
+                logging.error(f"Grid save aborted, cell validation did not finish: {penyebab}")
+                messagebox.showerror("Validasi Gagal", f"Validasi data tidak dapat diselesaikan:\n{penyebab}")
+                return
+            self._simpan_tertunda = (self.after(100, self._cek_simpan_tertunda), batas)
+            return
+        self._simpan_tertunda = None
+        self.btn_simpan.config(state=tk.NORMAL, text="Simpan Semua")
+        self._simpan_sekarang()
+
+    def _simpan_sekarang(self):
+        """Kirim batch ke pemanggil jika semua baris valid"""
+        kesalahan = self._kesalahan_grid()
+        records = []
+        for nomor in range(len(self.baris)):
+            record = self._record(nomor)
+            if not self._kosong(record):
+                records.append(record)
+
+        if kesalahan:
+            nomor = min(kesalahan)
+            field, pesan = next(iter(kesalahan[nomor].items()))
+            self.baris[nomor]["widget"][field].focus_set()
+            messagebox.showwarning(
+                "Data Belum Valid",
+                f"{len(kesalahan)} baris masih salah.\nBaris {nomor + 1}: {pesan}"
+            )
+            return
+        if not records:
+            messagebox.showinfo("Input Banyak", "Belum ada data yang diisi.")
+            return
+
+        self.btn_simpan.config(state=tk.DISABLED, text=f"Menyimpan {len(records)} data...")
+        if not self.simpan(records):
+            self.selesai(False)
+
+    def selesai(self, berhasil):
+        """Dipanggil setelah batch selesai ditulis; grid dikosongkan jika berhasil"""
+        self.btn_simpan.config(state=tk.NORMAL, text="Simpan Semua")
+        if berhasil:
+            self.kosongkan()
+
+    def kosongkan(self):
+        """Kosongkan semua baris"""
+        for baris in self.baris:
+            for field, var in baris["var"].items():
+                var.set(PILIHAN_JK[0] if field == "jenis_kelamin" else "")
+        self.label_status.config(text="")
+
+    def tutup(self):
+        """Hentikan thread pemeriksa"""
+        if self._simpan_tertunda is not None:
+            self.after_cancel(self._simpan_tertunda[0])
+            self._simpan_tertunda = None
+        self.pemeriksa.hentikan()
@@ -0,0 +1,143 @@
+import argparse
+import collections
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from migrasi_csv import baca_csv
+from penyimpanan_biodata import PenyimpananBiodata, KOLOM_CSV, KOLOM_DB, DB_FILE
+from validasi_biodata import validasi_record
+
+UKURAN_CHUNK = 2000
+
+# Nama kolom CSV -> nama field record (JSONL boleh memakai salah satunya)
+FIELD_DARI_KOLOM = dict(zip(KOLOM_CSV, KOLOM_DB))
+
+
+def _record_dari_json(data):
+    """Ubah objek JSON (kunci field atau judul kolom CSV) menjadi record"""
+    record = {}
+    for kunci, nilai in data.items():
+        field = FIELD_DARI_KOLOM.get(kunci, kunci)
+        if field in KOLOM_DB:
+            record[field] = "" if nilai is None else str(nilai)
+    return record
+
+
+def baca_record(path):
+    """Baca file CSV/JSONL secara streaming, menghasilkan (nomor baris, record)"""
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, "r", encoding="utf-8") as file:
+            for nomor, baris in enumerate(file, start=1):
+                if not baris.strip():
+                    continue
+                try:
+                    yield nomor, _record_dari_json(json.loads(baris))
+                except (ValueError, AttributeError) as e:
+                    yield nomor, {"_error": f"JSON tidak valid: {e}"}
+    else:
+        # Baris CSV dimigrasi ke layout terkini, nomor = urutan record data
+        for nomor, row in enumerate(baca_csv(path), start=1):
+            yield nomor, dict(zip(KOLOM_DB, row))
+
+
+def validasi_chunk(chunk):
+    """Validasi satu chunk di proses worker, mengembalikan (nomor, record, alasan atau None)"""
+    hasil = []
+    for nomor, record in chunk:
+        if "_error" in record:
+            hasil.append((nomor, record, record["_error"]))
+            continue
+        kesalahan = validasi_record(record)
+        hasil.append((nomor, record, kesalahan[2] if kesalahan else None))
+    return hasil
+
+
+def _validasi_paralel(executor, chunks, maks_tertunda):
+    """Jalankan validasi chunk di process pool dengan jumlah chunk tertunda terbatas (urutan tetap)"""
+    tertunda = collections.deque()
+    for chunk in chunks:
+        tertunda.append(executor.submit(validasi_chunk, chunk))
+        if len(tertunda) >= maks_tertunda:
+            yield tertunda.popleft().result()
+    while tertunda:
+        yield tertunda.popleft().result()
+
+
+def _chunk(iterable, ukuran):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, ukuran))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ingest(paths, penyimpanan, path_tolak, diinput_oleh="impor_massal", workers=None, ukuran_chunk=UKURAN_CHUNK):
+    """Validasi dan simpan record dari beberapa file, mengembalikan (diterima, ditolak, detik)"""
+    diterima = ditolak = 0
+    mulai = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+
+    with open(path_tolak, "w", newline="", encoding="utf-8") as file_tolak, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        writer_tolak = csv.writer(file_tolak)
+        writer_tolak.writerow(["File", "Baris", "Alasan"] + KOLOM_CSV)
+
+        for path in paths:
+            chunks = _chunk(baca_record(path), ukuran_chunk)
+            for hasil in _validasi_paralel(executor, chunks, workers * 2):
+                batch = []
+                for nomor, record, alasan in hasil:
+                    if alasan is None:
+                        batch.append((nomor, record))
+                    else:
+                        writer_tolak.writerow([path, nomor, alasan] + [record.get(kolom, "") for kolom in KOLOM_DB])
+                        ditolak += 1
+
+                # Simpan record yang lolos per batch (satu transaksi per chunk); NIM yang sudah
+                # tersimpan (atau muncul dua kali di file) ditolak di dalam transaksi itu
+                if batch:
+                    dilewati = penyimpanan.simpan_banyak_unik([record for _, record in batch], diinput_oleh)
+                    for i in dilewati:
+                        nomor, record = batch[i]
+                        writer_tolak.writerow(
+                            [path, nomor, f"NIM {record.get('nim', '')} sudah tersimpan"]
+                            + [record.get(kolom, "") for kolom in KOLOM_DB]
+                        )
+                    diterima += len(batch) - len(dilewati)
+                    ditolak += len(dilewati)
+
+    return diterima, ditolak, time.perf_counter() - mulai
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Impor biodata massal dari file CSV/JSONL")
+    parser.add_argument("masuk", nargs="+", help="File CSV atau JSONL (.jsonl/.ndjson)")
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--tolak", default="biodata_ditolak.csv", help="File untuk record yang ditolak")
+    parser.add_argument("--user", default="impor_massal", help="Nama pengguna yang dicatat sebagai penginput")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=UKURAN_CHUNK)
+    args = parser.parse_args(argv)
+
+    penyimpanan = PenyimpananBiodata(args.db)
+    try:
+        diterima, ditolak, detik = ingest(
+            args.masuk, penyimpanan, args.tolak, args.user, args.workers, args.chunk
+        )
+    finally:
+        penyimpanan.tutup()
+
+    total = diterima + ditolak
+    print(f"{total} record diproses dalam {detik:.2f} detik ({total / detik if detik else 0:.0f} rows/s)")
+    print(f"Diterima: {diterima}, ditolak: {ditolak} (lihat '{args.tolak}')")
+    return 0 if ditolak == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import logging
+import math
+import threading
+
+from penyimpanan_biodata import PenyimpananBiodata
+
+# Jeda sebelum memuat ulang Bloom filter setelah gagal, dua kali lipat tiap kegagalan
+JEDA_COBA_ULANG = 1.0
+JEDA_COBA_ULANG_MAKS = 300.0
+
+
+class BloomFilter:
+    """Bloom filter sederhana di atas bytearray (tanpa false negative)"""
+
+    def __init__(self, kapasitas, error_rate=0.01):
+        kapasitas = max(kapasitas, 1)
+        self.jumlah_bit = max(8, int(-kapasitas * math.log(error_rate) / (math.log(2) ** 2)))
+        self.jumlah_hash = max(1, round(self.jumlah_bit / kapasitas * math.log(2)))
+        self.kapasitas = kapasitas
+        self.bits = bytearray(self.jumlah_bit // 8 + 1)
+        self.jumlah = 0
+
+    def _posisi(self, kunci):
+        # Double hashing: posisi ke-i = h1 + i*h2 (hash string di-cache oleh Python)
+        h1 = hash(kunci)
+        h2 = hash((kunci, 1)) | 1
+        m = self.jumlah_bit
+        return [(h1 + i * h2) % m for i in range(self.jumlah_hash)]
+
+    def tambah(self, kunci):
+        bits = self.bits
+        for posisi in self._posisi(kunci):
+            bits[posisi >> 3] |= 1 << (posisi & 7)
+        self.jumlah += 1
+
+    def __contains__(self, kunci):
+        bits = self.bits
+        for posisi in self._posisi(kunci):
+            if not bits[posisi >> 3] & (1 << (posisi & 7)):
+                return False
+        return True
+
+
+class IndeksNIM:
+    """Deteksi NIM duplikat: Bloom filter di memori, dikonfirmasi indeks NIM di database
+
+    Bloom filter dimuat di thread latar belakang agar tidak menambah waktu startup;
+    sebelum selesai dimuat (atau jika pemuatan gagal), pengecekan langsung memakai
+    indeks database. Pemuatan yang gagal dicoba lagi dengan jeda yang makin panjang.
+    """
+
+    def __init__(self, penyimpanan, error_rate=0.01, jeda_coba_ulang=JEDA_COBA_ULANG):
+        self.penyimpanan = penyimpanan
+        self.error_rate = error_rate
+        self.jeda_awal = jeda_coba_ulang
+        self.jeda_coba_ulang = jeda_coba_ulang
+        self.bloom = None
+        self.tertunda = set()
+        self._lock = threading.Lock()
+        self._tambahan_saat_muat = []
+        self._memuat = False
+        self._muat_ulang()
+
+    def _muat_ulang(self, kapasitas_minimal=0):
+        """Bangun ulang Bloom filter dari database di thread latar belakang"""
+        with self._lock:
+            if self._memuat:
+                return
+            self._memuat = True
+            self._tambahan_saat_muat = []
+        threading.Thread(target=self._muat, args=(kapasitas_minimal,), daemon=True).start()
+
+    def _muat(self, kapasitas_minimal):
+        try:
+            # Koneksi terpisah karena koneksi SQLite tidak dipakai bersama antar thread
+            penyimpanan = PenyimpananBiodata(self.penyimpanan.path)
+            try:
+                kapasitas = max(penyimpanan.jumlah() * 2, kapasitas_minimal, 1000)
+                bloom = BloomFilter(kapasitas, self.error_rate)
+                for (nim,) in penyimpanan.conn.execute("SELECT nim FROM biodata"):
+                    bloom.tambah(nim)
+            finally:
+                penyimpanan.tutup()
+        except Exception as e:
+            # Database terkunci/rusak: tetap pakai filter lama (atau indeks database saja)
+            # dan coba bangun ulang setelah jeda
+            with self._lock:
+                jeda = self.jeda_coba_ulang
+                self.jeda_coba_ulang = min(jeda * 2, JEDA_COBA_ULANG_MAKS)
+                self._tambahan_saat_muat = []
+                self._memuat = False
+            logging.error(f"Failed to build NIM bloom filter, retrying in {jeda:.0f}s: {e}")
+            timer = threading.Timer(jeda, self._muat_ulang, args=(kapasitas_minimal,))
+            timer.daemon = True
+            timer.start()
+            return
+
+        with self._lock:
+            for nim in self._tambahan_saat_muat:
+                bloom.tambah(nim)
+            self._tambahan_saat_muat = []
+            self.bloom = bloom
+            self.jeda_coba_ulang = self.jeda_awal
+            self._memuat = False
+
+    def ada(self, nim):
+        """Cek apakah NIM sudah tersimpan atau sedang menunggu disimpan"""
+        if nim in self.tertunda:
+            return True
+        bloom = self.bloom
+        if bloom is not None and nim not in bloom:
+            # Bloom filter tidak pernah salah untuk hasil negatif
+            return False
+        # Kemungkinan ada (atau filter belum siap): cek pasti lewat indeks NIM
+        return self.penyimpanan.cari_nim(nim) is not None
+
+    def tandai_tertunda(self, nim):
+        """Catat NIM yang sudah masuk antrian penulis tapi belum tersimpan"""
+        self.tertunda.add(nim)
+
+    def batalkan(self, nim):
+        """NIM gagal disimpan, hapus dari daftar tertunda"""
+        self.tertunda.discard(nim)
+
+    def tambah(self, nim):
+        """Perbarui indeks setelah NIM berhasil disimpan"""
+        self.tertunda.discard(nim)
+        with self._lock:
+            bloom = self.bloom
+            if bloom is not None:
+                bloom.tambah(nim)
+            if self._memuat:
+                # Filter baru sedang dibangun, NIM ini ditambahkan setelah selesai
+                self._tambahan_saat_muat.append(nim)
+                return
+            if bloom is None:
+                # Pemuatan gagal dan menunggu dicoba lagi; ada() memakai indeks database
+                return
+            perlu_diperbesar = bloom.jumlah > bloom.kapasitas
+        if perlu_diperbesar:
+            # Filter sudah melebihi kapasitas: bangun ulang dengan kapasitas dua kali lipat
+            self._muat_ulang(bloom.kapasitas * 2)
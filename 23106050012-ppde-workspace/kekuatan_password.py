@@ -0,0 +1,379 @@
+import argparse
+import getpass
+import logging
+import math
+import os
+import queue
+import sys
+import threading
+from datetime import datetime
+
+# Kamus password opsional: satu kata per baris, urut dari yang paling sering dipakai
+KAMUS_PASSWORD = "kamus_password.txt"
+
+# Di atas jumlah kata ini penilaian dijalankan di thread latar belakang, bukan di callback Tk
+AMBANG_KAMUS_LATAR = 50_000
+
+# Dipakai jika kamus_password.txt tidak ada (dan ditambahkan di belakang kamus dari file)
+KATA_BAWAAN = [
+    "123456", "password", "12345678", "qwerty", "123456789", "12345", "1234", "111111",
+    "1234567", "dragon", "123123", "baseball", "abc123", "football", "monkey", "letmein",
+    "696969", "shadow", "master", "666666", "qwertyuiop", "123321", "mustang", "1234567890",
+    "michael", "654321", "superman", "1qaz2wsx", "7777777", "121212", "000000", "qazwsx",
+    "123qwe", "killer", "trustno1", "jordan", "jennifer", "zxcvbnm", "asdfgh", "hunter",
+    "buster", "soccer", "harley", "batman", "andrew", "tigger", "sunshine", "iloveyou",
+    "charlie", "robert", "thomas", "hockey", "ranger", "daniel", "starwars", "klaster",
+    "112233", "george", "computer", "michelle", "jessica", "pepper", "zxcvbn", "freedom",
+    "princess", "maggie", "ginger", "summer", "ashley", "nicole", "chelsea", "biteme",
+    "matthew", "access", "yankees", "dallas", "austin", "thunder", "taylor", "matrix",
+    "welcome", "admin", "login", "passw0rd", "hello", "secret", "samsung", "google",
+    "rahasia", "sayang", "sayangku", "cinta", "cintaku", "indonesia", "bismillah", "merdeka",
+    "jakarta", "bandung", "surabaya", "yogyakarta", "semarang", "medan", "garuda", "pancasila",
+    "kucing", "anjing", "bintang", "matahari", "bulan", "pelangi", "rindu", "kangen",
+    "selamat", "masuk", "katasandi", "sandi", "kuliah", "mahasiswa", "kampus", "sekolah",
+    "persija", "persib", "arema", "doraemon", "naruto", "ganteng", "cantik", "keluarga",
+]
+
+# Huruf l33t yang dikembalikan ke huruf aslinya sebelum dicocokkan dengan kamus
+TABEL_L33T = str.maketrans("4@38!1|0$57+", "aaebiiiossti")
+
+# Keyboard QWERTY; posisi dalam satuan setengah tombol karena tiap baris bergeser ke kanan
+BARIS_KEYBOARD = [
+    (0, "`1234567890-=", "~!@#$%^&*()_+"),
+    (3, "qwertyuiop[]\\", "QWERTYUIOP{}|"),
+    (4, "asdfghjkl;'", 'ASDFGHJKL:"'),
+    (5, "zxcvbnm,./", "ZXCVBNM<>?"),
+]
+
+BRUTEFORCE = 10
+MIN_TEBAKAN_SUBPOLA = 50
+PERIODE_ULANG_MAKS = 4
+TAHUN_REFERENSI = datetime.now().year
+
+LABEL_SKOR = ["Sangat lemah", "Lemah", "Cukup", "Kuat", "Sangat kuat"]
+SARAN_POLA = {
+    "kamus": "hindari kata atau password umum",
+    "keyboard": "hindari pola keyboard seperti qwerty",
+    "ulang": "hindari karakter atau pola yang diulang",
+    "urutan": "hindari urutan seperti abc atau 123",
+    "tahun": "hindari tahun, misalnya tahun lahir",
+}
+
+
+def _buat_arah_keyboard():
+    """Peta tombol -> {tombol tetangga: arah}; huruf besar/shift memakai posisi tombol yang sama"""
+    posisi = {}
+    for baris, (geser, biasa, shift) in enumerate(BARIS_KEYBOARD):
+        for kolom, (a, b) in enumerate(zip(biasa, shift)):
+            posisi[a] = posisi[b] = (baris, geser + 2 * kolom)
+    di_posisi = {}
+    for tombol, pos in posisi.items():
+        di_posisi.setdefault(pos, []).append(tombol)
+
+    # Kiri, kanan, kiri atas, kanan atas, kiri bawah, kanan bawah
+    langkah = [(0, -2), (0, 2), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+    arah = {}
+    for tombol, (baris, x) in posisi.items():
+        arah[tombol] = {
+            tetangga: i
+            for i, (db, dx) in enumerate(langkah)
+            for tetangga in di_posisi.get((baris + db, x + dx), ())
+        }
+    return arah
+
+
+ARAH_KEYBOARD = _buat_arah_keyboard()
+JUMLAH_TOMBOL = len(ARAH_KEYBOARD) // 2
+DERAJAT_KEYBOARD = sum(len(t) for t in ARAH_KEYBOARD.values()) / len(ARAH_KEYBOARD) / 2
+
+
+def muat_kamus(path=KAMUS_PASSWORD):
+    """Baca kamus password menjadi {kata: peringkat}; peringkat 1 = paling umum"""
+    peringkat = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8", errors="ignore") as file:
+            for baris in file:
+                kata = baris.strip().lower()
+                if len(kata) >= 3 and kata not in peringkat:
+                    peringkat[kata] = len(peringkat) + 1
+        logging.info(f"Loaded {len(peringkat)} dictionary words from {path}")
+    for kata in KATA_BAWAAN:
+        peringkat.setdefault(kata, len(peringkat) + 1)
+    return peringkat
+
+
+def _variasi_huruf_besar(kata):
+    """Jumlah variasi huruf besar/kecil yang perlu dicoba penebak untuk `kata`"""
+    if kata.islower() or not any(c.isupper() for c in kata):
+        return 1
+    if kata.isupper() or kata[0].isupper() and kata[1:].islower() or kata[-1].isupper() and kata[:-1].islower():
+        return 2
+    besar = sum(1 for c in kata if c.isupper())
+    kecil = sum(1 for c in kata if c.islower())
+    return sum(math.comb(besar + kecil, i) for i in range(1, min(besar, kecil) + 1))
+
+
+def _tebakan_keyboard(panjang, belokan):
+    """Perkiraan tebakan pola keyboard sepanjang `panjang` dengan `belokan` pergantian arah"""
+    tebakan = 0
+    for i in range(2, panjang + 1):
+        for j in range(1, min(belokan, i - 1) + 1):
+            tebakan += math.comb(i - 1, j - 1) * JUMLAH_TOMBOL * DERAJAT_KEYBOARD ** j
+    return tebakan
+
+
+def _tebakan_urutan(awal, panjang, delta):
+    """Perkiraan tebakan urutan seperti abc, 2468 atau zyx"""
+    if awal in "aAzZ019":
+        dasar = 4
+    elif awal.isdigit():
+        dasar = 10
+    else:
+        dasar = 26
+    return dasar * panjang * (2 if delta < 0 else 1)
+
+
+def _kelas(c):
+    if c.isdigit():
+        return 0
+    if c.islower():
+        return 1
+    if c.isupper():
+        return 2
+    return None
+
+
+def skor_dari_tebakan(tebakan):
+    """Skor 0..4 dari jumlah tebakan (ambang sama dengan zxcvbn)"""
+    for skor, batas in enumerate((1e3, 1e6, 1e8, 1e10)):
+        if tebakan < batas + 5:
+            return skor
+    return 4
+
+
+class HasilKekuatan:
+    """Perkiraan kekuatan satu password"""
+    __slots__ = ("password", "tebakan", "skor", "pola")
+
+    def __init__(self, password, tebakan, pola):
+        self.password = password
+        self.tebakan = tebakan
+        self.skor = skor_dari_tebakan(tebakan)
+        self.pola = pola
+
+    @property
+    def label(self):
+        return LABEL_SKOR[self.skor]
+
+    @property
+    def saran(self):
+        """Saran perbaikan dari pola terpanjang yang ditemukan (tanpa menampilkan isi password)"""
+        pola = max((p for p in self.pola if p[0] != "acak"), key=lambda p: len(p[1]), default=None)
+        if pola is not None:
+            return SARAN_POLA[pola[0]]
+        return "tambah panjang password" if self.skor < 3 else ""
+
+
+class _Langkah:
+    # Keadaan setelah `panjang` karakter pertama: tebakan minimum untuk awalan itu,
+    # pola terakhir pada dekomposisi terbaik, dan panjang pola berjalan yang berakhir di sini
+    __slots__ = ("tebakan", "pola", "ulang", "urutan", "keyboard")
+
+    def __init__(self, tebakan, pola, ulang, urutan, keyboard):
+        self.tebakan = tebakan
+        self.pola = pola
+        self.ulang = ulang
+        self.urutan = urutan
+        self.keyboard = keyboard
+
+
+class PenilaiKekuatan:
+    """Perkiraan jumlah tebakan password ala zxcvbn (kamus, l33t, kata terbalik, pola
+    keyboard, pengulangan, urutan, tahun), dihitung inkremental per awalan
+
+    Keadaan setiap awalan password terakhir disimpan, jadi mengetik satu karakter hanya
+    menghitung pola yang berakhir di karakter itu (O(panjang kata terpanjang)) dan
+    menghapus karakter cukup memotong keadaan yang sudah ada. Tidak thread-safe.
+    """
+
+    def __init__(self, peringkat=None):
+        self.peringkat = muat_kamus() if peringkat is None else peringkat
+        self.panjang_kata_maks = max(map(len, self.peringkat), default=0)
+        self._password = ""
+        self._langkah = [_Langkah(1, None, (0,) * PERIODE_ULANG_MAKS, (0, 1), (1, 0, None))]
+
+    @property
+    def besar(self):
+        """True jika kamus cukup besar sehingga sebaiknya dinilai di luar thread UI"""
+        return len(self.peringkat) > AMBANG_KAMUS_LATAR
+
+    def nilai(self, password):
+        """Perkirakan kekuatan password, memakai ulang keadaan awalan yang sama dengan sebelumnya"""
+        sama = len(os.path.commonprefix((self._password, password)))
+        del self._langkah[sama + 1:]
+        for akhir in range(sama + 1, len(password) + 1):
+            self._langkah.append(self._langkah_berikut(password, akhir))
+        self._password = password
+
+        pola = []
+        akhir = len(password)
+        while akhir > 0:
+            mulai, jenis, tebakan = self._langkah[akhir].pola
+            pola.append((jenis, password[mulai:akhir], tebakan))
+            akhir = mulai
+        pola.reverse()
+        return HasilKekuatan(password, self._langkah[-1].tebakan, pola)
+
+    def _kandidat_kamus(self, password, akhir):
+        peringkat = self.peringkat
+        for mulai in range(max(0, akhir - self.panjang_kata_maks), akhir - 2):
+            asli = password[mulai:akhir]
+            kecil = asli.lower()
+            variasi = _variasi_huruf_besar(asli)
+            r = peringkat.get(kecil)
+            if r is not None:
+                yield mulai, r * variasi
+            r = peringkat.get(kecil[::-1])
+            if r is not None:
+                yield mulai, r * variasi * 2
+            l33t = kecil.translate(TABEL_L33T)
+            if l33t != kecil:
+                r = peringkat.get(l33t)
+                if r is not None:
+                    diganti = sum(1 for a, b in zip(kecil, l33t) if a != b)
+                    yield mulai, r * variasi * 2 ** diganti
+
+    def _langkah_berikut(self, password, akhir):
+        langkah = self._langkah
+        sebelum = langkah[akhir - 1]
+        c = password[akhir - 1]
+        p = password[akhir - 2] if akhir >= 2 else None
+
+        # (mulai, jenis, tebakan) untuk setiap pola yang berakhir di karakter ini
+        kandidat = [(akhir - 1, "acak", BRUTEFORCE)]
+        kandidat.extend((mulai, "kamus", tebakan) for mulai, tebakan in self._kandidat_kamus(password, akhir))
+
+        ulang = tuple(
+            sebelum.ulang[k - 1] + 1 if akhir > k and password[akhir - 1 - k] == c else 0
+            for k in range(1, PERIODE_ULANG_MAKS + 1)
+        )
+        for k, sama in enumerate(ulang, 1):
+            panjang = sama + k
+            if sama >= k and panjang >= 3:
+                kandidat.append((akhir - panjang, "ulang", BRUTEFORCE ** k * panjang / k))
+
+        delta = ord(c) - ord(p) if p is not None and _kelas(p) is not None and _kelas(p) == _kelas(c) else 0
+        if 1 <= abs(delta) <= 5:
+            urutan = (delta, sebelum.urutan[1] + 1 if delta == sebelum.urutan[0] else 2)
+        else:
+            urutan = (0, 1)
+        if urutan[1] >= 3:
+            mulai = akhir - urutan[1]
+            kandidat.append((mulai, "urutan", _tebakan_urutan(password[mulai], urutan[1], delta)))
+
+        arah = ARAH_KEYBOARD.get(p, {}).get(c) if p is not None else None
+        if arah is None:
+            keyboard = (1, 0, None)
+        else:
+            panjang, belokan, arah_sebelum = sebelum.keyboard
+            keyboard = (panjang + 1, belokan + (arah != arah_sebelum), arah)
+        if keyboard[0] >= 3:
+            kandidat.append((akhir - keyboard[0], "keyboard", _tebakan_keyboard(keyboard[0], keyboard[1])))
+
+        if akhir >= 4 and password[akhir - 4:akhir].isdigit():
+            tahun = int(password[akhir - 4:akhir])
+            if 1900 <= tahun <= TAHUN_REFERENSI + 20:
+                kandidat.append((akhir - 4, "tahun", max(abs(tahun - TAHUN_REFERENSI), 20)))
+
+        # Dekomposisi dengan hasil kali tebakan terkecil (program dinamis atas awalan)
+        terbaik = None
+        for mulai, jenis, tebakan in kandidat:
+            if akhir - mulai > 1:
+                tebakan = max(tebakan, MIN_TEBAKAN_SUBPOLA)
+            total = langkah[mulai].tebakan * tebakan
+            if terbaik is None or total < terbaik[0]:
+                terbaik = (total, (mulai, jenis, tebakan))
+        return _Langkah(terbaik[0], terbaik[1], ulang, urutan, keyboard)
+
+
+_BERHENTI = object()
+
+
+class PenilaiLatar:
+    """Penilai kekuatan untuk UI: kamus dimuat di thread latar belakang
+
+    Dengan kamus kecil penilaian langsung dijalankan (beberapa mikrodetik per ketukan);
+    dengan kamus besar, atau selama kamus belum selesai dimuat, penilaian dikirim ke
+    thread latar belakang dan hanya permintaan terakhir yang dinilai. Callback dipanggil
+    lewat proses_hasil() dari thread UI.
+    """
+
+    def __init__(self, path=KAMUS_PASSWORD):
+        self.path = path
+        self.penilai = None
+        self._lock = threading.Lock()
+        self.antrian = queue.Queue()
+        self.hasil = queue.Queue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def nilai(self, password, callback):
+        """Nilai password; callback(HasilKekuatan) dipanggil langsung atau lewat proses_hasil()"""
+        penilai = self.penilai
+        if penilai is not None and not penilai.besar:
+            with self._lock:
+                hasil = penilai.nilai(password)
+            callback(hasil)
+        else:
+            self.antrian.put((password, callback))
+
+    def _loop(self):
+        self.penilai = PenilaiKekuatan(muat_kamus(self.path))
+        while True:
+            item = self.antrian.get()
+            # Permintaan yang sudah disusul ketikan berikutnya tidak perlu dinilai
+            while item is not _BERHENTI:
+                try:
+                    berikut = self.antrian.get_nowait()
+                except queue.Empty:
+                    break
+                item = berikut
+            if item is _BERHENTI:
+                break
+            password, callback = item
+            with self._lock:
+                hasil = self.penilai.nilai(password)
+            self.hasil.put((callback, hasil))
+
+    def proses_hasil(self):
+        """Jalankan callback untuk penilaian yang sudah selesai (panggil dari thread UI)"""
+        while True:
+            try:
+                callback, hasil = self.hasil.get_nowait()
+            except queue.Empty:
+                break
+            callback(hasil)
+
+    def hentikan(self):
+        """Hentikan thread penilai"""
+        self.antrian.put(_BERHENTI)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perkirakan kekuatan password")
+    parser.add_argument("password", nargs="*", help="Kosongkan untuk mengetik password tanpa ditampilkan")
+    parser.add_argument("--kamus", default=KAMUS_PASSWORD)
+    args = parser.parse_args(argv)
+
+    penilai = PenilaiKekuatan(muat_kamus(args.kamus))
+    for password in args.password or [getpass.getpass("Password: ")]:
+        hasil = penilai.nilai(password)
+        pola = " + ".join(f"{jenis}({potongan})" for jenis, potongan, _ in hasil.pola)
+        print(f"{password}: {hasil.tebakan:.3g} tebakan, skor {hasil.skor} ({hasil.label}) = {pola}")
+        if hasil.saran:
+            print(f"  Saran: {hasil.saran}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
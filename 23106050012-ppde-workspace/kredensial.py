@@ -0,0 +1,153 @@
+import argparse
+import getpass
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+from penyimpanan_biodata import tulis_atomik
+
+USERS_FILE = "users.json"
+
+# PBKDF2-HMAC-SHA256, sengaja lambat agar tebakan massal mahal
+ITERASI = 200_000
+PANJANG_SALT = 16
+
+# User awal (sama dengan users_db lama), hanya dipakai saat users.json belum ada
+USER_AWAL = {
+    "admin": "admin123",
+    "arbath": "23106050012",
+}
+
+
+def hash_password(password, salt=None, iterasi=ITERASI):
+    """Hash password dengan salt acak, mengembalikan (salt, hash) dalam hex"""
+    if salt is None:
+        salt = os.urandom(PANJANG_SALT)
+    else:
+        salt = bytes.fromhex(salt)
+    hasil = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterasi)
+    return salt.hex(), hasil.hex()
+
+
+def cocokkan_password(password, salt, hash_tersimpan, iterasi=ITERASI):
+    """Bandingkan password dengan hash tersimpan (waktu konstan)"""
+    _, hasil = hash_password(password, salt, iterasi)
+    return hmac.compare_digest(hasil, hash_tersimpan)
+
+
+class PenyimpananKredensial:
+    """Penyimpanan user dengan password ter-hash (salt + PBKDF2) di file JSON"""
+
+    def __init__(self, path=USERS_FILE):
+        self.path = path
+        self.users = {}
+        self._lock = threading.RLock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self.users = json.load(file)
+        # Hash dummy agar verifikasi username yang tidak ada memakan waktu yang sama
+        self._dummy = None
+
+    def _simpan(self):
+        with tulis_atomik(self.path) as file:
+            json.dump(self.users, file, indent=2)
+
+    def _pastikan_ada_user(self):
+        """Buat users.json dari user awal saat pertama kali dipakai (dipanggil di thread worker)"""
+        if self.users or os.path.exists(self.path):
+            return
+        for username, password in USER_AWAL.items():
+            self.tambah_user(username, password)
+
+    def tambah_user(self, username, password):
+        """Tambah atau ganti password user"""
+        salt, hasil = hash_password(password)
+        with self._lock:
+            self.users[username] = {"salt": salt, "hash": hasil, "iterasi": ITERASI}
+            self._simpan()
+
+    def verifikasi(self, username, password):
+        """Cek username dan password (lambat, jalankan di luar thread Tk)"""
+        with self._lock:
+            self._pastikan_ada_user()
+            data = self.users.get(username)
+
+        if data is None:
+            if self._dummy is None:
+                self._dummy = hash_password("dummy")
+            cocokkan_password(password, *self._dummy)
+            return False
+        return cocokkan_password(password, data["salt"], data["hash"], data.get("iterasi", ITERASI))
+
+
+class PembatasLogin(logging.Handler):
+    """Backoff eksponensial per username, digerakkan oleh event login yang dicatat _coba_login
+
+    Dipasang sebagai handler di root logger: setiap "Failed login attempt for username: X"
+    menggandakan waktu tunggu X, dan "Successful login for user: X" mengembalikannya ke nol.
+    """
+
+    POLA_GAGAL = re.compile(r"^Failed login attempt for username: (.*)$")
+    POLA_BERHASIL = re.compile(r"^Successful login for user: (.*)$")
+
+    def __init__(self, tunda_awal=1.0, tunda_maks=300.0):
+        super().__init__(level=logging.INFO)
+        self.tunda_awal = tunda_awal
+        self.tunda_maks = tunda_maks
+        self.gagal = {}
+        self.tunda_sampai = {}
+        self._lock_data = threading.Lock()
+
+    def emit(self, record):
+        pesan = record.getMessage()
+        cocok = self.POLA_GAGAL.match(pesan)
+        if cocok:
+            username = cocok.group(1)
+            with self._lock_data:
+                jumlah = self.gagal.get(username, 0) + 1
+                self.gagal[username] = jumlah
+                tunda = min(self.tunda_awal * 2 ** (jumlah - 1), self.tunda_maks)
+                self.tunda_sampai[username] = time.monotonic() + tunda
+            return
+
+        cocok = self.POLA_BERHASIL.match(pesan)
+        if cocok:
+            with self._lock_data:
+                self.gagal.pop(cocok.group(1), None)
+                self.tunda_sampai.pop(cocok.group(1), None)
+
+    def sisa_tunda(self, username):
+        """Sisa detik sebelum username boleh mencoba login lagi (0 jika boleh)"""
+        with self._lock_data:
+            sampai = self.tunda_sampai.get(username)
+        if sampai is None:
+            return 0
+        return max(0.0, sampai - time.monotonic())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kelola user aplikasi biodata")
+    parser.add_argument("username")
+    parser.add_argument("--file", default=USERS_FILE)
+    args = parser.parse_args(argv)
+
+    password = getpass.getpass(f"Password baru untuk {args.username}: ")
+    if password != getpass.getpass("Ulangi password: "):
+        print("Password tidak sama.")
+        return 1
+
+    kredensial = PenyimpananKredensial(args.file)
+    kredensial._pastikan_ada_user()
+    kredensial.tambah_user(args.username, password)
+    print(f"User '{args.username}' disimpan ke '{args.file}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
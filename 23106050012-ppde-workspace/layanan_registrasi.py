@@ -0,0 +1,311 @@
+import argparse
+import asyncio
+import collections
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from kredensial import ITERASI
+from penyimpanan_registrasi import REGISTRASI_DB, PenyimpananRegistrasi, SudahTerdaftar, siapkan_record
+
+PATH_REGISTRASI = "/registrasi"
+
+# Balasan per Idempotency-Key hanya perlu diingat selama klien masih mungkin mengulang
+MAKS_BALASAN = 10_000
+UMUR_BALASAN = 600  # detik
+
+
+class GagalRegistrasi(Exception):
+    """Registrasi ditolak server atau server tidak dapat dihubungi"""
+
+    def __init__(self, pesan, bisa_diulang=False):
+        super().__init__(pesan)
+        self.bisa_diulang = bisa_diulang
+
+
+class _PenanganRegistrasi(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        if self.path != PATH_REGISTRASI:
+            self._balas(404, {"pesan": "Tidak ditemukan"})
+            return
+        try:
+            data = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError:
+            self._balas(400, {"pesan": "Data registrasi tidak valid"})
+            return
+
+        # Simulasi waktu proses dan gangguan sementara di server sungguhan
+        if server.latensi:
+            time.sleep(server.latensi)
+        if server.peluang_gagal and random.random() < server.peluang_gagal:
+            self._balas(503, {"pesan": "Server sedang sibuk"})
+            return
+
+        # Percobaan ulang dengan kunci yang sama mendapat balasan yang sama (tidak terdaftar dua kali),
+        # termasuk jika percobaan sebelumnya masih diproses
+        kunci = self.headers.get("Idempotency-Key")
+        selesai = None
+        with server.lock:
+            tersimpan = server.ambil_balasan(kunci)
+            if tersimpan is None:
+                if kunci in server.berjalan:
+                    selesai = server.berjalan[kunci]
+                elif kunci:
+                    server.berjalan[kunci] = threading.Event()
+        if selesai is not None:
+            selesai.wait()
+            with server.lock:
+                tersimpan = server.ambil_balasan(kunci) or (500, {"pesan": "Kesalahan server"})
+        if tersimpan is not None:
+            self._balas(*tersimpan)
+            return
+
+        try:
+            status, isi = self._daftar(data)
+        except Exception as e:
+            logging.error(f"Registration failed on server: {e}")
+            status, isi = 500, {"pesan": "Kesalahan server"}
+        if kunci:
+            with server.lock:
+                # Kegagalan 5xx tidak diingat agar percobaan ulang benar-benar diproses ulang
+                if status < 500:
+                    server.simpan_balasan(kunci, status, isi)
+                server.berjalan.pop(kunci).set()
+        self._balas(status, isi)
+
+    def _daftar(self, data):
+        """Validasi, hash password lalu simpan, mengembalikan (status HTTP, isi balasan)"""
+        penyimpanan = self.server.penyimpanan
+        if not isinstance(data.get("password"), str) or not data["password"]:
+            return 400, {"pesan": "Password wajib diisi"}
+        for field in ("nama", "email", "phone"):
+            if not isinstance(data.get(field), str) or not data[field]:
+                return 400, {"pesan": f"Field {field} wajib diisi"}
+
+        # Cek cepat lewat indeks sebelum PBKDF2 yang lambat; bentrok yang tersisa ditangkap indeks unik
+        if penyimpanan.email_terdaftar(data["email"]):
+            return 409, {"pesan": str(SudahTerdaftar("email", data["email"])), "field": "email"}
+        if penyimpanan.telepon_terdaftar(data["phone"]):
+            return 409, {"pesan": str(SudahTerdaftar("phone", data["phone"])), "field": "phone"}
+
+        record = siapkan_record(data, self.server.iterasi)
+        try:
+            id_registrasi = penyimpanan.simpan(record)
+        except SudahTerdaftar as e:
+            return 409, {"pesan": str(e), "field": e.field}
+        return 201, {"id": id_registrasi}
+
+    def _balas(self, status, isi):
+        body = json.dumps(isi).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"Registration server: {format % args}")
+
+
+class _ServerHTTP(ThreadingHTTPServer):
+    daemon_threads = True
+    # Antrian koneksi lebih panjang dari default (5) agar banyak klien bisa terhubung bersamaan
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # Klien sudah menutup koneksi (timeout atau dibatalkan), bukan kesalahan server
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+    def ambil_balasan(self, kunci):
+        """Balasan tersimpan untuk kunci, atau None jika belum ada/kedaluwarsa (panggil di bawah lock)"""
+        tersimpan = self.balasan.get(kunci)
+        if tersimpan is None:
+            return None
+        waktu, status, isi = tersimpan
+        if time.monotonic() - waktu > self.umur_balasan:
+            del self.balasan[kunci]
+            return None
+        return status, isi
+
+    def simpan_balasan(self, kunci, status, isi):
+        """Ingat balasan untuk kunci; yang tertua dibuang jika kedaluwarsa atau melebihi batas (panggil di bawah lock)"""
+        sekarang = time.monotonic()
+        self.balasan[kunci] = (sekarang, status, isi)
+        self.balasan.move_to_end(kunci)
+        # Urutan sisip = urutan waktu, jadi cukup periksa dari depan
+        while self.balasan:
+            waktu = next(iter(self.balasan.values()))[0]
+            if len(self.balasan) <= self.maks_balasan and sekarang - waktu <= self.umur_balasan:
+                break
+            self.balasan.popitem(last=False)
+
+
+class ServerRegistrasi:
+    """Layanan registrasi pengganti (HTTP lokal) untuk pengembangan dan benchmark
+
+    POST /registrasi dengan JSON data pengguna; balasan 201 {"id": ...}, 409 jika email
+    atau telepon sudah terdaftar, atau 503 sesuai peluang_gagal. Header Idempotency-Key
+    yang sama mendapat balasan yang sama selama umur_balasan detik (paling banyak
+    maks_balasan kunci diingat). Registrasi disimpan ke PenyimpananRegistrasi
+    dengan password berupa hash PBKDF2 (dihitung di thread permintaan).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latensi=0.0, peluang_gagal=0.0,
+                 path=REGISTRASI_DB, iterasi=ITERASI, maks_balasan=MAKS_BALASAN, umur_balasan=UMUR_BALASAN):
+        self.httpd = _ServerHTTP((host, port), _PenanganRegistrasi)
+        self.httpd.latensi = latensi
+        self.httpd.peluang_gagal = peluang_gagal
+        self.httpd.penyimpanan = PenyimpananRegistrasi(path)
+        self.httpd.iterasi = iterasi
+        self.httpd.balasan = collections.OrderedDict()
+        self.httpd.maks_balasan = maks_balasan
+        self.httpd.umur_balasan = umur_balasan
+        self.httpd.berjalan = {}
+        self.httpd.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{PATH_REGISTRASI}"
+
+    def mulai(self):
+        """Jalankan server di thread latar belakang"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def hentikan(self):
+        """Hentikan server"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.httpd.penyimpanan.tutup()
+
+
+class KlienRegistrasi:
+    """Klien registrasi asyncio yang berjalan di event loop thread latar belakang
+
+    kirim() bisa dipanggil dari thread Tk dan langsung mengembalikan
+    concurrent.futures.Future; banyak registrasi bisa berjalan bersamaan (dibatasi
+    maks_bersamaan). Setiap percobaan dibatasi timeout, kegagalan sementara (koneksi,
+    timeout, 5xx) diulang dengan backoff eksponensial, dan future.cancel() membatalkan
+    permintaan yang sedang berjalan.
+    """
+
+    def __init__(self, url, timeout=5.0, percobaan=3, tunda_awal=0.2, maks_bersamaan=64):
+        bagian = urlsplit(url)
+        self.host = bagian.hostname
+        self.port = bagian.port or 80
+        self.path = bagian.path or "/"
+        self.timeout = timeout
+        self.percobaan = percobaan
+        self.tunda_awal = tunda_awal
+
+        self.loop = asyncio.new_event_loop()
+        self._batas = asyncio.Semaphore(maks_bersamaan)
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def kirim(self, data):
+        """Mulai registrasi tanpa menunggu; hasilnya dict balasan server atau GagalRegistrasi"""
+        return asyncio.run_coroutine_threadsafe(self.daftar(data), self.loop)
+
+    async def daftar(self, data):
+        """Kirim registrasi dengan timeout per percobaan dan pengulangan untuk gangguan sementara"""
+        # Satu kunci untuk semua percobaan: server mungkin sudah memproses percobaan yang timeout
+        kunci = uuid.uuid4().hex
+        async with self._batas:
+            for percobaan in range(1, self.percobaan + 1):
+                try:
+                    status, balasan = await asyncio.wait_for(self._post(data, kunci), self.timeout)
+                except asyncio.TimeoutError:
+                    error = GagalRegistrasi(f"Server tidak merespons dalam {self.timeout:g} detik", True)
+                except (OSError, ValueError, IndexError, asyncio.IncompleteReadError) as e:
+                    error = GagalRegistrasi(f"Server tidak dapat dihubungi: {e}", True)
+                else:
+                    if 200 <= status < 300:
+                        return balasan
+                    error = GagalRegistrasi(balasan.get("pesan", f"HTTP {status}"), status >= 500)
+
+                if not error.bisa_diulang or percobaan == self.percobaan:
+                    raise error
+                logging.warning(f"Registration attempt {percobaan} failed, retrying: {error}")
+                await asyncio.sleep(self.tunda_awal * 2 ** (percobaan - 1))
+
+    async def _post(self, data, kunci):
+        """Satu permintaan HTTP POST berisi JSON, mengembalikan (status, isi balasan)"""
+        body = json.dumps(data).encode("utf-8")
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(
+                f"POST {self.path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Idempotency-Key: {kunci}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+
+            status = int((await reader.readline()).split()[1])
+            panjang = None
+            while True:
+                baris = await reader.readline()
+                if baris in (b"\r\n", b"\n", b""):
+                    break
+                nama, _, nilai = baris.decode("latin-1").partition(":")
+                if nama.strip().lower() == "content-length":
+                    panjang = int(nilai)
+            isi = await (reader.readexactly(panjang) if panjang is not None else reader.read())
+            return status, json.loads(isi) if isi else {}
+        finally:
+            writer.close()
+
+    def tutup(self):
+        """Batalkan registrasi yang masih berjalan lalu hentikan event loop"""
+        async def _batalkan_semua():
+            tugas = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tugas:
+                t.cancel()
+            await asyncio.gather(*tugas, return_exceptions=True)
+
+        if self.thread.is_alive():
+            asyncio.run_coroutine_threadsafe(_batalkan_semua(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+        self.loop.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan layanan registrasi pengganti (HTTP lokal)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latensi", type=float, default=0.0, help="Waktu proses per permintaan (detik)")
+    parser.add_argument("--gagal", type=float, default=0.0, help="Peluang balasan 503 (0..1)")
+    parser.add_argument("--db", default=REGISTRASI_DB)
+    args = parser.parse_args(argv)
+
+    server = ServerRegistrasi(port=args.port, latensi=args.latensi, peluang_gagal=args.gagal, path=args.db)
+    print(f"Layanan registrasi berjalan di {server.url} (Ctrl+C untuk berhenti)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        server.httpd.penyimpanan.tutup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
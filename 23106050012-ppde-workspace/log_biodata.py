@@ -0,0 +1,116 @@
+import atexit
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import time
+import uuid
+
+LOG_FILE = "aplikasi_biodata.log"
+FORMAT_TEKS = "%(asctime)s - %(levelname)s - %(message)s"
+FORMAT_WAKTU = "%Y-%m-%d %H:%M:%S"
+# Segmen log dirotasi paling lama sehari sekali, walau ukurannya belum mencapai batas
+INTERVAL_ROTASI = 24 * 60 * 60
+
+# Listener aktif (hanya satu per proses)
+_listener = None
+
+
+class FormatterJSON(logging.Formatter):
+    """Formatter log terstruktur: satu objek JSON per baris
+
+    Traceback exception sudah digabung ke pesan oleh QueueHandler sebelum masuk antrian.
+    """
+
+    def format(self, record):
+        data = {
+            "waktu": self.formatTime(record, FORMAT_WAKTU),
+            "level": record.levelname,
+            "pesan": record.getMessage(),
+        }
+        return json.dumps(data, ensure_ascii=False)
+
+
+def _kompres_segmen(sumber, tujuan):
+    """Rotator: kompres segmen log lama dengan gzip lalu hapus file aslinya"""
+    with open(sumber, "rb") as file_sumber, gzip.open(tujuan, "wb") as file_tujuan:
+        shutil.copyfileobj(file_sumber, file_tujuan)
+    os.remove(sumber)
+
+
+class HandlerRotasi(logging.handlers.RotatingFileHandler):
+    """File handler yang berotasi berdasarkan ukuran dan/atau interval waktu
+
+    Segmen lama disimpan sebagai <file>.1.gz, <file>.2.gz, ... (yang terbaru bernomor 1).
+    Setiap segmen baru diawali baris penanda unik agar segmen bisa dikenali setelah rotasi.
+    """
+
+    def __init__(self, filename, max_bytes=0, backup_count=10, interval_detik=None):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _kompres_segmen
+        self.interval_detik = interval_detik
+        self.waktu_rotasi = time.time() + interval_detik if interval_detik else None
+
+    def _open(self):
+        stream = super()._open()
+        if stream.tell() == 0:
+            penanda = logging.LogRecord(
+                "log_biodata", logging.INFO, __file__, 0,
+                f"Log segment started: {uuid.uuid4().hex}", None, None
+            )
+            stream.write(self.format(penanda) + self.terminator)
+        return stream
+
+    def shouldRollover(self, record):
+        if self.waktu_rotasi is not None and time.time() >= self.waktu_rotasi:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        if self.interval_detik:
+            self.waktu_rotasi = time.time() + self.interval_detik
+
+
+def setup_logging(filename=LOG_FILE, level=logging.INFO, max_bytes=5 * 1024 * 1024,
+                  backup_count=10, interval_detik=None, format_json=False):
+    """Arahkan logging root ke antrian yang ditulis oleh thread listener
+
+    Pemanggil logging hanya memasukkan record ke antrian, sedangkan penulisan file,
+    rotasi dan kompresi dikerjakan thread listener.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    handler = HandlerRotasi(filename, max_bytes, backup_count, interval_detik)
+    if format_json:
+        handler.setFormatter(FormatterJSON())
+    else:
+        handler.setFormatter(logging.Formatter(FORMAT_TEKS, datefmt=FORMAT_WAKTU))
+
+    antrian = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(antrian))
+
+    _listener = logging.handlers.QueueListener(antrian, handler)
+    _listener.start()
+
+    # Pastikan sisa log di antrian ditulis saat program selesai
+    atexit.register(hentikan_logging)
+    return _listener
+
+
+def hentikan_logging():
+    """Tulis semua log yang tersisa di antrian lalu hentikan listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,145 @@
+# Pembuat aturan: aturan(nilai, ambil) mengembalikan pesan kesalahan, atau None jika lolos
+
+
+def wajib(pesan):
+    """Nilai tidak boleh kosong"""
+    return lambda nilai, ambil: None if nilai else pesan
+
+
+def panjang_minimal(panjang, pesan):
+    """Nilai minimal sepanjang `panjang` karakter"""
+    return lambda nilai, ambil: None if len(nilai) >= panjang else pesan
+
+
+def cocok(pola, pesan):
+    """Seluruh nilai cocok dengan regex yang sudah dikompilasi (pola diawali ^ dan diakhiri $)"""
+    return lambda nilai, ambil: None if pola.match(nilai) else pesan
+
+
+def memuat(pola, pesan):
+    """Nilai memuat minimal satu kecocokan regex yang sudah dikompilasi"""
+    return lambda nilai, ambil: None if pola.search(nilai) else pesan
+
+
+def sama_dengan(field, pesan):
+    """Nilai harus sama dengan field lain (field itu menjadi dependensi)"""
+    def aturan(nilai, ambil):
+        return None if nilai == ambil(field) else pesan
+    aturan.bergantung = (field,)
+    return aturan
+
+
+class _Simpul:
+    __slots__ = ("baca", "aturan", "pesan_valid", "pesan_gagal", "bergantung")
+
+    def __init__(self, baca, aturan, pesan_valid, pesan_gagal, bergantung):
+        self.baca = baca
+        self.aturan = aturan
+        self.pesan_valid = pesan_valid
+        self.pesan_gagal = pesan_gagal
+        self.bergantung = bergantung
+
+
+class MesinValidasi:
+    """Graf validasi field dengan jumlah field valid yang dijaga berjalan (O(1) dibaca)
+
+    Setiap field punya fungsi pembaca nilai dan daftar aturan; aturan yang membaca
+    field lain lewat ambil(nama) menyebutkannya di atribut `bergantung`. Perubahan satu
+    field hanya mengevaluasi ulang field itu dan field yang bergantung padanya.
+    tampilkan(nama, valid, pesan) dipanggil setiap kali satu field dievaluasi.
+    Field yang bergantung hanya dievaluasi ulang jika sudah pernah dievaluasi
+    (misalnya konfirmasi password yang belum diisi tidak langsung ditandai salah).
+    """
+
+    def __init__(self, tampilkan=None):
+        self.tampilkan = tampilkan
+        self.simpul = {}
+        self.status = {}
+        self.jumlah_valid = 0
+        self._dependen = {}
+        self._urutan = {}
+        self._dievaluasi = set()
+
+    def tambah(self, nama, baca, aturan, pesan_valid="", pesan_gagal=None, bergantung=()):
+        """Daftarkan field beserta fungsi pembaca nilai dan daftar aturannya (dicek berurutan)"""
+        bergantung = set(bergantung)
+        for a in aturan:
+            bergantung.update(getattr(a, "bergantung", ()))
+        self.simpul[nama] = _Simpul(baca, list(aturan), pesan_valid, pesan_gagal, bergantung)
+        self.status[nama] = False
+        for sumber in bergantung:
+            self._dependen.setdefault(sumber, []).append(nama)
+        self._urutan.clear()
+
+    @property
+    def jumlah(self):
+        """Jumlah field terdaftar"""
+        return len(self.status)
+
+    @property
+    def semua_valid(self):
+        """True jika semua field valid"""
+        return self.jumlah_valid == len(self.status)
+
+    def ambil(self, nama):
+        """Nilai field saat ini"""
+        return self.simpul[nama].baca()
+
+    def _urutan_dari(self, nama):
+        """Field yang terpengaruh perubahan `nama`, dalam urutan topologis (di-cache)"""
+        urutan = self._urutan.get(nama)
+        if urutan is None:
+            # DFS pasca-urut lalu dibalik = urutan topologis subgraf yang terjangkau
+            hasil, dikunjungi = [], set()
+
+            def kunjungi(n):
+                dikunjungi.add(n)
+                for d in self._dependen.get(n, ()):
+                    if d not in dikunjungi:
+                        kunjungi(d)
+                hasil.append(n)
+
+            kunjungi(nama)
+            urutan = self._urutan[nama] = hasil[::-1]
+        return urutan
+
+    def _evaluasi(self, nama):
+        simpul = self.simpul[nama]
+        nilai = simpul.baca()
+        pesan = None
+        for aturan in simpul.aturan:
+            pesan = aturan(nilai, self.ambil)
+            if pesan is not None:
+                break
+        valid = pesan is None
+
+        if valid != self.status[nama]:
+            self.jumlah_valid += 1 if valid else -1
+            self.status[nama] = valid
+        self._dievaluasi.add(nama)
+        if self.tampilkan is not None:
+            self.tampilkan(nama, valid, simpul.pesan_valid if valid else pesan)
+        return valid
+
+    def perbarui(self, nama):
+        """Evaluasi field yang berubah dan field yang bergantung padanya, mengembalikan status field itu"""
+        valid = self._evaluasi(nama)
+        for dependen in self._urutan_dari(nama)[1:]:
+            if dependen in self._dievaluasi:
+                self._evaluasi(dependen)
+        return valid
+
+    def evaluasi_semua(self):
+        """Evaluasi semua field, mengembalikan pesan_gagal untuk setiap field yang tidak valid"""
+        return [
+            self.simpul[nama].pesan_gagal or nama
+            for nama in self.simpul
+            if not self._evaluasi(nama)
+        ]
+
+    def reset(self):
+        """Kembalikan semua field ke status belum valid dan belum dievaluasi"""
+        for nama in self.status:
+            self.status[nama] = False
+        self.jumlah_valid = 0
+        self._dievaluasi.clear()
@@ -0,0 +1,166 @@
+import argparse
+import csv
+import itertools
+import sys
+from collections import Counter
+
+from penyimpanan_biodata import PenyimpananBiodata, KOLOM_CSV, KOLOM_DB, DB_FILE, tulis_atomik
+
+# Versi skema file CSV biodata yang pernah dipakai aplikasi
+SKEMA_CSV = {
+    1: ["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin"],
+    2: KOLOM_CSV,
+}
+VERSI_TERKINI = 2
+
+# Versi skema berdasarkan jumlah kolom (untuk baris "ragged" di file lama)
+VERSI_DARI_PANJANG = {len(kolom): versi for versi, kolom in SKEMA_CSV.items()}
+
+# Penulisan jenis kelamin lama -> nilai yang dipakai form sekarang
+JENIS_KELAMIN = {
+    "pria": "Laki-Laki",
+    "laki-laki": "Laki-Laki",
+    "l": "Laki-Laki",
+    "wanita": "Perempuan",
+    "perempuan": "Perempuan",
+    "p": "Perempuan",
+}
+
+UKURAN_CHUNK = 5000
+
+
+def deteksi_versi(header):
+    """Deteksi versi skema dari baris header, None jika bukan header yang dikenal"""
+    header = [kolom.strip() for kolom in header]
+    for versi, kolom in SKEMA_CSV.items():
+        if header == kolom:
+            return versi
+    return None
+
+
+def _migrasi_v1_ke_v2(row):
+    """v1 -> v2: tambah kolom Email, Telepon, Tanggal Lahir dan seragamkan Jenis Kelamin"""
+    jk = row[4].strip()
+    row[4] = JENIS_KELAMIN.get(jk.lower(), jk)
+    return row + ["", "", ""]
+
+
+MIGRASI = {
+    1: _migrasi_v1_ke_v2,
+}
+
+
+def migrasi_baris(row, versi_file):
+    """Ubah satu baris ke layout terkini, versi ditentukan per baris dari jumlah kolom"""
+    versi = VERSI_DARI_PANJANG.get(len(row), versi_file)
+    jumlah_kolom = len(SKEMA_CSV[versi])
+    row = (row + [""] * jumlah_kolom)[:jumlah_kolom]
+    while versi < VERSI_TERKINI:
+        row = MIGRASI[versi](row)
+        versi += 1
+    return row
+
+
+def baca_csv(path, statistik=None):
+    """Baca file CSV biodata secara streaming, menghasilkan baris dalam layout terkini
+
+    statistik (Counter, opsional) diisi jumlah baris per versi skema asal.
+    """
+    with open(path, "r", newline="", encoding="utf-8-sig") as file:
+        reader = csv.reader(file)
+        pertama = next(reader, None)
+        if pertama is None:
+            return
+
+        versi_file = deteksi_versi(pertama)
+        if versi_file is None:
+            # File tanpa header: baris pertama sudah berupa data
+            if len(pertama) not in VERSI_DARI_PANJANG:
+                raise ValueError(f"Skema file '{path}' tidak dikenali: {pertama}")
+            versi_file = VERSI_DARI_PANJANG[len(pertama)]
+            reader = itertools.chain([pertama], reader)
+
+        for row in reader:
+            if not any(kolom.strip() for kolom in row):
+                continue
+            if statistik is not None:
+                statistik[VERSI_DARI_PANJANG.get(len(row), versi_file)] += 1
+            yield migrasi_baris(row, versi_file)
+
+
+def tulis_csv(rows, path):
+    """Tulis baris ke file CSV layout terkini secara streaming, mengembalikan jumlah baris"""
+    jumlah = 0
+    # Ditulis ke file sementara lalu diganti sekaligus agar tidak pernah terbaca setengah jadi
+    with tulis_atomik(path) as file:
+        writer = csv.writer(file)
+        writer.writerow(KOLOM_CSV)
+        for row in rows:
+            writer.writerow(row)
+            jumlah += 1
+    return jumlah
+
+
+def konversi(paths_masuk, path_keluar, statistik=None):
+    """Konversi/gabungkan beberapa file CSV ke satu file CSV layout terkini"""
+    rows = itertools.chain.from_iterable(baca_csv(path, statistik) for path in paths_masuk)
+    return tulis_csv(rows, path_keluar)
+
+
+def impor_csv(penyimpanan, path, ukuran_chunk=UKURAN_CHUNK, statistik=None):
+    """Impor file CSV ke penyimpanan per chunk (satu transaksi per chunk)"""
+    jumlah = 0
+    rows = baca_csv(path, statistik)
+    while True:
+        chunk = list(itertools.islice(rows, ukuran_chunk))
+        if not chunk:
+            break
+        penyimpanan.simpan_banyak(dict(zip(KOLOM_DB, row)) for row in chunk)
+        jumlah += len(chunk)
+    return jumlah
+
+
+def _laporan(statistik):
+    return ", ".join(f"v{versi}: {jumlah}" for versi, jumlah in sorted(statistik.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Impor/ekspor CSV biodata dengan migrasi skema")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p_konversi = sub.add_parser("konversi", help="Konversi/gabungkan file CSV ke layout terkini")
+    p_konversi.add_argument("keluar")
+    p_konversi.add_argument("masuk", nargs="+")
+
+    p_impor = sub.add_parser("impor", help="Impor file CSV ke database")
+    p_impor.add_argument("masuk", nargs="+")
+    p_impor.add_argument("--db", default=DB_FILE)
+    p_impor.add_argument("--chunk", type=int, default=UKURAN_CHUNK)
+
+    p_ekspor = sub.add_parser("ekspor", help="Ekspor database ke file CSV")
+    p_ekspor.add_argument("keluar")
+    p_ekspor.add_argument("--db", default=DB_FILE)
+
+    args = parser.parse_args(argv)
+    statistik = Counter()
+
+    if args.perintah == "konversi":
+        jumlah = konversi(args.masuk, args.keluar, statistik)
+        print(f"{jumlah} baris ditulis ke '{args.keluar}' ({_laporan(statistik)})")
+    elif args.perintah == "impor":
+        penyimpanan = PenyimpananBiodata(args.db)
+        for path in args.masuk:
+            jumlah = impor_csv(penyimpanan, path, args.chunk, statistik)
+            print(f"{jumlah} baris diimpor dari '{path}'")
+        print(f"Asal skema: {_laporan(statistik)}")
+        penyimpanan.tutup()
+    elif args.perintah == "ekspor":
+        penyimpanan = PenyimpananBiodata(args.db)
+        jumlah = penyimpanan.ekspor_csv(args.keluar)
+        print(f"{jumlah} baris diekspor ke '{args.keluar}'")
+        penyimpanan.tutup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Bagian panel: (kategori statistik, judul, judul kolom kunci)
+BAGIAN_TABEL = [
+    ("jurusan", "Jumlah per Jurusan", "Jurusan"),
+    ("jenis_kelamin", "Jenis Kelamin", "Jenis Kelamin"),
+    ("diinput_oleh", "Submit per User", "User"),
+]
+
+
+class PanelStatistik(tk.Frame):
+    """Panel statistik biodata dari penghitung berjalan (tanpa membaca ulang seluruh data)"""
+
+    def __init__(self, master, penyimpanan, kembali=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.penyimpanan = penyimpanan
+        self.tabel = {}
+        self._data = {}
+        self._buat_interface(kembali)
+
+    def _buat_interface(self, kembali):
+        bg = self.cget("bg")
+
+        frame_atas = tk.Frame(self, bg=bg)
+        frame_atas.pack(fill=tk.X, pady=(0, 10))
+
+        tk.Label(
+            frame_atas,
+            text="STATISTIK BIODATA",
+            font=("Arial", 16, "bold"),
+            bg=bg
+        ).pack(side=tk.LEFT)
+
+        if kembali is not None:
+            tk.Button(frame_atas, text="Kembali ke Form", font=("Arial", 10), command=kembali).pack(side=tk.RIGHT)
+        tk.Button(
+            frame_atas, text="Hitung Ulang", font=("Arial", 10), command=self.bangun_ulang
+        ).pack(side=tk.RIGHT, padx=5)
+
+        self.label_total = tk.Label(self, text="", font=("Arial", 12, "bold"), bg=bg, anchor="w")
+        self.label_total.pack(fill=tk.X)
+
+        # Tabel kecil untuk jurusan, jenis kelamin dan submit per user
+        frame_tabel = tk.Frame(self, bg=bg)
+        frame_tabel.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        for kolom, (kategori, judul, judul_kunci) in enumerate(BAGIAN_TABEL):
+            frame_tabel.columnconfigure(kolom, weight=1)
+            frame = tk.LabelFrame(frame_tabel, text=judul, font=("Arial", 10, "bold"), bg=bg)
+            frame.grid(row=0, column=kolom, sticky="NSEW", padx=3)
+
+            tree = ttk.Treeview(frame, columns=("kunci", "jumlah"), show="headings", height=6)
+            tree.heading("kunci", text=judul_kunci)
+            tree.heading("jumlah", text="Jumlah")
+            tree.column("kunci", width=110)
+            tree.column("jumlah", width=60, anchor="e")
+            tree.pack(fill=tk.BOTH, expand=True)
+            self.tabel[kategori] = tree
+
+        # Histogram tahun lahir
+        frame_histogram = tk.LabelFrame(self, text="Tahun Lahir", font=("Arial", 10, "bold"), bg=bg)
+        frame_histogram.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.canvas = tk.Canvas(frame_histogram, height=200, bg="white", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", lambda e: self._gambar_histogram())
+
+    def refresh(self):
+        """Baca penghitung statistik (ukurannya sebanding jumlah kategori, bukan jumlah data)"""
+        self._data = self.penyimpanan.statistik()
+
+        total = sum(jumlah for _, jumlah in self._data.get("total", []))
+        self.label_total.config(text=f"Total data: {total}")
+
+        for kategori, tree in self.tabel.items():
+            tree.delete(*tree.get_children())
+            for kunci, jumlah in sorted(self._data.get(kategori, []), key=lambda item: -item[1]):
+                tree.insert("", tk.END, values=(kunci or "(kosong)", jumlah))
+
+        self._gambar_histogram()
+
+    def bangun_ulang(self):
+        """Fallback: hitung ulang statistik dari seluruh data"""
+        self.penyimpanan.bangun_ulang_statistik()
+        self.refresh()
+
+    def _gambar_histogram(self):
+        self.canvas.delete("all")
+        data = [(tahun, jumlah) for tahun, jumlah in self._data.get("tahun_lahir", []) if tahun]
+        if not data:
+            self.canvas.create_text(10, 10, text="Belum ada data tanggal lahir", anchor="nw")
+            return
+
+        lebar = self.canvas.winfo_width()
+        tinggi = self.canvas.winfo_height()
+        margin = 20
+        lebar_batang = max(2, (lebar - 2 * margin) / len(data))
+        maks = max(jumlah for _, jumlah in data)
+
+        for i, (tahun, jumlah) in enumerate(data):
+            x0 = margin + i * lebar_batang
+            y0 = tinggi - margin - (tinggi - 2 * margin) * jumlah / maks
+            self.canvas.create_rectangle(x0 + 1, y0, x0 + lebar_batang - 1, tinggi - margin, fill="steelblue", outline="")
+            if lebar_batang >= 30:
+                self.canvas.create_text(x0 + lebar_batang / 2, tinggi - margin + 8, text=tahun, font=("Arial", 8))
+                self.canvas.create_text(x0 + lebar_batang / 2, y0 - 8, text=str(jumlah), font=("Arial", 8))
@@ -0,0 +1,235 @@
+import threading
+import tkinter as tk
+
+from penyimpanan_biodata import PenyimpananBiodata
+
+JUMLAH_SARAN = 8
+
+
+class _Simpul:
+    __slots__ = ("anak", "teratas")
+
+    def __init__(self):
+        self.anak = {}
+        # Nilai tersering yang diawali awalan simpul ini (sudah terurut)
+        self.teratas = []
+
+
+class Trie:
+    """Trie awalan tanpa beda huruf besar/kecil; setiap simpul menyimpan nilai tersering
+
+    Pencarian hanya menelusuri awalan (O(panjang awalan)) lalu mengembalikan daftar
+    yang sudah terurut, sehingga biayanya tidak bergantung pada jumlah nilai tersimpan.
+    """
+
+    def __init__(self, jumlah_saran=JUMLAH_SARAN):
+        self.akar = _Simpul()
+        self.jumlah_saran = jumlah_saran
+        self.frekuensi = {}
+
+    def tambah(self, nilai, jumlah=1):
+        """Tambah nilai (atau naikkan frekuensinya)"""
+        nilai = nilai.strip()
+        if not nilai:
+            return
+        self.frekuensi[nilai] = self.frekuensi.get(nilai, 0) + jumlah
+
+        simpul = self.akar
+        self._perbarui(simpul, nilai)
+        for huruf in nilai.lower():
+            anak = simpul.anak.get(huruf)
+            if anak is None:
+                anak = simpul.anak[huruf] = _Simpul()
+            simpul = anak
+            self._perbarui(simpul, nilai)
+
+    def _perbarui(self, simpul, nilai):
+        # Frekuensi hanya bertambah, jadi cukup cek nilai yang baru berubah
+        teratas = simpul.teratas
+        if nilai not in teratas:
+            if len(teratas) >= self.jumlah_saran and self.frekuensi[teratas[-1]] >= self.frekuensi[nilai]:
+                return
+            teratas.append(nilai)
+        teratas.sort(key=lambda v: (-self.frekuensi[v], v))
+        del teratas[self.jumlah_saran:]
+
+    def cari(self, awalan):
+        """Nilai tersering yang diawali awalan"""
+        simpul = self.akar
+        for huruf in awalan.lower():
+            simpul = simpul.anak.get(huruf)
+            if simpul is None:
+                return []
+        return list(simpul.teratas)
+
+
+def domain_email(email):
+    """Bagian domain dari alamat email (huruf kecil), atau None"""
+    _, at, domain = email.strip().rpartition("@")
+    return domain.lower() if at and domain else None
+
+
+class KamusIsian:
+    """Trie dari nilai yang sudah tersimpan (jurusan dan domain email) untuk saran isian
+
+    Trie dibangun di thread latar belakang; selama belum siap, saran masih kosong.
+    """
+
+    def __init__(self, penyimpanan):
+        self.penyimpanan = penyimpanan
+        self.jurusan = Trie()
+        self.domain_email = Trie()
+        self._lock = threading.Lock()
+        self._memuat = True
+        self._tambahan_saat_muat = []
+        threading.Thread(target=self._muat, daemon=True).start()
+
+    def _muat(self):
+        # Koneksi terpisah karena koneksi SQLite tidak dipakai bersama antar thread
+        penyimpanan = PenyimpananBiodata(self.penyimpanan.path)
+        try:
+            jurusan = Trie()
+            # Jumlah per jurusan sudah ada di tabel statistik (tanpa membaca seluruh data)
+            for nilai, jumlah in penyimpanan.statistik().get("jurusan", []):
+                jurusan.tambah(nilai, jumlah)
+            domain = Trie()
+            for nilai, jumlah in penyimpanan.jumlah_domain_email():
+                domain.tambah(nilai, jumlah)
+        finally:
+            penyimpanan.tutup()
+
+        with self._lock:
+            for record in self._tambahan_saat_muat:
+                self._tambah_ke(jurusan, domain, record)
+            self._tambahan_saat_muat = []
+            self.jurusan = jurusan
+            self.domain_email = domain
+            self._memuat = False
+
+    @staticmethod
+    def _tambah_ke(jurusan, domain, record):
+        jurusan.tambah(record.get("jurusan") or "")
+        nilai_domain = domain_email(record.get("email") or "")
+        if nilai_domain:
+            domain.tambah(nilai_domain)
+
+    def tambah(self, record):
+        """Perbarui trie setelah record tersimpan"""
+        with self._lock:
+            self._tambah_ke(self.jurusan, self.domain_email, record)
+            if self._memuat:
+                self._tambahan_saat_muat.append(record)
+
+    def saran_jurusan(self, teks):
+        """Saran jurusan untuk teks yang sedang diketik"""
+        teks = teks.strip()
+        if not teks:
+            return []
+        return [nilai for nilai in self.jurusan.cari(teks) if nilai != teks]
+
+    def saran_email(self, teks):
+        """Saran email: bagian sebelum @ tetap, domain dilengkapi"""
+        lokal, at, domain = teks.strip().partition("@")
+        if not at or not lokal:
+            return []
+        return [f"{lokal}@{nilai}" for nilai in self.domain_email.cari(domain) if nilai != domain]
+
+
+class PelengkapOtomatis:
+    """Dropdown saran di bawah Entry; sumber(teks) mengembalikan daftar saran"""
+
+    TOMBOL_NAVIGASI = ("Up", "Down", "Return", "Tab", "Escape", "Shift_L", "Shift_R")
+
+    def __init__(self, entry, sumber, jumlah_baris=6):
+        self.entry = entry
+        self.sumber = sumber
+        self.jumlah_baris = jumlah_baris
+        self.popup = None
+        self.listbox = None
+
+        # Bindtag sendiri di depan agar "break" bisa mencegah binding Entry (misalnya Return)
+        tag = f"PelengkapOtomatis{id(self)}"
+        entry.bindtags((tag,) + entry.bindtags())
+        entry.bind_class(tag, "<KeyRelease>", self._ketik)
+        entry.bind_class(tag, "<Down>", lambda e: self._pindah(1))
+        entry.bind_class(tag, "<Up>", lambda e: self._pindah(-1))
+        entry.bind_class(tag, "<Return>", self._pilih)
+        entry.bind_class(tag, "<Tab>", self._pilih)
+        entry.bind_class(tag, "<Escape>", self._batal)
+        entry.bind_class(tag, "<FocusOut>", lambda e: entry.after(150, self.tutup))
+
+    def _ketik(self, event):
+        if event.keysym in self.TOMBOL_NAVIGASI:
+            return
+        saran = self.sumber(self.entry.get())
+        if saran:
+            self._tampilkan(saran)
+        else:
+            self.tutup()
+
+    def _tampilkan(self, saran):
+        if self.popup is None:
+            self.popup = tk.Toplevel(self.entry)
+            self.popup.wm_overrideredirect(True)
+            self.listbox = tk.Listbox(
+                self.popup,
+                font=self.entry.cget("font"),
+                width=self.entry.cget("width"),
+                exportselection=False
+            )
+            self.listbox.pack(fill=tk.BOTH, expand=True)
+            self.listbox.bind("<ButtonPress-1>", self._klik)
+
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *saran)
+        self.listbox.config(height=min(len(saran), self.jumlah_baris))
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"+{x}+{y}")
+        self.popup.lift()
+
+    def _pindah(self, arah):
+        if self.popup is None:
+            return None
+        terpilih = self.listbox.curselection()
+        indeks = terpilih[0] + arah if terpilih else (0 if arah > 0 else self.listbox.size() - 1)
+        indeks = max(0, min(indeks, self.listbox.size() - 1))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(indeks)
+        self.listbox.see(indeks)
+        return "break"
+
+    def _isi(self, nilai):
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, nilai)
+        self.entry.icursor(tk.END)
+        self.tutup()
+
+    def _pilih(self, event=None):
+        """Return/Tab: pakai saran yang disorot; tanpa sorotan, binding Entry berjalan biasa"""
+        if self.popup is None:
+            return None
+        terpilih = self.listbox.curselection()
+        if not terpilih:
+            self.tutup()
+            return None
+        self._isi(self.listbox.get(terpilih[0]))
+        return "break"
+
+    def _klik(self, event):
+        self._isi(self.listbox.get(self.listbox.nearest(event.y)))
+        self.entry.focus_set()
+        return "break"
+
+    def _batal(self, event=None):
+        if self.popup is None:
+            return None
+        self.tutup()
+        return "break"
+
+    def tutup(self):
+        """Sembunyikan dropdown saran"""
+        if self.popup is not None:
+            self.popup.destroy()
+            self.popup = None
+            self.listbox = None
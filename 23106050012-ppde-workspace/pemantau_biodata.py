@@ -0,0 +1,129 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+
+# Konstanta inotify (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+FORMAT_EVENT = "iIII"
+UKURAN_EVENT = struct.calcsize(FORMAT_EVENT)
+
+UKURAN_BLOK = 5000
+
+
+class _Inotify:
+    """Pantau perubahan file di satu folder lewat inotify (Linux) dengan ctypes"""
+
+    def __init__(self, folder, nama_file, sinyal):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        # AttributeError di sistem tanpa inotify (bukan Linux)
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 gagal")
+        wd = libc.inotify_add_watch(
+            self.fd, os.fsencode(folder), IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE | IN_MOVED_TO
+        )
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch gagal untuk {folder}")
+
+        # File database beserta -wal/-journal; -shm diabaikan karena juga disentuh pembaca
+        self.nama_file = os.fsencode(nama_file)
+        self.sinyal = sinyal
+        self._berhenti = threading.Event()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        try:
+            while not self._berhenti.is_set():
+                siap, _, _ = select.select([self.fd], [], [], 1.0)
+                if not siap:
+                    continue
+                data = os.read(self.fd, 64 * 1024)
+                posisi = 0
+                while posisi < len(data):
+                    _, _, _, panjang = struct.unpack_from(FORMAT_EVENT, data, posisi)
+                    nama = data[posisi + UKURAN_EVENT:posisi + UKURAN_EVENT + panjang].rstrip(b"\0")
+                    posisi += UKURAN_EVENT + panjang
+                    if nama.startswith(self.nama_file) and not nama.endswith(b"-shm"):
+                        self.sinyal.set()
+        finally:
+            os.close(self.fd)
+
+    def hentikan(self):
+        self._berhenti.set()
+
+
+class PemantauBiodata:
+    """Deteksi record baru dari proses lain dan baca hanya record yang bertambah
+
+    Dengan inotify, database hanya diperiksa setelah file-nya berubah; tanpa inotify
+    (fallback polling), PRAGMA data_version diperiksa berkala. Yang dibaca hanya record
+    dengan id lebih besar dari id terakhir yang sudah dilihat (lewat primary key),
+    per blok, lalu diteruskan ke callback(rows) di thread Tk.
+    """
+
+    def __init__(self, widget, penyimpanan, callback, interval_ms=100, interval_polling_ms=1000):
+        self.widget = widget
+        self.penyimpanan = penyimpanan
+        self.callback = callback
+        self.id_terakhir = penyimpanan.conn.execute("SELECT COALESCE(MAX(id), 0) FROM biodata").fetchone()[0]
+        self._versi = self._data_version()
+        self._sinyal = threading.Event()
+        self._job = None
+
+        path = os.path.abspath(penyimpanan.path)
+        try:
+            self.inotify = _Inotify(os.path.dirname(path), os.path.basename(path), self._sinyal)
+            self.interval_ms = interval_ms
+        except (OSError, AttributeError):
+            self.inotify = None
+            self.interval_ms = interval_polling_ms
+        self._jadwalkan(self.interval_ms)
+
+    def _data_version(self):
+        # Berubah setiap kali koneksi lain melakukan commit ke database
+        return self.penyimpanan.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _jadwalkan(self, ms):
+        self._job = self.widget.after(ms, self._periksa)
+
+    def _periksa(self):
+        self._job = None
+        if self.inotify is None or self._sinyal.is_set():
+            self._sinyal.clear()
+            versi = self._data_version()
+            if versi != self._versi:
+                self._versi = versi
+                if self._baca_baru():
+                    # Masih ada sisa record (misalnya impor massal): lanjutkan segera
+                    self._versi = None
+                    self._sinyal.set()
+                    self._jadwalkan(1)
+                    return
+        self._jadwalkan(self.interval_ms)
+
+    def _baca_baru(self):
+        """Baca satu blok record baru, mengembalikan True jika blok penuh (mungkin masih ada)"""
+        rows = self.penyimpanan.conn.execute(
+            "SELECT * FROM biodata WHERE id > ? ORDER BY id LIMIT ?", (self.id_terakhir, UKURAN_BLOK)
+        ).fetchall()
+        if not rows:
+            return False
+        self.id_terakhir = rows[-1]["id"]
+        self.callback(rows)
+        return len(rows) == UKURAN_BLOK
+
+    def hentikan(self):
+        """Hentikan pemantauan"""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        if self.inotify is not None:
+            self.inotify.hentikan()
@@ -0,0 +1,409 @@
+import sqlite3
+import contextlib
+import csv
+import os
+import re
+import tempfile
+import datetime
+
+# File database dan file CSV lama (untuk kompatibilitas)
+DB_FILE = "biodata.db"
+CSV_FILE = "biodata_tersimpan.csv"
+
+# Urutan kolom pada file CSV dan kolom yang sesuai di database
+KOLOM_CSV = ["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin", "Email", "Telepon", "Tanggal Lahir"]
+KOLOM_DB = ["nama", "nim", "jurusan", "alamat", "jenis_kelamin", "email", "telepon", "tanggal_lahir"]
+
+SKEMA = """
+CREATE TABLE IF NOT EXISTS biodata (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama TEXT NOT NULL,
+    nim TEXT NOT NULL,
+    jurusan TEXT,
+    alamat TEXT,
+    jenis_kelamin TEXT,
+    email TEXT,
+    telepon TEXT,
+    tanggal_lahir TEXT,
+    diinput_oleh TEXT,
+    waktu_input TEXT,
+    foto TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_biodata_nim ON biodata(nim);
+CREATE INDEX IF NOT EXISTS idx_biodata_nama ON biodata(nama COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_biodata_jurusan ON biodata(jurusan);
+CREATE INDEX IF NOT EXISTS idx_biodata_email ON biodata(email);
+CREATE INDEX IF NOT EXISTS idx_biodata_tanggal_lahir ON biodata(tanggal_lahir);
+CREATE INDEX IF NOT EXISTS idx_biodata_telepon ON biodata(telepon);
+"""
+
+# Indeks teks lengkap (FTS5) untuk nama dan alamat, dijaga otomatis oleh trigger
+SKEMA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS biodata_fts USING fts5(
+    nama, alamat,
+    content='biodata', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS biodata_fts_insert AFTER INSERT ON biodata BEGIN
+    INSERT INTO biodata_fts(rowid, nama, alamat) VALUES (new.id, new.nama, new.alamat);
+END;
+CREATE TRIGGER IF NOT EXISTS biodata_fts_delete AFTER DELETE ON biodata BEGIN
+    INSERT INTO biodata_fts(biodata_fts, rowid, nama, alamat) VALUES ('delete', old.id, old.nama, old.alamat);
+END;
+CREATE TRIGGER IF NOT EXISTS biodata_fts_update AFTER UPDATE ON biodata BEGIN
+    INSERT INTO biodata_fts(biodata_fts, rowid, nama, alamat) VALUES ('delete', old.id, old.nama, old.alamat);
+    INSERT INTO biodata_fts(rowid, nama, alamat) VALUES (new.id, new.nama, new.alamat);
+END;
+"""
+
+# Indeks trigram nama untuk deteksi duplikat dengan nama yang mirip (bukan sama persis)
+SKEMA_TRIGRAM = """
+CREATE VIRTUAL TABLE IF NOT EXISTS biodata_trigram USING fts5(
+    nama,
+    content='biodata', content_rowid='id',
+    tokenize='trigram',
+    detail='none'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS biodata_trigram_vocab USING fts5vocab(biodata_trigram, 'row');
+CREATE TRIGGER IF NOT EXISTS biodata_trigram_insert AFTER INSERT ON biodata BEGIN
+    INSERT INTO biodata_trigram(rowid, nama) VALUES (new.id, new.nama);
+END;
+CREATE TRIGGER IF NOT EXISTS biodata_trigram_delete AFTER DELETE ON biodata BEGIN
+    INSERT INTO biodata_trigram(biodata_trigram, rowid, nama) VALUES ('delete', old.id, old.nama);
+END;
+CREATE TRIGGER IF NOT EXISTS biodata_trigram_update AFTER UPDATE OF nama ON biodata BEGIN
+    INSERT INTO biodata_trigram(biodata_trigram, rowid, nama) VALUES ('delete', old.id, old.nama);
+    INSERT INTO biodata_trigram(rowid, nama) VALUES (new.id, new.nama);
+END;
+"""
+
+# Penghitung berjalan untuk panel statistik, diperbarui trigger dalam transaksi yang sama
+SKEMA_STATISTIK = """
+CREATE TABLE IF NOT EXISTS statistik (
+    kategori TEXT NOT NULL,
+    kunci TEXT NOT NULL,
+    jumlah INTEGER NOT NULL,
+    PRIMARY KEY (kategori, kunci)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS statistik_insert AFTER INSERT ON biodata BEGIN
+    INSERT INTO statistik VALUES
+        ('total', '', 1),
+        ('jurusan', COALESCE(new.jurusan, ''), 1),
+        ('jenis_kelamin', COALESCE(new.jenis_kelamin, ''), 1),
+        ('tahun_lahir', CASE WHEN length(new.tanggal_lahir) = 10 THEN substr(new.tanggal_lahir, 7, 4) ELSE '' END, 1),
+        ('diinput_oleh', COALESCE(new.diinput_oleh, ''), 1)
+    ON CONFLICT (kategori, kunci) DO UPDATE SET jumlah = jumlah + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS statistik_delete AFTER DELETE ON biodata BEGIN
+    UPDATE statistik SET jumlah = jumlah - 1 WHERE (kategori, kunci) IN (VALUES
+        ('total', ''),
+        ('jurusan', COALESCE(old.jurusan, '')),
+        ('jenis_kelamin', COALESCE(old.jenis_kelamin, '')),
+        ('tahun_lahir', CASE WHEN length(old.tanggal_lahir) = 10 THEN substr(old.tanggal_lahir, 7, 4) ELSE '' END),
+        ('diinput_oleh', COALESCE(old.diinput_oleh, ''))
+    );
+END;
+"""
+
+# Hitung ulang statistik dari seluruh data (hanya sebagai fallback)
+SQL_BANGUN_STATISTIK = """
+INSERT INTO statistik
+SELECT 'total', '', COUNT(*) FROM biodata
+UNION ALL SELECT 'jurusan', COALESCE(jurusan, ''), COUNT(*) FROM biodata GROUP BY 2
+UNION ALL SELECT 'jenis_kelamin', COALESCE(jenis_kelamin, ''), COUNT(*) FROM biodata GROUP BY 2
+UNION ALL SELECT 'tahun_lahir', CASE WHEN length(tanggal_lahir) = 10 THEN substr(tanggal_lahir, 7, 4) ELSE '' END, COUNT(*)
+    FROM biodata GROUP BY 2
+UNION ALL SELECT 'diinput_oleh', COALESCE(diinput_oleh, ''), COUNT(*) FROM biodata GROUP BY 2
+"""
+
+SQL_INSERT = (
+    "INSERT INTO biodata (" + ", ".join(KOLOM_DB) + ", foto, diinput_oleh, waktu_input) "
+    "VALUES (" + ", ".join("?" * (len(KOLOM_DB) + 3)) + ")"
+)
+
+# Insert hanya jika NIM belum ada. Cek dan insert terjadi dalam transaksi IMMEDIATE yang
+# sama, jadi proses lain (PC lab lain) tidak bisa menyisipkan NIM yang sama di antaranya
+SQL_INSERT_UNIK = (
+    "INSERT INTO biodata (" + ", ".join(KOLOM_DB) + ", foto, diinput_oleh, waktu_input) "
+    "SELECT " + ", ".join("?" * (len(KOLOM_DB) + 3)) + " "
+    "WHERE NOT EXISTS (SELECT 1 FROM biodata WHERE nim = ?)"
+)
+
+
+class NIMSudahAda(Exception):
+    """NIM sudah tersimpan (bisa oleh proses lain) sehingga record tidak disimpan"""
+
+    def __init__(self, nim):
+        super().__init__(f"NIM {nim} sudah tersimpan")
+        self.nim = nim
+
+
+def buka_koneksi(path=DB_FILE):
+    """Buka koneksi SQLite (default mode WAL) yang aman dipakai banyak proses sekaligus
+
+    Transaksi tulis dimulai dengan BEGIN IMMEDIATE sehingga penulis dari proses lain
+    mengantri (sampai timeout) alih-alih gagal saat menaikkan lock. Untuk database di
+    folder jaringan bersama, set BIODATA_JOURNAL_MODE=DELETE karena WAL membutuhkan
+    shared memory di satu komputer.
+    """
+    conn = sqlite3.connect(path, timeout=30, isolation_level="IMMEDIATE")
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA journal_mode={os.environ.get('BIODATA_JOURNAL_MODE', 'WAL')}")
+    conn.execute("PRAGMA synchronous=FULL")
+    return conn
+
+
+@contextlib.contextmanager
+def tulis_atomik(path):
+    """Tulis file lewat file sementara unik lalu ganti sekaligus
+
+    Pembaca tidak pernah melihat file setengah jadi dan beberapa proses yang menulis
+    file yang sama tidak saling menimpa di tengah jalan (yang terakhir selesai menang).
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, path_sementara = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path_sementara, path)
+    except BaseException:
+        if os.path.exists(path_sementara):
+            os.remove(path_sementara)
+        raise
+
+
+class PenyimpananBiodata:
+    """Penyimpanan biodata berbasis SQLite dengan indeks NIM, jurusan dan email"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        # Menandai database yang baru dibuat (misalnya untuk impor CSV lama)
+        self.baru = not os.path.exists(path)
+        self.conn = buka_koneksi(path)
+        self.conn.executescript(SKEMA)
+        self._siapkan_kolom()
+        self._siapkan_fts("biodata_fts", SKEMA_FTS)
+        self._siapkan_fts("biodata_trigram", SKEMA_TRIGRAM)
+        self._siapkan_statistik()
+
+    def _siapkan_kolom(self):
+        """Tambahkan kolom yang belum ada di database lama"""
+        kolom = {row["name"] for row in self.conn.execute("PRAGMA table_info(biodata)")}
+        if "foto" not in kolom:
+            try:
+                self.conn.execute("ALTER TABLE biodata ADD COLUMN foto TEXT")
+            except sqlite3.OperationalError as e:
+                # Proses lain sudah menambahkannya lebih dulu
+                if "duplicate column" not in str(e):
+                    raise
+
+    def _siapkan_fts(self, tabel, skema):
+        """Buat indeks teks lengkap; database lama diindeks sekali saat tabel FTS pertama dibuat"""
+        ada_fts = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (tabel,)
+        ).fetchone()
+        self.conn.executescript(skema)
+        if not ada_fts:
+            with self.conn:
+                self.conn.execute(f"INSERT INTO {tabel}({tabel}) VALUES ('rebuild')")
+
+    def _siapkan_statistik(self):
+        """Buat tabel statistik; database lama dihitung sekali saat tabel pertama dibuat"""
+        ada_statistik = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'statistik'"
+        ).fetchone()
+        self.conn.executescript(SKEMA_STATISTIK)
+        if not ada_statistik:
+            self.bangun_ulang_statistik()
+
+    def bangun_ulang_statistik(self):
+        """Hitung ulang semua penghitung statistik dari data (fallback, membaca seluruh tabel)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM statistik")
+            self.conn.execute(SQL_BANGUN_STATISTIK)
+
+    def statistik(self):
+        """Penghitung statistik per kategori: {kategori: [(kunci, jumlah), ...]}"""
+        hasil = {}
+        for kategori, kunci, jumlah in self.conn.execute(
+            "SELECT kategori, kunci, jumlah FROM statistik WHERE jumlah > 0 ORDER BY kategori, kunci"
+        ):
+            hasil.setdefault(kategori, []).append((kunci, jumlah))
+        return hasil
+
+    def _baris(self, record, diinput_oleh, waktu_input):
+        return [record.get(kolom, "") for kolom in KOLOM_DB] + [record.get("foto"), diinput_oleh, waktu_input]
+
+    def _insert_unik(self, record, diinput_oleh, waktu_input):
+        """Insert jika NIM belum ada (panggil di dalam transaksi), mengembalikan id atau None"""
+        cursor = self.conn.execute(
+            SQL_INSERT_UNIK,
+            self._baris(record, diinput_oleh, waktu_input) + [record.get("nim", "")]
+        )
+        return cursor.lastrowid if cursor.rowcount else None
+
+    def _insert_semua(self, items, waktu_input):
+        ids = []
+        for record, diinput_oleh in items:
+            id_record = self._insert_unik(record, diinput_oleh, waktu_input)
+            if id_record is None:
+                raise NIMSudahAda(record.get("nim", ""))
+            ids.append(id_record)
+        return ids
+
+    def simpan(self, record, diinput_oleh=None):
+        """Simpan satu record biodata, mengembalikan id record (raise NIMSudahAda jika NIM sudah ada)"""
+        return self.simpan_batch([(record, diinput_oleh)])[0]
+
+    def simpan_batch(self, items):
+        """Simpan daftar (record, diinput_oleh) dalam satu transaksi (satu commit), mengembalikan daftar id
+
+        Jika salah satu NIM sudah ada, tidak ada record yang disimpan (raise NIMSudahAda).
+        """
+        waktu_input = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            return self._insert_semua(items, waktu_input)
+
+    def simpan_kelompok(self, kelompok):
+        """Simpan beberapa kelompok [(record, diinput_oleh), ...] dalam satu transaksi (satu commit)
+
+        Setiap kelompok tersimpan utuh atau tidak sama sekali (SAVEPOINT): kelompok dengan
+        NIM yang sudah ada tidak membatalkan kelompok lain. Mengembalikan hasil per
+        kelompok, berupa daftar id atau NIMSudahAda.
+        """
+        waktu_input = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        hasil = []
+        with self.conn:
+            # SAVEPOINT di luar transaksi akan memulai transaksi DEFERRED, jadi mulai eksplisit
+            self.conn.execute("BEGIN IMMEDIATE")
+            for items in kelompok:
+                self.conn.execute("SAVEPOINT kelompok")
+                try:
+                    hasil.append(self._insert_semua(items, waktu_input))
+                except NIMSudahAda as e:
+                    self.conn.execute("ROLLBACK TO kelompok")
+                    hasil.append(e)
+                self.conn.execute("RELEASE kelompok")
+        return hasil
+
+    def simpan_banyak(self, records, diinput_oleh=None):
+        """Simpan banyak record dalam satu transaksi tanpa cek NIM (migrasi data lama), mengembalikan jumlah record"""
+        waktu_input = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            cursor = self.conn.executemany(
+                SQL_INSERT,
+                (self._baris(record, diinput_oleh, waktu_input) for record in records)
+            )
+        return cursor.rowcount
+
+    def simpan_banyak_unik(self, records, diinput_oleh=None):
+        """Simpan banyak record dalam satu transaksi, melewati record yang NIM-nya sudah ada
+
+        NIM yang sama di dalam records sendiri juga hanya disimpan sekali. Mengembalikan
+        indeks (dalam records) dari record yang dilewati.
+        """
+        waktu_input = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            return [
+                i for i, record in enumerate(records)
+                if self._insert_unik(record, diinput_oleh, waktu_input) is None
+            ]
+
+    def cari_nim(self, nim):
+        """Cari record terbaru berdasarkan NIM (lewat indeks, O(log n))"""
+        return self.conn.execute(
+            "SELECT * FROM biodata WHERE nim = ? ORDER BY id DESC LIMIT 1", (nim,)
+        ).fetchone()
+
+    def cari_jurusan(self, jurusan, limit=100):
+        """Cari record berdasarkan jurusan"""
+        return self.conn.execute(
+            "SELECT * FROM biodata WHERE jurusan = ? ORDER BY id LIMIT ?", (jurusan, limit)
+        ).fetchall()
+
+    def cari_email(self, email):
+        """Cari record berdasarkan email"""
+        return self.conn.execute(
+            "SELECT * FROM biodata WHERE email = ? ORDER BY id", (email,)
+        ).fetchall()
+
+    @staticmethod
+    def query_teks(teks):
+        """Ubah teks pencarian menjadi query FTS: setiap kata dicari sebagai awalan (AND)"""
+        kata = re.findall(r"\w+", teks.lower())
+        return " AND ".join(f'"{k}"*' for k in kata) if kata else None
+
+    def cari_teks(self, teks, limit=50):
+        """Cari record berdasarkan kata/awalan kata pada nama dan alamat"""
+        query = self.query_teks(teks)
+        if query is None:
+            return []
+        return self.conn.execute(
+            "SELECT biodata.* FROM biodata_fts JOIN biodata ON biodata.id = biodata_fts.rowid "
+            "WHERE biodata_fts MATCH ? LIMIT ?", (query, limit)
+        ).fetchall()
+
+    def frekuensi_trigram(self, daftar_trigram):
+        """Jumlah record per trigram nama: {trigram: jumlah} (dari vocabulary indeks trigram)"""
+        daftar_trigram = list(daftar_trigram)
+        return dict(self.conn.execute(
+            f"SELECT term, doc FROM biodata_trigram_vocab WHERE term IN ({', '.join('?' * len(daftar_trigram))})",
+            daftar_trigram
+        ).fetchall())
+
+    def cari_nama(self, nama, limit=2000):
+        """Cari record dengan nama yang sama (tanpa beda huruf besar/kecil, lewat indeks nama)"""
+        return self.conn.execute(
+            "SELECT * FROM biodata WHERE nama = ? COLLATE NOCASE LIMIT ?", (nama, limit)
+        ).fetchall()
+
+    def cari_trigram(self, daftar_trigram, limit=2000):
+        """Cari record yang namanya mengandung salah satu trigram (yang paling banyak berbagi trigram dulu)"""
+        query = " OR ".join('"' + t.replace('"', '""') + '"' for t in daftar_trigram)
+        return self.conn.execute(
+            "SELECT biodata.* FROM biodata_trigram JOIN biodata ON biodata.id = biodata_trigram.rowid "
+            "WHERE biodata_trigram MATCH ? ORDER BY biodata_trigram.rank LIMIT ?", (query, limit)
+        ).fetchall()
+
+    def cari_tanggal_lahir(self, tanggal_lahir, limit=2000):
+        """Cari record berdasarkan tanggal lahir"""
+        return self.conn.execute(
+            "SELECT * FROM biodata WHERE tanggal_lahir = ? LIMIT ?", (tanggal_lahir, limit)
+        ).fetchall()
+
+    def cari_telepon(self, daftar_telepon):
+        """Cari record berdasarkan nomor telepon (beberapa penulisan nomor yang sama)"""
+        return self.conn.execute(
+            f"SELECT * FROM biodata WHERE telepon IN ({', '.join('?' * len(daftar_telepon))})",
+            list(daftar_telepon)
+        ).fetchall()
+
+    def jumlah_domain_email(self):
+        """Jumlah record per domain email: [(domain, jumlah), ...] (memindai indeks email)"""
+        return self.conn.execute(
+            "SELECT lower(substr(email, instr(email, '@') + 1)) AS domain, COUNT(*) FROM biodata "
+            "WHERE instr(email, '@') > 0 GROUP BY domain"
+        ).fetchall()
+
+    def jumlah(self):
+        """Jumlah record yang tersimpan"""
+        return self.conn.execute("SELECT COUNT(*) FROM biodata").fetchone()[0]
+
+    def ekspor_csv(self, path=CSV_FILE):
+        """Ekspor semua record ke file CSV dengan format lama, mengembalikan jumlah baris"""
+        jumlah = 0
+        with tulis_atomik(path) as file:
+            writer = csv.writer(file)
+            writer.writerow(KOLOM_CSV)
+            cursor = self.conn.execute("SELECT " + ", ".join(KOLOM_DB) + " FROM biodata ORDER BY id")
+            for row in cursor:
+                writer.writerow(row)
+                jumlah += 1
+        return jumlah
+
+    def tutup(self):
+        """Tutup koneksi database"""
+        self.conn.close()
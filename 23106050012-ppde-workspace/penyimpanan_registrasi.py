@@ -0,0 +1,178 @@
+import logging
+import queue
+import sqlite3
+import threading
+
+from kredensial import ITERASI, hash_password
+
+REGISTRASI_DB = "registrasi.db"
+
+# Penanda untuk menghentikan thread pemeriksa
+_BERHENTI = object()
+
+# Email (tanpa beda huruf besar/kecil) dan telepon unik: dijamin indeks, bukan hanya dicek aplikasi
+SKEMA_REGISTRASI = """
+CREATE TABLE IF NOT EXISTS registrasi (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nama TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    age INTEGER,
+    gender TEXT,
+    password_salt TEXT NOT NULL,
+    password_hash TEXT NOT NULL,
+    iterasi INTEGER NOT NULL,
+    registration_date TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_registrasi_email ON registrasi(email COLLATE NOCASE);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_registrasi_phone ON registrasi(phone);
+"""
+
+KOLOM_REGISTRASI = [
+    "nama", "email", "phone", "age", "gender",
+    "password_salt", "password_hash", "iterasi", "registration_date",
+]
+SQL_INSERT_REGISTRASI = (
+    "INSERT INTO registrasi (" + ", ".join(KOLOM_REGISTRASI) + ") "
+    "VALUES (" + ", ".join("?" * len(KOLOM_REGISTRASI)) + ")"
+)
+
+
+class SudahTerdaftar(Exception):
+    """Email atau nomor telepon sudah dipakai registrasi lain"""
+
+    def __init__(self, field, nilai):
+        super().__init__(f"{'Email' if field == 'email' else 'Nomor telepon'} {nilai} sudah terdaftar")
+        self.field = field
+        self.nilai = nilai
+
+
+def siapkan_record(user_data, iterasi=ITERASI):
+    """Ubah user_data (dengan 'password') menjadi baris tabel; password hanya disimpan sebagai hash
+
+    PBKDF2 sengaja lambat, jadi panggil di luar thread UI.
+    """
+    salt, hash_hex = hash_password(user_data["password"], iterasi=iterasi)
+    record = {kolom: user_data.get(kolom) for kolom in KOLOM_REGISTRASI}
+    record.update(password_salt=salt, password_hash=hash_hex, iterasi=iterasi)
+    return record
+
+
+class PenyimpananRegistrasi:
+    """Penyimpanan registrasi pengguna (SQLite) dengan indeks unik email dan telepon
+
+    Satu koneksi boleh dipakai beberapa thread; akses dijaga lock.
+    """
+
+    def __init__(self, path=REGISTRASI_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level="IMMEDIATE", check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SKEMA_REGISTRASI)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _field_bentrok(error):
+        # Pesan IntegrityError menyebut kolom indeks unik yang dilanggar
+        return "email" if "registrasi.email" in str(error) else "phone"
+
+    def simpan(self, record):
+        """Simpan satu registrasi (hasil siapkan_record), mengembalikan id; raise SudahTerdaftar jika bentrok"""
+        try:
+            with self._lock, self.conn:
+                cursor = self.conn.execute(SQL_INSERT_REGISTRASI, [record[kolom] for kolom in KOLOM_REGISTRASI])
+        except sqlite3.IntegrityError as e:
+            field = self._field_bentrok(e)
+            raise SudahTerdaftar(field, record[field]) from None
+        return cursor.lastrowid
+
+    def simpan_banyak(self, records):
+        """Simpan banyak registrasi dalam satu transaksi, mengembalikan jumlah yang tersimpan
+
+        Record yang email/teleponnya sudah terdaftar dilewati (bukan membatalkan seluruh batch).
+        """
+        with self._lock, self.conn:
+            sebelum = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE" + SQL_INSERT_REGISTRASI[len("INSERT"):],
+                ([record[kolom] for kolom in KOLOM_REGISTRASI] for record in records)
+            )
+            return self.conn.total_changes - sebelum
+
+    def email_terdaftar(self, email):
+        """True jika email sudah terdaftar (lewat indeks unik, tanpa beda huruf besar/kecil)"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT 1 FROM registrasi WHERE email = ? COLLATE NOCASE", (email,)
+            ).fetchone() is not None
+
+    def telepon_terdaftar(self, phone):
+        """True jika nomor telepon sudah terdaftar"""
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM registrasi WHERE phone = ?", (phone,)).fetchone() is not None
+
+    def jumlah(self):
+        """Jumlah registrasi yang tersimpan"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM registrasi").fetchone()[0]
+
+    def tutup(self):
+        """Tutup koneksi database"""
+        self.conn.close()
+
+
+class PemeriksaTerdaftar:
+    """Cek "sudah terdaftar" untuk UI, dijalankan di thread latar belakang
+
+    Thread UI tidak pernah menunggu SQLite (yang bisa terkunci oleh penulis lain). Hanya
+    permintaan terakhir per field ("email"/"phone") yang diperiksa; callback(field, nilai,
+    terdaftar) dipanggil lewat proses_hasil() dari thread UI.
+    """
+
+    def __init__(self, penyimpanan):
+        self.penyimpanan = penyimpanan
+        self.antrian = queue.Queue()
+        self.hasil = queue.Queue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def periksa(self, field, nilai, callback):
+        """Minta pengecekan nilai field tanpa menunggu hasilnya"""
+        self.antrian.put((field, nilai, callback))
+
+    def _loop(self):
+        while True:
+            item = self.antrian.get()
+            # Permintaan yang sudah disusul ketikan berikutnya di field yang sama tidak perlu dicek
+            terbaru = {}
+            while item is not _BERHENTI:
+                terbaru[item[0]] = item
+                try:
+                    item = self.antrian.get_nowait()
+                except queue.Empty:
+                    break
+            if item is _BERHENTI:
+                break
+            for field, nilai, callback in terbaru.values():
+                cek = self.penyimpanan.email_terdaftar if field == "email" else self.penyimpanan.telepon_terdaftar
+                try:
+                    terdaftar = cek(nilai)
+                except sqlite3.Error as e:
+                    logging.error(f"Checking registered {field} failed: {e}")
+                    continue
+                self.hasil.put((callback, field, nilai, terdaftar))
+
+    def proses_hasil(self):
+        """Jalankan callback untuk pengecekan yang sudah selesai (panggil dari thread UI)"""
+        while True:
+            try:
+                callback, field, nilai, terdaftar = self.hasil.get_nowait()
+            except queue.Empty:
+                break
+            callback(field, nilai, terdaftar)
+
+    def hentikan(self, timeout=5.0):
+        """Hentikan thread pemeriksa (tunggu query yang sedang berjalan sebelum koneksi ditutup)"""
+        self.antrian.put(_BERHENTI)
+        self.thread.join(timeout)
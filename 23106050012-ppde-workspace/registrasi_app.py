@@ -1,7 +1,28 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
+import os
 import re
-from datetime import datetime, date
+from datetime import datetime
+
+from blokir_domain import DaftarBlokirDomain
+from kekuatan_password import PenilaiLatar
+from layanan_registrasi import KlienRegistrasi, ServerRegistrasi
+from mesin_validasi import MesinValidasi, cocok, memuat, panjang_minimal, sama_dengan, wajib
+from penyimpanan_registrasi import REGISTRASI_DB, PemeriksaTerdaftar, PenyimpananRegistrasi
+
+# Regex dikompilasi sekali dan dipakai bersama oleh semua aturan validasi
+POLA_NAMA = re.compile(r'^[a-zA-Z\s]+$')
+POLA_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+POLA_TELEPON = re.compile(r'^08\d{8,11}$')
+POLA_HURUF = re.compile(r'[a-zA-Z]')
+POLA_ANGKA = re.compile(r'\d')
+
+# Password dengan skor kekuatan di bawah ini ditolak (0 = sangat lemah .. 4 = sangat kuat)
+SKOR_PASSWORD_MINIMAL = 2
+WARNA_SKOR = ["red", "orangered", "orange", "yellowgreen", "green"]
+
+# Jeda setelah ketikan terakhir sebelum email/telepon dicek ke database (milidetik)
+JEDA_CEK_TERDAFTAR = 300
 
 class RegistrasiApp:
     def __init__(self):
@@ -20,20 +41,34 @@ class RegistrasiApp:
         self.gender_var = tk.StringVar(value="Pria")
         self.agree_var = tk.BooleanVar()
 
-        # Dictionary untuk menyimpan status validasi
-        self.validation_status = {
-            'nama': False,
-            'email': False,
-            'phone': False,
-            'password': False,
-            'confirm_password': False,
-            'age': False,
-            'agree': False
-        }
-        
+        # Klien registrasi asyncio; tanpa REGISTRASI_URL dipakai layanan pengganti lokal
+        # yang menyimpan registrasi ke REGISTRASI_DB
+        url = os.environ.get("REGISTRASI_URL")
+        self.server_lokal = None
+        self.penyimpanan = None
+        self.pemeriksa_terdaftar = None
+        if url is None:
+            self.server_lokal = ServerRegistrasi(path=REGISTRASI_DB).mulai()
+            url = self.server_lokal.url
+            # Koneksi sendiri untuk cek "sudah terdaftar" (lewat indeks unik) di thread latar belakang
+            self.penyimpanan = PenyimpananRegistrasi(REGISTRASI_DB)
+            self.pemeriksa_terdaftar = PemeriksaTerdaftar(self.penyimpanan)
+        # Hasil cek terakhir per field: (nilai, terdaftar); job after() yang menunda cek berikutnya
+        self._terdaftar = {}
+        self._job_terdaftar = {}
+        self.klien = KlienRegistrasi(url)
+        self._registrasi_berjalan = None
+
+        # Kamus password dimuat di thread latar belakang agar tidak menunda startup
+        self.penilai_password = PenilaiLatar()
+        self._kekuatan_password = None
+        # Daftar domain email sekali pakai (file indeks di-mmap, tidak dimuat ke memori)
+        self.blokir_domain = DaftarBlokirDomain()
 
         self.buat_interface()
         self.setup_validation()
+        self.window.protocol("WM_DELETE_WINDOW", self.window.quit)
+        self._cek_kekuatan()
 
     def buat_interface(self):
         # Judul
@@ -72,6 +107,23 @@ class RegistrasiApp:
             main_frame, "Password:", self.password_var,
             "password", "Minimal 8 karakter, kombinasi huruf dan angka", show="*"
         )
+        # Meter kekuatan password di samping indikator
+        self.password_strength_var = tk.IntVar()
+        ttk.Progressbar(
+            self.password_entry.master,
+            variable=self.password_strength_var,
+            maximum=5,
+            length=70
+        ).pack(side=tk.LEFT, padx=5)
+        self.password_strength_label = tk.Label(
+            self.password_entry.master,
+            text="",
+            font=("Arial", 9, "bold"),
+            bg="lightgray",
+            width=11,
+            anchor="w"
+        )
+        self.password_strength_label.pack(side=tk.LEFT)
 
         # Konfirmasi Password
         self.buat_input_field(
@@ -112,14 +164,15 @@ class RegistrasiApp:
         self.age_indicator.pack(side=tk.LEFT, padx=5)
 
         # Hint untuk umur
-        tk.Label(
+        self.age_hint = tk.Label(
             main_frame,
             text="Minimal 13 tahun",
             font=("Arial", 9),
             fg="gray",
             bg="lightgray",
             anchor="w"
-        ).pack(fill=tk.X, padx=25)
+        )
+        self.age_hint.pack(fill=tk.X, padx=25)
 
         # Gender dengan Radiobutton
         gender_frame = tk.Frame(main_frame, bg="lightgray")
@@ -266,7 +319,73 @@ class RegistrasiApp:
         setattr(self, f"{field_name}_hint", hint_label)
 
     def setup_validation(self):
-        """Setup validasi real-time untuk semua field"""
+        """Setup validasi real-time untuk semua field
+
+        Aturan dan dependensi setiap field didaftarkan ke mesin validasi; perubahan satu
+        field hanya mengevaluasi ulang field itu dan field yang bergantung padanya
+        (password -> confirm_password).
+        """
+        self.validasi = MesinValidasi(tampilkan=self.set_validation_status)
+        self.validasi.tambah(
+            'nama', lambda: self.nama_var.get().strip(),
+            [
+                panjang_minimal(3, "Nama terlalu pendek"),
+                cocok(POLA_NAMA, "Hanya huruf dan spasi diperbolehkan"),
+                lambda nama, ambil: None if nama.replace(' ', '') else "Nama tidak boleh kosong",
+            ],
+            "Nama valid", "Nama tidak valid"
+        )
+        aturan_email = [
+            wajib("Email tidak boleh kosong"),
+            cocok(POLA_EMAIL, "Format email tidak valid"),
+            lambda email, ambil: (
+                "Domain email sekali pakai/diblokir" if self.blokir_domain.diblokir(email.rpartition('@')[2]) else None
+            ),
+        ]
+        aturan_phone = [wajib("Nomor telepon tidak boleh kosong"), cocok(POLA_TELEPON, "Format: 08xxxxxxxxxx (10-13 digit)")]
+        if self.pemeriksa_terdaftar is not None:
+            aturan_email.append(self._aturan_terdaftar('email', "Email sudah terdaftar"))
+            aturan_phone.append(self._aturan_terdaftar('phone', "Nomor telepon sudah terdaftar"))
+        self.validasi.tambah(
+            'email', lambda: self.email_var.get().strip(), aturan_email,
+            "Email valid", "Email tidak valid"
+        )
+        self.validasi.tambah(
+            'phone', lambda: self.phone_var.get().strip(), aturan_phone,
+            "Nomor telepon valid", "Nomor telepon tidak valid"
+        )
+        self.validasi.tambah(
+            'password', self.password_var.get,
+            [
+                panjang_minimal(8, "Password minimal 8 karakter"),
+                memuat(POLA_HURUF, "Harus kombinasi huruf dan angka"),
+                memuat(POLA_ANGKA, "Harus kombinasi huruf dan angka"),
+                self._aturan_kekuatan,
+            ],
+            "Password valid", "Password tidak valid"
+        )
+        self.validasi.tambah(
+            'confirm_password', self.confirm_password_var.get,
+            [wajib("Konfirmasi password tidak boleh kosong"), sama_dengan('password', "Password tidak sama")],
+            "Password cocok", "Konfirmasi password tidak valid"
+        )
+        self.validasi.tambah(
+            'age', self._baca_umur,
+            [
+                lambda age, ambil: "Umur harus berupa angka" if age is None else None,
+                lambda age, ambil: "Umur minimal 13 tahun" if age < 13 else None,
+                lambda age, ambil: "Umur maksimal 100 tahun" if age > 100 else None,
+            ],
+            "Umur valid", "Umur tidak valid"
+        )
+        self.validasi.tambah(
+            'agree', self.agree_var.get,
+            [wajib("Anda harus menyetujui syarat dan ketentuan")],
+            pesan_gagal="Anda harus menyetujui syarat dan ketentuan"
+        )
+        # Status per field tetap bisa dibaca lewat atribut lama
+        self.validation_status = self.validasi.status
+
         self.nama_var.trace_add("write", lambda *args: self.validate_nama())
         self.email_var.trace_add("write", lambda *args: self.validate_email())
         self.phone_var.trace_add("write", lambda *args: self.validate_phone())
@@ -274,131 +393,128 @@ class RegistrasiApp:
         self.confirm_password_var.trace_add("write", lambda *args: self.validate_confirm_password())
         self.age_var.trace_add("write", lambda *args: self.validate_age())
 
+    def _aturan_terdaftar(self, field_name, pesan):
+        """Tolak nilai yang sudah terdaftar (hanya jika hasil cek untuk nilai ini sudah ada)
 
-    def validate_nama(self):
-        """Validasi nama lengkap"""
-        nama = self.nama_var.get().strip()
-
-        # Cek panjang minimal
-        if len(nama) < 3:
-            self.set_validation_status('nama', False, "Nama terlalu pendek")
-            return False
+        Cek sebenarnya berjalan di thread latar belakang setelah pengetikan berhenti sejenak;
+        nilai yang terdaftar di antara cek dan submit tetap ditolak oleh layanan registrasi.
+        """
+        def aturan(nilai, ambil):
+            return pesan if self._terdaftar.get(field_name) == (nilai, True) else None
+        return aturan
+
+    def _jadwalkan_cek_terdaftar(self, field_name):
+        """Tunda cek "sudah terdaftar" sampai pengetikan berhenti JEDA_CEK_TERDAFTAR ms"""
+        if self.pemeriksa_terdaftar is None:
+            return
+        job = self._job_terdaftar.pop(field_name, None)
+        if job is not None:
+            self.window.after_cancel(job)
+        # Nilai yang formatnya saja sudah salah tidak perlu dicek ke database
+        if self.validasi.status[field_name]:
+            self._job_terdaftar[field_name] = self.window.after(
+                JEDA_CEK_TERDAFTAR, self._kirim_cek_terdaftar, field_name
+            )
+
+    def _kirim_cek_terdaftar(self, field_name):
+        self._job_terdaftar.pop(field_name, None)
+        self.pemeriksa_terdaftar.periksa(field_name, self.validasi.ambil(field_name), self._terdaftar_diperiksa)
+
+    def _terdaftar_diperiksa(self, field_name, nilai, terdaftar):
+        """Simpan hasil cek dan evaluasi ulang field jika nilainya masih sama (hasil basi diabaikan)"""
+        if self.validasi.ambil(field_name) != nilai:
+            return
+        self._terdaftar[field_name] = (nilai, terdaftar)
+        if terdaftar:
+            self._validasi_field(field_name)
+
+    def _aturan_kekuatan(self, password, ambil):
+        """Tolak password yang mudah ditebak (hanya jika penilaian untuk password ini sudah ada)"""
+        hasil = self._kekuatan_password
+        if not password or hasil is None or hasil.password != password or hasil.skor >= SKOR_PASSWORD_MINIMAL:
+            return None
+        return f"Password terlalu mudah ditebak: {hasil.saran}"
+
+    def _tampilkan_kekuatan(self, hasil):
+        """Update meter kekuatan dari hasil penilai (penilaian yang sudah basi diabaikan)"""
+        password = self.password_var.get()
+        if hasil.password != password:
+            return
+        lemah_sebelumnya = self._aturan_kekuatan(password, None) is not None
+        self._kekuatan_password = hasil
+        if password:
+            self.password_strength_var.set(hasil.skor + 1)
+            self.password_strength_label.config(text=hasil.label, fg=WARNA_SKOR[hasil.skor])
+        else:
+            self.password_strength_var.set(0)
+            self.password_strength_label.config(text="")
+        # Hasil datang setelah field dievaluasi: evaluasi ulang hanya jika putusannya berubah
+        if (self._aturan_kekuatan(password, None) is not None) != lemah_sebelumnya:
+            self._validasi_field('password')
+
+    def _cek_kekuatan(self):
+        """Ambil hasil penilaian kekuatan password dan cek "sudah terdaftar" dari thread latar belakang"""
+        self.penilai_password.proses_hasil()
+        if self.pemeriksa_terdaftar is not None:
+            self.pemeriksa_terdaftar.proses_hasil()
+        self.window.after(50, self._cek_kekuatan)
+
+    def _baca_umur(self):
+        """Nilai umur, atau None jika isi spinbox bukan angka"""
+        try:
+            return self.age_var.get()
+        except tk.TclError:
+            return None
 
-        # Cek hanya huruf dan spasi
-        if not re.match(r'^[a-zA-Z\s]+$', nama):
-            self.set_validation_status('nama', False, "Hanya huruf dan spasi diperbolehkan")
-            return False
+    def _validasi_field(self, field_name):
+        """Evaluasi ulang satu field (dan dependennya) lalu update tombol submit"""
+        valid = self.validasi.perbarui(field_name)
+        self.update_submit_button()
+        return valid
 
-        # Cek tidak boleh hanya spasi
-        if nama.replace(' ', '') == '':
-            self.set_validation_status('nama', False, "Nama tidak boleh kosong")
-            return False
 
-        self.set_validation_status('nama', True, "Nama valid")
-        return True
+    def validate_nama(self):
+        """Validasi nama lengkap"""
+        return self._validasi_field('nama')
 
     def validate_email(self):
-        """Validasi format email"""
-        email = self.email_var.get().strip()
-
-        if not email:
-            self.set_validation_status('email', False, "Email tidak boleh kosong")
-            return False
-
-        # Pattern regex untuk email
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-
-        if not re.match(email_pattern, email):
-            self.set_validation_status('email', False, "Format email tidak valid")
-            return False
-
-        self.set_validation_status('email', True, "Email valid")
-        return True
+        """Validasi format email, domain yang diblokir dan email yang sudah terdaftar"""
+        valid = self._validasi_field('email')
+        self._jadwalkan_cek_terdaftar('email')
+        return valid
 
     def validate_phone(self):
-        """Validasi nomor telepon"""
-        phone = self.phone_var.get().strip()
-
-        if not phone:
-            self.set_validation_status('phone', False, "Nomor telepon tidak boleh kosong")
-            return False
-
-        # Cek format nomor Indonesia
-        if not re.match(r'^08\d{8,11}$', phone):
-            self.set_validation_status('phone', False, "Format: 08xxxxxxxxxx (10-13 digit)")
-            return False
-
-        self.set_validation_status('phone', True, "Nomor telepon valid")
-        return True
+        """Validasi nomor telepon dan nomor yang sudah terdaftar"""
+        valid = self._validasi_field('phone')
+        self._jadwalkan_cek_terdaftar('phone')
+        return valid
 
     def validate_password(self):
-        """Validasi password"""
-        password = self.password_var.get()
-
-        if len(password) < 8:
-            self.set_validation_status('password', False, "Password minimal 8 karakter")
-            return False
-
-        # Cek kombinasi huruf dan angka
-        if not re.search(r'[a-zA-Z]', password) or not re.search(r'\d', password):
-            self.set_validation_status('password', False, "Harus kombinasi huruf dan angka")
-            return False
-
-        self.set_validation_status('password', True, "Password valid")
-        # Validasi ulang confirm password jika sudah diisi
-        if self.confirm_password_var.get():
-            self.validate_confirm_password()
-        return True
+        """Validasi password (konfirmasi password ikut divalidasi ulang lewat dependensinya)"""
+        self._validasi_field('password')
+        # Hasil penilaian bisa langsung atau menyusul; aturan kekuatan dievaluasi ulang jika perlu
+        self.penilai_password.nilai(self.password_var.get(), self._tampilkan_kekuatan)
+        return self.validasi.status['password']
 
     def validate_confirm_password(self):
         """Validasi konfirmasi password"""
-        password = self.password_var.get()
-        confirm = self.confirm_password_var.get()
-
-        if not confirm:
-            self.set_validation_status('confirm_password', False, "Konfirmasi password tidak boleh kosong")
-            return False
-
-        if password != confirm:
-            self.set_validation_status('confirm_password', False, "Password tidak sama")
-            return False
-
-        self.set_validation_status('confirm_password', True, "Password cocok")
-        return True
+        return self._validasi_field('confirm_password')
 
     def validate_age(self):
         """Validasi umur"""
-        try:
-            age = self.age_var.get()
-            if age < 13:
-                self.set_validation_status('age', False, "Umur minimal 13 tahun")
-                return False
-            elif age > 100:
-                self.set_validation_status('age', False, "Umur maksimal 100 tahun")
-                return False
-
-            self.set_validation_status('age', True, "Umur valid")
-            return True
-        except:
-            self.set_validation_status('age', False, "Umur harus berupa angka")
-            return False
+        return self._validasi_field('age')
 
     def validate_agreement(self):
         """Validasi checkbox persetujuan"""
-        if self.agree_var.get():
-            self.validation_status['agree'] = True
-        else:
-            self.validation_status['agree'] = False
-
-        self.update_submit_button()
+        return self._validasi_field('agree')
     
     def set_validation_status(self, field_name, is_valid, message):
-        """Set status validasi dan update tampilan"""
-        self.validation_status[field_name] = is_valid
-
-        # Update indikator visual
-        indicator = getattr(self, f"{field_name}_indicator")
-        hint_label = getattr(self, f"{field_name}_hint")
+        """Update tampilan indikator dan hint satu field (dipanggil mesin validasi)"""
+        # Checkbox persetujuan tidak punya indikator
+        indicator = getattr(self, f"{field_name}_indicator", None)
+        hint_label = getattr(self, f"{field_name}_hint", None)
+        if indicator is None or hint_label is None:
+            return
 
         if is_valid:
             indicator.config(fg="green")
@@ -407,23 +523,11 @@ class RegistrasiApp:
             indicator.config(fg="red")
             hint_label.config(fg="red", text=f"✗ {message}")
 
-        # Update tombol submit
-        self.update_submit_button()
-
-    def update_submit_button(self):
-        """Update status tombol submit berdasarkan validasi"""
-        all_valid = all(self.validation_status.values())
-
-        if hasattr(self, 'submit_btn'):
-            if all_valid:
-                self.submit_btn.config(state=tk.NORMAL, bg="green")
-            else:
-                self.submit_btn.config(state=tk.DISABLED, bg="gray")
-    
     def update_submit_button(self):
         """Update status tombol submit dan progress bar"""
-        valid_count = sum(1 for status in self.validation_status.values() if status)
-        total_fields = len(self.validation_status)
+        # Jumlah field valid dijaga mesin validasi, tidak dihitung ulang setiap ketukan
+        valid_count = self.validasi.jumlah_valid
+        total_fields = self.validasi.jumlah
         progress_percentage = (valid_count / total_fields) * 100
 
         # Update progress bar
@@ -432,10 +536,11 @@ class RegistrasiApp:
 
         # Update tombol submit
         if hasattr(self, 'submit_btn'):
-            if progress_percentage == 100:
+            if self.validasi.semua_valid:
                 self.submit_btn.config(state=tk.NORMAL, bg="green")
             else:
                 self.submit_btn.config(state=tk.DISABLED, bg="gray")
+
     def submit_form(self):
         """Submit form dengan error handling lengkap"""
         try:
@@ -443,7 +548,7 @@ class RegistrasiApp:
             if not self.final_validation():
                 return
 
-            # Simulasi proses registrasi
+            # Proses registrasi, tombol submit berubah menjadi tombol batal
             self.show_loading()
 
             # Kumpulkan data
@@ -451,37 +556,49 @@ class RegistrasiApp:
                 'nama': self.nama_var.get().strip(),
                 'email': self.email_var.get().strip(),
                 'phone': self.phone_var.get().strip(),
+                # Hanya dikirim ke layanan registrasi; yang disimpan hash-nya (PBKDF2 di thread server)
+                'password': self.password_var.get(),
                 'age': self.age_var.get(),
                 'gender': self.gender_var.get(),
                 'registration_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
 
-            # Simulasi delay proses
-            self.window.after(2000, lambda: self.complete_registration(user_data))
+            # Kirim ke layanan registrasi tanpa memblokir loop Tk, hasilnya dicek lewat after()
+            future = self.klien.kirim(user_data)
+            self._registrasi_berjalan = future
+            self.window.after(20, lambda: self._cek_registrasi(future, user_data))
 
         except Exception as e:
             self.hide_loading()
             messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
 
+    def _cek_registrasi(self, future, user_data):
+        """Periksa hasil registrasi yang berjalan di thread klien"""
+        if not future.done():
+            self.window.after(20, lambda: self._cek_registrasi(future, user_data))
+            return
+        self._registrasi_berjalan = None
+
+        if future.cancelled():
+            self.hide_loading()
+            return
+        error = future.exception()
+        if error is not None:
+            self.hide_loading()
+            messagebox.showerror("Registrasi Gagal", f"Registrasi gagal: {error}")
+            return
+        self.complete_registration(user_data)
+
+    def batalkan_registrasi(self):
+        """Batalkan registrasi yang sedang diproses"""
+        if self._registrasi_berjalan is not None:
+            self._registrasi_berjalan.cancel()
+
     def final_validation(self):
         """Validasi final sebelum submit"""
-        errors = []
-
         # Validasi ulang semua field
-        if not self.validate_nama():
-            errors.append("Nama tidak valid")
-        if not self.validate_email():
-            errors.append("Email tidak valid")
-        if not self.validate_phone():
-            errors.append("Nomor telepon tidak valid")
-        if not self.validate_password():
-            errors.append("Password tidak valid")
-        if not self.validate_confirm_password():
-            errors.append("Konfirmasi password tidak valid")
-        if not self.validate_age():
-            errors.append("Umur tidak valid")
-        if not self.agree_var.get():
-            errors.append("Anda harus menyetujui syarat dan ketentuan")
+        errors = self.validasi.evaluasi_semua()
+        self.update_submit_button()
 
         if errors:
             error_message = "Perbaiki kesalahan berikut:\n\n" + "\n".join(f"• {error}" for error in errors)
@@ -492,7 +609,8 @@ class RegistrasiApp:
 
     def show_loading(self):
         """Tampilkan loading state"""
-        self.submit_btn.config(text="MEMPROSES...", state=tk.DISABLED, bg="orange")
+        # Selama diproses, tombol submit membatalkan registrasi
+        self.submit_btn.config(text="BATALKAN", state=tk.NORMAL, bg="orange", command=self.batalkan_registrasi)
 
         # Disable semua input
         for widget_name in ['nama_entry', 'email_entry', 'phone_entry', 'password_entry', 'confirm_password_entry']:
@@ -501,7 +619,7 @@ class RegistrasiApp:
 
     def hide_loading(self):
         """Sembunyikan loading state"""
-        self.submit_btn.config(text="DAFTAR SEKARANG", state=tk.NORMAL, bg="green")
+        self.submit_btn.config(text="DAFTAR SEKARANG", state=tk.NORMAL, bg="green", command=self.submit_form)
 
         # Enable kembali semua input
         for widget_name in ['nama_entry', 'email_entry', 'phone_entry', 'password_entry', 'confirm_password_entry']:
@@ -547,9 +665,9 @@ Selamat datang di aplikasi kami!
         self.gender_var.set("Pria")
         self.agree_var.set(False)
 
-        # Reset status validasi
-        for key in self.validation_status:
-            self.validation_status[key] = False
+        # Reset status validasi (nilai yang baru didaftarkan harus dicek ulang)
+        self.validasi.reset()
+        self._terdaftar.clear()
 
         # Reset tampilan indikator
         for field in ['nama', 'email', 'phone', 'password', 'confirm_password', 'age']:
@@ -558,16 +676,23 @@ Selamat datang di aplikasi kami!
             indicator.config(fg="red")
             hint_label.config(fg="gray")
 
-        # Reset progress
-        self.progress_var.set(0)
-        self.progress_label.config(text="0% Complete (0/7 fields)")
-
-        # Reset tombol
-        self.submit_btn.config(state=tk.DISABLED, bg="gray")
+        # Reset progress dan tombol
+        self.update_submit_button()
 
     def jalankan(self):
         """Method untuk menjalankan aplikasi"""
-        self.window.mainloop()
+        try:
+            self.window.mainloop()
+        finally:
+            # Registrasi yang masih berjalan dibatalkan saat aplikasi ditutup
+            self.klien.tutup()
+            self.penilai_password.hentikan()
+            self.blokir_domain.tutup()
+            if self.server_lokal is not None:
+                self.server_lokal.hentikan()
+                self.pemeriksa_terdaftar.hentikan()
+                self.penyimpanan.tutup()
+            self.window.destroy()
 
 # Untuk menjalankan aplikasi
 if __name__ == "__main__":
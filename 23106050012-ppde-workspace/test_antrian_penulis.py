@@ -0,0 +1,62 @@
+import threading
+
+import antrian_penulis
+from antrian_penulis import AntrianPenulis
+from penyimpanan_biodata import NIMSudahAda, PenyimpananBiodata
+
+
+def test_record_dan_batch_tersimpan_lewat_callback(penyimpanan, buat_record):
+    penulis = AntrianPenulis(penyimpanan.path)
+    hasil = []
+    penulis.kirim(buat_record("1"), "ani", lambda id_record, error: hasil.append((id_record, error)))
+    penulis.kirim(buat_record("1"), "ani", lambda id_record, error: hasil.append((id_record, error)))
+    penulis.kirim_batch(
+        [(buat_record("2"), "ani"), (buat_record("3"), "ani")],
+        lambda ids, error: hasil.append((ids, error))
+    )
+    assert penulis.kosongkan(timeout=5)
+    assert penulis.hentikan(timeout=5)
+
+    assert isinstance(hasil[0][0], int) and hasil[0][1] is None
+    assert hasil[1][0] is None and isinstance(hasil[1][1], NIMSudahAda)
+    assert len(hasil[2][0]) == 2 and hasil[2][1] is None
+    assert penyimpanan.jumlah() == 3
+
+
+def test_database_gagal_dibuka_menggagalkan_semua_record(tmp_path, buat_record, monkeypatch):
+    mulai = threading.Event()
+
+    class PenyimpananGagal(PenyimpananBiodata):
+        def __init__(self, path):
+            mulai.wait(5)
+            raise OSError("disk penuh")
+
+    monkeypatch.setattr(antrian_penulis, "PenyimpananBiodata", PenyimpananGagal)
+    penulis = AntrianPenulis(str(tmp_path / "biodata.db"))
+    hasil = []
+    # Satu record sudah mengantre sebelum database gagal dibuka, satu lagi sesudahnya
+    penulis.kirim(buat_record("1"), "ani", lambda id_record, error: hasil.append(error))
+    mulai.set()
+    assert penulis.kosongkan(timeout=5)
+    penulis.kirim_batch([(buat_record("2"), "ani")], lambda ids, error: hasil.append(error))
+
+    assert penulis.hentikan(timeout=5)
+    assert [str(error) for error in hasil] == ["disk penuh", "disk penuh"]
+    assert isinstance(penulis.error, OSError)
+
+
+def test_kosongkan_dibatasi_waktu(tmp_path, buat_record, monkeypatch):
+    lanjut = threading.Event()
+
+    class PenyimpananLambat(PenyimpananBiodata):
+        def simpan_kelompok(self, kelompok):
+            lanjut.wait(5)
+            return super().simpan_kelompok(kelompok)
+
+    monkeypatch.setattr(antrian_penulis, "PenyimpananBiodata", PenyimpananLambat)
+    penulis = AntrianPenulis(str(tmp_path / "biodata.db"))
+    penulis.kirim(buat_record("1"))
+    assert not penulis.kosongkan(timeout=0.1)
+    lanjut.set()
+    assert penulis.kosongkan(timeout=5)
+    assert penulis.hentikan(timeout=5)
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from blokir_domain import DaftarBlokirDomain, normalisasi_domain
+
+ATURAN = """\
+# Domain sekali pakai
+mailinator.com
+*.example.net   # hanya subdomain
+Tempmail.IO.
+bücher.de
+*.почта.рф
+"""
+
+
+@pytest.fixture
+def daftar(tmp_path):
+    sumber = tmp_path / "domain_diblokir.txt"
+    sumber.write_text(ATURAN, encoding="utf-8")
+    daftar = DaftarBlokirDomain(str(sumber))
+    yield daftar
+    daftar.tutup()
+
+
+@pytest.mark.parametrize("domain, aturan", [
+    ("mailinator.com", "mailinator.com"),
+    ("Mail.Mailinator.COM", "mailinator.com"),
+    ("a.b.example.net", "*.example.net"),
+    ("example.net", None),
+    ("tempmail.io", "tempmail.io"),
+    ("mailinator.co", None),
+    ("notmailinator.com", None),
+    ("com", None),
+    ("", None),
+])
+def test_aturan_domain_dan_wildcard(daftar, domain, aturan):
+    assert daftar.aturan_cocok(domain) == aturan
+
+
+def test_domain_non_ascii_dalam_bentuk_idna(daftar):
+    assert daftar.diblokir("BÜCHER.de")
+    assert daftar.diblokir("xn--bcher-kva.de")
+    assert daftar.diblokir("mail.почта.рф")
+    assert not daftar.diblokir("почта.рф")
+    assert not daftar.diblokir("bucher.de")
+
+
+def test_domain_tidak_valid_tidak_cocok():
+    assert normalisasi_domain("ä" * 80 + ".com") == ""
+
+
+def test_indeks_dibangun_ulang_saat_sumber_berubah(tmp_path):
+    sumber = tmp_path / "domain_diblokir.txt"
+    sumber.write_text("lama.com\n")
+    DaftarBlokirDomain(str(sumber)).tutup()
+
+    sumber.write_text("baru.com\n")
+    waktu = os.path.getmtime(tmp_path / "domain_diblokir.idx") + 10
+    os.utime(sumber, (waktu, waktu))
+    daftar = DaftarBlokirDomain(str(sumber))
+    assert daftar.diblokir("baru.com") and not daftar.diblokir("lama.com")
+    daftar.tutup()
+
+
+def test_indeks_diabaikan_jika_sumber_dihapus(tmp_path):
+    sumber = tmp_path / "domain_diblokir.txt"
+    sumber.write_text("mailinator.com\n")
+    DaftarBlokirDomain(str(sumber)).tutup()
+
+    sumber.unlink()
+    daftar = DaftarBlokirDomain(str(sumber))
+    assert not daftar.diblokir("mailinator.com")
+    daftar.tutup()
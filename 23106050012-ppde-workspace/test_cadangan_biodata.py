@@ -0,0 +1,81 @@
+import gzip
+import os
+
+import pytest
+
+from cadangan_biodata import baca_manifest, cadangan_inkremental, cadangan_penuh, pulihkan, snapshot
+from penyimpanan_biodata import PenyimpananBiodata
+
+
+def isi(penyimpanan):
+    return [tuple(row) for row in penyimpanan.conn.execute("SELECT id, nim, nama FROM biodata ORDER BY id")]
+
+
+def buka(path):
+    penyimpanan = PenyimpananBiodata(str(path))
+    try:
+        return isi(penyimpanan), [row["nim"] for row in penyimpanan.cari_teks("Santoso")]
+    finally:
+        penyimpanan.tutup()
+
+
+def test_snapshot_membuang_record_yang_digantikan(tmp_path, penyimpanan, buat_record):
+    penyimpanan.simpan_banyak([buat_record("1", nama="Budi Lama"), buat_record("2"), buat_record("1")])
+
+    assert snapshot(penyimpanan.path, str(tmp_path / "padat.db")) == 3
+    rows, ditemukan = buka(tmp_path / "padat.db")
+    assert [row[:2] for row in rows] == [(2, "2"), (3, "1")]
+    assert sorted(ditemukan) == ["1", "2"]
+
+    snapshot(penyimpanan.path, str(tmp_path / "utuh.db"), padatkan=False)
+    assert len(buka(tmp_path / "utuh.db")[0]) == 3
+    # Database asli tidak ikut dipadatkan
+    assert len(isi(penyimpanan)) == 3
+
+
+def test_penuh_inkremental_lalu_pulihkan(tmp_path, penyimpanan, buat_record):
+    folder = tmp_path / "cadangan"
+    penyimpanan.simpan(buat_record("1"))
+    cadangan_penuh(penyimpanan.path, str(folder), padatkan=False)
+    assert cadangan_inkremental(penyimpanan.path, str(folder)) == 0
+
+    penyimpanan.simpan(buat_record("2"))
+    penyimpanan.simpan(buat_record("3"))
+    assert cadangan_inkremental(penyimpanan.path, str(folder)) == 2
+    penyimpanan.simpan(buat_record("4"))
+    assert cadangan_inkremental(penyimpanan.path, str(folder)) == 1
+    manifest = baca_manifest(str(folder))
+    assert [(s["id_awal"], s["id_akhir"]) for s in manifest["segmen"]] == [(2, 3), (4, 4)]
+
+    tujuan = tmp_path / "pulih.db"
+    assert pulihkan(str(folder), str(tujuan)) == 4
+    rows, ditemukan = buka(tujuan)
+    assert rows == isi(penyimpanan)
+    assert sorted(ditemukan) == ["1", "2", "3", "4"]
+
+
+def test_cadangan_penuh_baru_menghapus_yang_lama(tmp_path, penyimpanan, buat_record):
+    folder = tmp_path / "cadangan"
+    penyimpanan.simpan(buat_record("1"))
+    cadangan_penuh(penyimpanan.path, str(folder))
+    penyimpanan.simpan(buat_record("2"))
+    cadangan_inkremental(penyimpanan.path, str(folder))
+
+    baru = cadangan_penuh(penyimpanan.path, str(folder))
+    assert baru["id_terakhir"] == 2 and baru["segmen"] == []
+    # Snapshot dan segmen lama sudah tercakup snapshot baru
+    assert sorted(os.listdir(folder)) == sorted(["manifest.json", baru["snapshot"]])
+
+
+def test_pulihkan_menolak_segmen_rusak(tmp_path, penyimpanan, buat_record):
+    folder = tmp_path / "cadangan"
+    penyimpanan.simpan(buat_record("1"))
+    cadangan_penuh(penyimpanan.path, str(folder))
+    penyimpanan.simpan(buat_record("2"))
+    cadangan_inkremental(penyimpanan.path, str(folder))
+
+    segmen = folder / baca_manifest(str(folder))["segmen"][0]["file"]
+    with gzip.open(segmen, "wt", encoding="utf-8") as file:
+        file.write("{}\n")
+    with pytest.raises(ValueError):
+        pulihkan(str(folder), str(tmp_path / "pulih.db"))
@@ -0,0 +1,74 @@
+import itertools
+import random
+
+import pytest
+
+import duplikat_biodata
+from duplikat_biodata import AMBANG, cari_mirip, laporan_duplikat, skor_duplikat
+
+SUKU_KATA = ["bu", "di", "san", "to", "so", "ri", "ka", "ni", "ta", "ra"]
+
+
+def isi_acak(penyimpanan, buat_record, jumlah=300, seed=1):
+    """Record acak dengan nama, tanggal lahir dan telepon yang sering mirip/sama"""
+    acak = random.Random(seed)
+    records = []
+    for i in range(jumlah):
+        nama = " ".join(
+            "".join(acak.choice(SUKU_KATA) for _ in range(acak.randint(1, 3))) for _ in range(acak.randint(1, 2))
+        )
+        telepon = acak.choice(["", "081234567890", "+6281234567890", "0812 3456 7891", "081299990000"])
+        record = buat_record(
+            str(i), nama=nama, telepon=telepon, tanggal_lahir=acak.choice(["", "2000-01-01", "2001-02-03"])
+        )
+        penyimpanan.simpan(record)
+        records.append(record)
+    return records
+
+
+def pasangan_brute_force(rows, ambang=AMBANG):
+    hasil = {}
+    for a, b in itertools.combinations(rows, 2):
+        if a["nim"] == b["nim"]:
+            continue
+        skor, _ = skor_duplikat(a, b)
+        if skor >= ambang:
+            hasil[a["id"], b["id"]] = skor
+    return hasil
+
+
+def test_bonus_butuh_kemiripan_nama_minimal():
+    a = {"nama": "Budi Santoso", "tanggal_lahir": "2000-01-01", "telepon": "081234567890"}
+    b = dict(a, nama="Xavier Lee")
+    skor, mirip = skor_duplikat(a, b)
+    assert mirip == 0 and skor < AMBANG
+    assert skor_duplikat(a, dict(a, nama="Budi Santosa"))[0] >= AMBANG
+
+
+@pytest.mark.parametrize("ambang", [AMBANG, 0.5, 0.9])
+def test_laporan_sama_dengan_brute_force(penyimpanan, buat_record, ambang):
+    isi_acak(penyimpanan, buat_record)
+    rows = [dict(row) for row in penyimpanan.conn.execute("SELECT * FROM biodata ORDER BY id")]
+    harapan = pasangan_brute_force(rows, ambang)
+    assert harapan, "data uji harus punya pasangan mirip"
+
+    hasil = {(a["id"], b["id"]): skor for skor, _, a, b in laporan_duplikat(penyimpanan, ambang)}
+    assert hasil == pytest.approx(harapan)
+
+
+def test_cari_mirip_sama_dengan_brute_force(penyimpanan, buat_record):
+    records = isi_acak(penyimpanan, buat_record, jumlah=150)
+    rows = [dict(row) for row in penyimpanan.conn.execute("SELECT * FROM biodata ORDER BY id")]
+    for record in records[::7]:
+        baru = dict(record, nim="baru")
+        harapan = {row["id"] for row in rows if skor_duplikat(baru, row)[0] >= AMBANG}
+        hasil = {row["id"] for _, _, row in cari_mirip(penyimpanan, baru, batas=len(rows))}
+        assert hasil == harapan
+
+
+def test_kandidat_terpotong_dicatat(penyimpanan, buat_record, monkeypatch, caplog):
+    for i in range(5):
+        penyimpanan.simpan(buat_record(str(i), tanggal_lahir="2000-01-01"))
+    monkeypatch.setattr(duplikat_biodata, "BATAS_KANDIDAT", 3)
+    cari_mirip(penyimpanan, buat_record("baru", nama="Xavier", tanggal_lahir="2000-01-01"))
+    assert "truncated" in caplog.text
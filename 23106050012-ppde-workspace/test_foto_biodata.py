@@ -0,0 +1,107 @@
+import random
+import struct
+import zlib
+
+import pytest
+
+import foto_biodata
+from foto_biodata import decode_png_kecil
+
+
+def paeth(kiri, atas, kiri_atas):
+    p = kiri + atas - kiri_atas
+    pa, pb, pc = abs(p - kiri), abs(p - atas), abs(p - kiri_atas)
+    if pa <= pb and pa <= pc:
+        return kiri
+    return atas if pb <= pc else kiri_atas
+
+
+def filter_baris(jenis, baris, sebelum, bpp):
+    """Encoder acuan: filter PNG langsung dari spesifikasi, per byte"""
+    hasil = bytearray()
+    for i, nilai in enumerate(baris):
+        kiri = baris[i - bpp] if i >= bpp else 0
+        kiri_atas = sebelum[i - bpp] if i >= bpp else 0
+        prediksi = [0, kiri, sebelum[i], (kiri + sebelum[i]) // 2, paeth(kiri, sebelum[i], kiri_atas)][jenis]
+        hasil.append((nilai - prediksi) & 255)
+    return bytes(hasil)
+
+
+def chunk(jenis, isi):
+    return struct.pack(">I", len(isi)) + jenis + isi + struct.pack(">I", zlib.crc32(jenis + isi))
+
+
+def tulis_png(path, lebar, tinggi, baris, warna=6, kedalaman=8, interlace=0, filter_tetap=None, potong_idat=None):
+    """PNG dengan filter bergiliran (atau filter_tetap) tiap baris; IDAT bisa dipecah beberapa chunk"""
+    bpp = len(baris[0]) // lebar
+    data, sebelum = b"", bytes(lebar * bpp)
+    for y, isi in enumerate(baris):
+        jenis = y % 5 if filter_tetap is None else filter_tetap
+        data += bytes((jenis,)) + filter_baris(jenis, isi, sebelum, bpp)
+        sebelum = isi
+    mampat = zlib.compress(data)
+    potong_idat = potong_idat or len(mampat)
+    idat = b"".join(chunk(b"IDAT", mampat[i:i + potong_idat]) for i in range(0, len(mampat), potong_idat))
+    with open(path, "wb") as file:
+        file.write(foto_biodata.TANDA_PNG)
+        file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", lebar, tinggi, kedalaman, warna, 0, 0, interlace)))
+        file.write(chunk(b"tEXt", b"Comment\x00uji"))
+        file.write(idat)
+        file.write(chunk(b"IEND", b""))
+
+
+def gambar_acak(lebar, tinggi, bpp, seed=1):
+    acak = random.Random(seed)
+    return [bytes(acak.randrange(256) for _ in range(lebar * bpp)) for _ in range(tinggi)]
+
+
+@pytest.mark.parametrize("jenis_filter", [0, 1, 2, 3, 4])
+def test_decode_setiap_jenis_filter(tmp_path, jenis_filter):
+    baris = gambar_acak(7, 5, 4)
+    path = tmp_path / "foto.png"
+    tulis_png(path, 7, 5, baris, filter_tetap=jenis_filter)
+    assert decode_png_kecil(str(path)) == (7, 5, baris)
+
+
+def test_decode_rgb_diberi_alpha_penuh(tmp_path):
+    baris = gambar_acak(6, 4, 3)
+    path = tmp_path / "foto.png"
+    tulis_png(path, 6, 4, baris, warna=2, potong_idat=7)
+    rgba = [b"".join(isi[x:x + 3] + b"\xff" for x in range(0, len(isi), 3)) for isi in baris]
+    assert decode_png_kecil(str(path)) == (6, 4, rgba)
+
+
+def test_decode_memperkecil_dengan_subsample(tmp_path):
+    baris = gambar_acak(100, 30, 4)
+    path = tmp_path / "foto.png"
+    tulis_png(path, 100, 30, baris)
+    lebar, tinggi, hasil = decode_png_kecil(str(path), ukuran=48)
+    # faktor 3: setiap piksel ke-3 dari setiap baris ke-3
+    assert (lebar, tinggi) == (34, 10)
+    assert hasil == [b"".join(baris[y][x * 4:x * 4 + 4] for x in range(0, 100, 3)) for y in range(0, 30, 3)]
+
+
+@pytest.mark.parametrize("isian", [dict(kedalaman=16), dict(interlace=1), dict(warna=3), dict(warna=0)])
+def test_format_lain_ditolak(tmp_path, isian):
+    path = tmp_path / "foto.png"
+    tulis_png(path, 2, 2, gambar_acak(2, 2, 4), **isian)
+    with pytest.raises(ValueError):
+        decode_png_kecil(str(path))
+
+
+def test_png_terpotong_ditolak(tmp_path):
+    path = tmp_path / "foto.png"
+    tulis_png(path, 8, 8, gambar_acak(8, 8, 4))
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+    with pytest.raises(ValueError):
+        decode_png_kecil(str(path))
+
+
+def test_thumbnail_tanpa_pillow_bisa_di_decode_lagi(tmp_path):
+    baris = gambar_acak(9, 9, 4)
+    path = tmp_path / "foto.png"
+    tulis_png(path, 9, 9, baris)
+    path_thumb = tmp_path / "thumb" / "foto.png"
+    foto_biodata._tulis_thumbnail_tanpa_pillow(str(path), str(path_thumb))
+    assert decode_png_kecil(str(path_thumb)) == (9, 9, baris)
@@ -0,0 +1,73 @@
+import threading
+import time
+
+import indeks_nim
+from indeks_nim import BloomFilter, IndeksNIM
+from penyimpanan_biodata import PenyimpananBiodata
+
+
+def tunggu(kondisi, batas=5.0):
+    akhir = time.monotonic() + batas
+    while not kondisi():
+        assert time.monotonic() < akhir, "kondisi tidak terpenuhi"
+        time.sleep(0.01)
+
+
+def test_bloom_filter_tanpa_false_negative():
+    bloom = BloomFilter(1000)
+    for i in range(1000):
+        bloom.tambah(str(i))
+    assert all(str(i) in bloom for i in range(1000))
+    salah = sum(str(i) in bloom for i in range(1000, 11000))
+    assert salah < 300
+
+
+def test_ada_dan_tertunda(penyimpanan, buat_record):
+    penyimpanan.simpan(buat_record("1"))
+    indeks = IndeksNIM(penyimpanan)
+    tunggu(lambda: indeks.bloom is not None)
+    assert indeks.ada("1")
+    assert not indeks.ada("2")
+    indeks.tandai_tertunda("2")
+    assert indeks.ada("2")
+    indeks.batalkan("2")
+    assert not indeks.ada("2")
+
+
+def test_filter_diperbesar_setelah_melebihi_kapasitas(penyimpanan, buat_record):
+    indeks = IndeksNIM(penyimpanan)
+    tunggu(lambda: indeks.bloom is not None)
+    kapasitas = indeks.bloom.kapasitas
+    for i in range(kapasitas + 1):
+        penyimpanan.simpan(buat_record(str(i)))
+        indeks.tambah(str(i))
+    tunggu(lambda: indeks.bloom.kapasitas > kapasitas)
+    assert all(indeks.ada(str(i)) for i in range(0, kapasitas + 1, 97))
+
+
+def test_pemuatan_gagal_memakai_database_lalu_dicoba_lagi(penyimpanan, buat_record, monkeypatch):
+    penyimpanan.simpan(buat_record("1"))
+    gagal = threading.Event()
+    percobaan = []
+
+    class PenyimpananGagal(PenyimpananBiodata):
+        def __init__(self, path):
+            percobaan.append(path)
+            if not gagal.is_set():
+                gagal.set()
+                raise OSError("database terkunci")
+            super().__init__(path)
+
+    monkeypatch.setattr(indeks_nim, "PenyimpananBiodata", PenyimpananGagal)
+    indeks = IndeksNIM(penyimpanan, jeda_coba_ulang=0.05)
+    tunggu(lambda: gagal.is_set() and not indeks._memuat)
+
+    # Sebelum filter siap: tambah() tidak boleh error dan ada() tetap pasti lewat database
+    penyimpanan.simpan(buat_record("2"))
+    indeks.tambah("2")
+    assert indeks.ada("1") and indeks.ada("2") and not indeks.ada("3")
+
+    tunggu(lambda: indeks.bloom is not None)
+    assert len(percobaan) == 2
+    assert indeks.jeda_coba_ulang == 0.05
+    assert indeks.ada("1") and indeks.ada("2")
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from kekuatan_password import KATA_BAWAAN, PenilaiKekuatan
+
+
+@pytest.fixture
+def peringkat():
+    return {kata: i for i, kata in enumerate(KATA_BAWAAN, 1)}
+
+
+def ringkas(hasil):
+    return hasil.password, hasil.tebakan, hasil.skor, hasil.pola
+
+
+def test_inkremental_sama_dengan_penilaian_baru(peringkat):
+    """Mengetik, menghapus dan menempel teks harus memberi hasil yang sama dengan penilai baru"""
+    acak = random.Random(1)
+    huruf = "abcqwerty123!@sayangP4ss2024"
+    penilai = PenilaiKekuatan(peringkat)
+    password = ""
+    for _ in range(400):
+        aksi = acak.random()
+        if aksi < 0.6:
+            password += acak.choice(huruf)
+        elif aksi < 0.85:
+            password = password[:-acak.randint(1, 3)]
+        else:
+            # Sisipkan di tengah: awalan yang sama lebih pendek dari password sebelumnya
+            i = acak.randint(0, len(password))
+            password = password[:i] + acak.choice(KATA_BAWAAN) + password[i:]
+        password = password[:40]
+        assert ringkas(penilai.nilai(password)) == ringkas(PenilaiKekuatan(peringkat).nilai(password))
+
+
+@pytest.mark.parametrize("password, jenis", [
+    ("sayangku", "kamus"),
+    ("p4ssw0rd", "kamus"),
+    ("qwertyuiop", "kamus"),
+    ("zxcvbnm,./", "keyboard"),
+    ("aaaaaaaa", "ulang"),
+    ("abcdefg", "urutan"),
+    ("1998", "tahun"),
+])
+def test_pola_dikenali(peringkat, password, jenis):
+    hasil = PenilaiKekuatan(peringkat).nilai(password)
+    assert [p[0] for p in hasil.pola] == [jenis]
+    assert hasil.skor <= 1
+
+
+def test_password_acak_panjang_kuat(peringkat):
+    hasil = PenilaiKekuatan(peringkat).nilai("Xk9#vQ2!mZ7$tL")
+    assert hasil.skor == 4
+    assert hasil.saran == ""
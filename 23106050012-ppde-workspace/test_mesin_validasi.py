@@ -0,0 +1,52 @@
+from mesin_validasi import MesinValidasi, panjang_minimal, sama_dengan, wajib
+
+
+def buat_mesin(nilai):
+    dievaluasi = []
+    mesin = MesinValidasi(tampilkan=lambda nama, valid, pesan: dievaluasi.append((nama, valid, pesan)))
+    mesin.tambah('password', lambda: nilai['password'], [panjang_minimal(8, "pendek")], "ok", "password salah")
+    mesin.tambah('konfirmasi', lambda: nilai['konfirmasi'], [wajib("kosong"), sama_dengan('password', "beda")])
+    # Bergantung pada konfirmasi (dan lewat konfirmasi pada password)
+    mesin.tambah('ringkasan', lambda: nilai['password'], [], bergantung=('konfirmasi', 'password'))
+    return mesin, dievaluasi
+
+
+def test_aturan_dicek_berurutan_dan_berhenti_di_yang_pertama_gagal():
+    mesin, dievaluasi = buat_mesin({'password': "", 'konfirmasi': ""})
+    mesin.perbarui('konfirmasi')
+    assert dievaluasi[0] == ('konfirmasi', False, "kosong")
+
+
+def test_dependen_dievaluasi_dalam_urutan_topologis():
+    nilai = {'password': "rahasia123", 'konfirmasi': "rahasia123"}
+    mesin, dievaluasi = buat_mesin(nilai)
+    mesin.evaluasi_semua()
+    dievaluasi.clear()
+
+    mesin.perbarui('password')
+    # ringkasan bergantung pada keduanya, jadi harus sesudah konfirmasi
+    assert [nama for nama, _, _ in dievaluasi] == ['password', 'konfirmasi', 'ringkasan']
+    assert mesin.semua_valid
+
+
+def test_dependen_yang_belum_dievaluasi_tidak_ditandai_salah():
+    nilai = {'password': "rahasia123", 'konfirmasi': ""}
+    mesin, dievaluasi = buat_mesin(nilai)
+    mesin.perbarui('password')
+    assert dievaluasi == [('password', True, "ok")]
+
+
+def test_jumlah_valid_dijaga_berjalan():
+    nilai = {'password': "rahasia123", 'konfirmasi': "rahasia123"}
+    mesin, _ = buat_mesin(nilai)
+    assert mesin.evaluasi_semua() == []
+    assert mesin.jumlah_valid == 3
+
+    nilai['password'] = "pendek"
+    mesin.perbarui('password')
+    assert mesin.status == {'password': False, 'konfirmasi': False, 'ringkasan': True}
+    assert mesin.jumlah_valid == 1
+    assert mesin.evaluasi_semua() == ["password salah", 'konfirmasi']
+
+    mesin.reset()
+    assert mesin.jumlah_valid == 0 and not any(mesin.status.values())
@@ -0,0 +1,66 @@
+import csv
+from collections import Counter
+
+import pytest
+
+from migrasi_csv import baca_csv, deteksi_versi, impor_csv, konversi
+from penyimpanan_biodata import KOLOM_CSV
+
+HEADER_V1 = ["Nama", "NIM", "Jurusan", "Alamat", "Jenis Kelamin"]
+
+
+def tulis(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        csv.writer(file).writerows(rows)
+    return str(path)
+
+
+def test_deteksi_versi_dari_header():
+    assert deteksi_versi(HEADER_V1) == 1
+    assert deteksi_versi([" " + kolom for kolom in KOLOM_CSV]) == 2
+    assert deteksi_versi(["Budi", "1", "TI", "Jl", "Pria"]) is None
+
+
+def test_v1_dengan_header_dimigrasi(tmp_path):
+    path = tulis(tmp_path / "lama.csv", [HEADER_V1, ["Budi", "1", "TI", "Jl. A", "pria"], ["Sari", "2", "SI", "Jl. B", "P"]])
+    statistik = Counter()
+    assert list(baca_csv(path, statistik)) == [
+        ["Budi", "1", "TI", "Jl. A", "Laki-Laki", "", "", ""],
+        ["Sari", "2", "SI", "Jl. B", "Perempuan", "", "", ""],
+    ]
+    assert statistik == {1: 2}
+
+
+def test_tanpa_header_versi_dari_jumlah_kolom(tmp_path):
+    v2 = ["Sari", "2", "SI", "Jl. B", "Perempuan", "s@x.id", "0812", "2000-01-01"]
+    path = tulis(tmp_path / "campur.csv", [v2, ["Budi", "1", "TI", "Jl. A", "Wanita"], []])
+    statistik = Counter()
+    assert list(baca_csv(path, statistik)) == [v2, ["Budi", "1", "TI", "Jl. A", "Perempuan", "", "", ""]]
+    assert statistik == {2: 1, 1: 1}
+
+
+def test_baris_ragged_mengikuti_versi_file(tmp_path):
+    # Header v2, tetapi satu baris kurang kolom: dilengkapi kosong, bukan dianggap v1
+    path = tulis(tmp_path / "ragged.csv", [KOLOM_CSV, ["Budi", "1", "TI"]])
+    assert list(baca_csv(path)) == [["Budi", "1", "TI", "", "", "", "", ""]]
+
+
+def test_skema_tidak_dikenal_ditolak(tmp_path):
+    path = tulis(tmp_path / "aneh.csv", [["a", "b", "c"]])
+    with pytest.raises(ValueError):
+        list(baca_csv(path))
+
+
+def test_konversi_dan_impor(tmp_path, penyimpanan):
+    lama = tulis(tmp_path / "lama.csv", [HEADER_V1, ["Budi", "1", "TI", "Jl. A", "L"]])
+    baru = tulis(tmp_path / "baru.csv", [KOLOM_CSV, ["Sari", "2", "SI", "Jl. B", "Perempuan", "", "", ""]])
+    keluar = tmp_path / "gabungan.csv"
+    assert konversi([lama, baru], str(keluar)) == 2
+    with open(keluar, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == KOLOM_CSV and [row[0] for row in rows[1:]] == ["Budi", "Sari"]
+
+    assert impor_csv(penyimpanan, str(keluar), ukuran_chunk=1) == 2
+    assert [tuple(row) for row in penyimpanan.conn.execute("SELECT nim, jenis_kelamin FROM biodata ORDER BY id")] == [
+        ("1", "Laki-Laki"), ("2", "Perempuan"),
+    ]
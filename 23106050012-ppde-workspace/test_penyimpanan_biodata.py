@@ -0,0 +1,54 @@
+import pytest
+
+from penyimpanan_biodata import NIMSudahAda, PenyimpananBiodata
+
+
+def nim_tersimpan(penyimpanan):
+    return [row[0] for row in penyimpanan.conn.execute("SELECT nim FROM biodata ORDER BY id")]
+
+
+def test_simpan_menolak_nim_yang_sudah_ada(penyimpanan, buat_record):
+    penyimpanan.simpan(buat_record("1"), "admin")
+    with pytest.raises(NIMSudahAda) as info:
+        penyimpanan.simpan(buat_record("1"), "admin")
+    assert info.value.nim == "1"
+    assert nim_tersimpan(penyimpanan) == ["1"]
+
+
+def test_simpan_batch_semua_atau_tidak_sama_sekali(penyimpanan, buat_record):
+    penyimpanan.simpan(buat_record("2"))
+    with pytest.raises(NIMSudahAda):
+        penyimpanan.simpan_batch([(buat_record("1"), "a"), (buat_record("2"), "a")])
+    assert nim_tersimpan(penyimpanan) == ["2"]
+
+
+def test_simpan_kelompok_hanya_menggagalkan_kelompok_yang_bentrok(penyimpanan, buat_record):
+    penyimpanan.simpan(buat_record("1"))
+    hasil = penyimpanan.simpan_kelompok([
+        [(buat_record("1"), "a")],
+        [(buat_record("2"), "a"), (buat_record("3"), "a")],
+        [(buat_record("4"), "a"), (buat_record("2"), "a")],
+        [(buat_record("5"), "a"), (buat_record("5"), "a")],
+    ])
+    assert isinstance(hasil[0], NIMSudahAda)
+    assert len(hasil[1]) == 2 and all(isinstance(i, int) for i in hasil[1])
+    assert isinstance(hasil[2], NIMSudahAda) and hasil[2].nim == "2"
+    assert isinstance(hasil[3], NIMSudahAda)
+    assert nim_tersimpan(penyimpanan) == ["1", "2", "3"]
+    assert not penyimpanan.conn.in_transaction
+
+
+def test_simpan_kelompok_melihat_data_proses_lain(penyimpanan, buat_record):
+    lain = PenyimpananBiodata(penyimpanan.path)
+    try:
+        lain.simpan(buat_record("7"))
+    finally:
+        lain.tutup()
+    assert isinstance(penyimpanan.simpan_kelompok([[(buat_record("7"), "a")]])[0], NIMSudahAda)
+
+
+def test_simpan_banyak_unik_mengembalikan_indeks_yang_dilewati(penyimpanan, buat_record):
+    penyimpanan.simpan(buat_record("1"))
+    records = [buat_record("9"), buat_record("9"), buat_record("1"), buat_record("8")]
+    assert penyimpanan.simpan_banyak_unik(records, "impor") == [1, 2]
+    assert nim_tersimpan(penyimpanan) == ["1", "9", "8"]
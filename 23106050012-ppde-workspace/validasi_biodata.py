@@ -0,0 +1,90 @@
+import re
+import datetime
+
+# Regex dikompilasi sekali dan dipakai bersama oleh form dan impor massal
+POLA_EMAIL = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+POLA_TELP = re.compile(r"^(?:\+62|62|0)8\d{8,11}$")
+
+
+def validate_email(email):
+    """Validasi format email"""
+    return POLA_EMAIL.match(email)
+
+
+def validate_telp(telp):
+    """Validasi format telepon Indonesia"""
+    return POLA_TELP.match(telp)
+
+
+def validate_birth(birth):
+    """Validasi format tanggal lahir DD/MM/YYYY"""
+    try:
+        datetime.datetime.strptime(birth, "%d/%m/%Y")
+        return True
+    except ValueError:
+        return False
+
+
+def validasi_record(record):
+    """Validasi satu record biodata dengan aturan submit_data
+
+    Mengembalikan None jika valid, atau tuple (field, judul, pesan) untuk kesalahan pertama
+    (field bernilai None jika kesalahan tidak merujuk ke satu field).
+    """
+    nama = record.get("nama", "")
+    nim = record.get("nim", "")
+    jurusan = record.get("jurusan", "")
+
+    # Cek field kosong
+    if not nama or not nim or not jurusan:
+        return (None, "Input Kosong", "Semua field harus diisi!")
+
+    # Validasi format NIM (harus angka dan minimal 8 digit)
+    if not nim.isdigit() or len(nim) < 8:
+        return ("nim", "Format NIM Salah", "NIM harus berupa angka minimal 8 digit!")
+
+    # Validasi nama (tidak boleh hanya angka)
+    if nama.isdigit():
+        return ("nama", "Format Nama Salah", "Nama tidak boleh hanya berupa angka!")
+
+    # Validasi format email
+    if not validate_email(record.get("email", "")):
+        return ("email", "Error", "Format email tidak valid!")
+
+    # Validasi format telepon
+    if not validate_telp(record.get("telepon", "")):
+        return ("telepon", "Error", "Format telepon tidak valid! Gunakan format Indonesia (misal: 08123456789 atau +628123456789).")
+
+    # Validasi format tanggal lahir
+    if not validate_birth(record.get("tanggal_lahir", "")):
+        return ("tanggal_lahir", "Error", "Format tanggal lahir tidak valid! Gunakan format DD/MM/YYYY.")
+
+    return None
+
+
+def kesalahan_field(record):
+    """Validasi setiap field secara terpisah (untuk tampilan grid)
+
+    Mengembalikan dict {field: pesan} untuk semua field yang salah, dengan aturan
+    yang sama seperti validasi_record.
+    """
+    kesalahan = {}
+    nama = record.get("nama", "")
+    nim = record.get("nim", "")
+
+    for field in ("nama", "nim", "jurusan"):
+        if not record.get(field, ""):
+            kesalahan[field] = "Field harus diisi!"
+
+    if nim and (not nim.isdigit() or len(nim) < 8):
+        kesalahan["nim"] = "NIM harus berupa angka minimal 8 digit!"
+    if nama and nama.isdigit():
+        kesalahan["nama"] = "Nama tidak boleh hanya berupa angka!"
+    if not validate_email(record.get("email", "")):
+        kesalahan["email"] = "Format email tidak valid!"
+    if not validate_telp(record.get("telepon", "")):
+        kesalahan["telepon"] = "Format telepon tidak valid!"
+    if not validate_birth(record.get("tanggal_lahir", "")):
+        kesalahan["tanggal_lahir"] = "Format tanggal lahir tidak valid! Gunakan format DD/MM/YYYY."
+
+    return kesalahan